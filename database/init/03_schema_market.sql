@@ -14,6 +14,8 @@
 CREATE TABLE IF NOT EXISTS market_quotes (
     time            TIMESTAMPTZ NOT NULL,
     asset_id        INTEGER NOT NULL REFERENCES assets(id),
+    -- Candle resolution (e.g., '1m', '1h', '1d'). Quoted: INTERVAL is an SQL keyword.
+    "interval"      VARCHAR(10) NOT NULL,
     open            DOUBLE PRECISION NOT NULL,
     high            DOUBLE PRECISION NOT NULL,
     low             DOUBLE PRECISION NOT NULL,
@@ -23,16 +25,19 @@ CREATE TABLE IF NOT EXISTS market_quotes (
     -- Optional: VWAP or adjusted close can be added here
     created_at      TIMESTAMPTZ DEFAULT NOW(),
 
-    -- Composite primary key (time + asset) is standard for TimescaleDB
-    PRIMARY KEY (time, asset_id)
+    -- Composite primary key (time + asset + resolution): several resolutions
+    -- of one asset can be stored side by side without overwriting each other.
+    PRIMARY KEY (time, asset_id, "interval")
 );
 
 -- Convert standard table to TimescaleDB Hypertable.
 -- Partitioning by 'time' allows efficient querying and data retention management.
 SELECT create_hypertable('market_quotes', 'time', if_not_exists => TRUE);
 
--- Create index for faster queries by asset
-CREATE INDEX idx_market_quotes_asset ON market_quotes (asset_id, time DESC);
+-- Create index for faster queries by asset and resolution.
+-- Leading with (asset_id, interval) keeps the entries of one resolution
+-- contiguous, so a 1d query never walks 1m index entries.
+CREATE INDEX idx_market_quotes_asset ON market_quotes (asset_id, "interval", time DESC);
 
 -- ==========================================
 -- 2. Financial Statements (Fundamental Data)
@@ -0,0 +1,70 @@
+-- -----------------------------------------------------------------------------
+-- File: 05_continuous_aggregates.sql
+-- Purpose: Pre-aggregated OHLCV rollups (TimescaleDB continuous aggregates).
+--          Hourly/daily queries read these views instead of scanning minute rows.
+--          Safe to re-run on an existing database (psql -f ...).
+-- Author: QuantLake-Core Team
+-- -----------------------------------------------------------------------------
+
+-- ==========================================
+-- 5. OHLCV Continuous Aggregates
+-- ==========================================
+
+-- Hourly candles built from the raw 1m quotes (other stored resolutions are
+-- ignored). 'candles' counts the source rows per bucket (completeness check).
+CREATE MATERIALIZED VIEW IF NOT EXISTS market_quotes_1h
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 hour', time) AS time,
+    asset_id,
+    first(open, time)   AS open,
+    max(high)           AS high,
+    min(low)            AS low,
+    last(close, time)   AS close,
+    sum(volume)         AS volume,
+    count(*)            AS candles
+FROM market_quotes
+WHERE "interval" = '1m'
+GROUP BY 1, 2
+WITH NO DATA;
+
+-- Daily candles built hierarchically on top of the hourly aggregate
+-- (re-aggregates 24 rows per asset/day instead of 1,440 minute rows).
+CREATE MATERIALIZED VIEW IF NOT EXISTS market_quotes_1d
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket(INTERVAL '1 day', time) AS time,
+    asset_id,
+    first(open, time)   AS open,
+    max(high)           AS high,
+    min(low)            AS low,
+    last(close, time)   AS close,
+    sum(volume)         AS volume,
+    sum(candles)        AS candles
+FROM market_quotes_1h
+GROUP BY 1, 2
+WITH NO DATA;
+
+CREATE INDEX IF NOT EXISTS idx_market_quotes_1h_asset ON market_quotes_1h (asset_id, time DESC);
+CREATE INDEX IF NOT EXISTS idx_market_quotes_1d_asset ON market_quotes_1d (asset_id, time DESC);
+
+-- Refresh Policies
+-- Recent buckets are re-materialized on a schedule, picking up late corrections
+-- (upserts) inside `start_offset`. Buckets newer than `end_offset` are computed
+-- on the fly (real-time aggregation, materialized_only = false).
+--
+-- Backfills OLDER than `start_offset` are not covered by the policy; refresh
+-- them explicitly once loaded, e.g.:
+--   CALL refresh_continuous_aggregate('market_quotes_1h', '2020-01-01', '2021-01-01');
+--   CALL refresh_continuous_aggregate('market_quotes_1d', '2020-01-01', '2021-01-01');
+SELECT add_continuous_aggregate_policy('market_quotes_1h',
+    start_offset      => INTERVAL '3 days',
+    end_offset        => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '15 minutes',
+    if_not_exists     => TRUE);
+
+SELECT add_continuous_aggregate_policy('market_quotes_1d',
+    start_offset      => INTERVAL '7 days',
+    end_offset        => INTERVAL '1 day',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists     => TRUE);
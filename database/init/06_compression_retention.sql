@@ -0,0 +1,102 @@
+-- -----------------------------------------------------------------------------
+-- File: 06_compression_retention.sql
+-- Purpose: Chunk sizing, native compression and (optional) retention policies
+--          for the time-series hypertables.
+-- Author: QuantLake-Core Team
+--
+-- Configuration:
+--   Every setting is a psql variable with a default, so it can be overridden
+--   without editing this file. To apply it to an existing database (before
+--   any chunk has been compressed), e.g.:
+--     psql -v market_quotes_chunk='12 hours' -v market_quotes_retention='2 years' \
+--          -f database/init/06_compression_retention.sql
+--   Chunk intervals only apply to chunks created afterwards.
+-- -----------------------------------------------------------------------------
+
+-- ==========================================
+-- 6.1 Settings (psql variables with defaults)
+-- ==========================================
+
+-- Chunk intervals: aim for chunks whose indexes fit in memory.
+-- 1m candles for ~500 pairs are ~720k rows/day.
+\if :{?market_quotes_chunk}
+\else
+    \set market_quotes_chunk '1 day'
+\endif
+\if :{?market_sentiment_chunk}
+\else
+    \set market_sentiment_chunk '7 days'
+\endif
+\if :{?macro_indicators_chunk}
+\else
+    \set macro_indicators_chunk '365 days'
+\endif
+
+-- Age after which chunks are compressed (must exceed the window that still
+-- receives regular upserts, e.g. the continuous aggregate refresh window).
+\if :{?market_quotes_compress_after}
+\else
+    \set market_quotes_compress_after '7 days'
+\endif
+\if :{?market_sentiment_compress_after}
+\else
+    \set market_sentiment_compress_after '30 days'
+\endif
+\if :{?macro_indicators_compress_after}
+\else
+    \set macro_indicators_compress_after '730 days'
+\endif
+
+-- ==========================================
+-- 6.2 Chunk Intervals
+-- ==========================================
+
+SELECT set_chunk_time_interval('market_quotes', :'market_quotes_chunk'::INTERVAL);
+SELECT set_chunk_time_interval('market_sentiment', :'market_sentiment_chunk'::INTERVAL);
+SELECT set_chunk_time_interval('macro_indicators', :'macro_indicators_chunk'::INTERVAL);
+
+-- ==========================================
+-- 6.3 Native Compression
+-- ==========================================
+
+-- Segmenting by the series key stores each asset's rows contiguously, so a
+-- range scan for one asset only decompresses that asset's segments.
+-- All primary key columns are part of segmentby/orderby (required for
+-- upserts into compressed chunks).
+ALTER TABLE market_quotes SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'asset_id, "interval"',
+    timescaledb.compress_orderby = 'time DESC'
+);
+
+ALTER TABLE market_sentiment SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'asset_id',
+    timescaledb.compress_orderby = 'time DESC, source'
+);
+
+-- Macro data has no asset dimension; its series key is (country, indicator).
+ALTER TABLE macro_indicators SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'country, indicator',
+    timescaledb.compress_orderby = 'time DESC'
+);
+
+SELECT add_compression_policy('market_quotes', :'market_quotes_compress_after'::INTERVAL, if_not_exists => TRUE);
+SELECT add_compression_policy('market_sentiment', :'market_sentiment_compress_after'::INTERVAL, if_not_exists => TRUE);
+SELECT add_compression_policy('macro_indicators', :'macro_indicators_compress_after'::INTERVAL, if_not_exists => TRUE);
+
+-- ==========================================
+-- 6.4 Retention (opt-in)
+-- ==========================================
+
+-- Raw data is kept forever unless a retention period is given. Dropping old
+-- raw chunks does NOT drop already-materialized continuous aggregate rows
+-- (market_quotes_1h/1d), as long as the retention period exceeds their refresh
+-- window.
+\if :{?market_quotes_retention}
+    SELECT add_retention_policy('market_quotes', :'market_quotes_retention'::INTERVAL, if_not_exists => TRUE);
+\endif
+\if :{?market_sentiment_retention}
+    SELECT add_retention_policy('market_sentiment', :'market_sentiment_retention'::INTERVAL, if_not_exists => TRUE);
+\endif
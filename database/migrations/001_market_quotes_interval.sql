@@ -0,0 +1,71 @@
+-- -----------------------------------------------------------------------------
+-- File: 001_market_quotes_interval.sql
+-- Purpose: Migrate an EXISTING database to interval-aware 'market_quotes'
+--          (adds the "interval" key column). Fresh databases get the new
+--          schema from database/init/ and do not need this script.
+-- Author: QuantLake-Core Team
+--
+-- Usage (run from the repository root):
+--   psql -v existing_interval='1m' -f database/migrations/001_market_quotes_interval.sql
+--
+--   All existing rows are tagged with `existing_interval` (default '1m'). If
+--   some assets were loaded at another resolution, re-tag them afterwards, e.g.:
+--     UPDATE market_quotes SET "interval" = '1d'
+--     WHERE asset_id IN (SELECT id FROM assets WHERE exchange <> 'BINANCE');
+-- -----------------------------------------------------------------------------
+
+\set ON_ERROR_STOP on
+
+\if :{?existing_interval}
+\else
+    \set existing_interval '1m'
+\endif
+
+BEGIN;
+
+-- 1. The continuous aggregates depend on 'market_quotes'; they are recreated
+--    (with the new resolution filter) at the end of this script.
+DROP MATERIALIZED VIEW IF EXISTS market_quotes_1d;
+DROP MATERIALIZED VIEW IF EXISTS market_quotes_1h;
+
+-- 2. Primary keys and compression settings cannot change while chunks are
+--    compressed: decompress everything and remove the compression setup.
+SELECT decompress_chunk(c, if_compressed => TRUE) FROM show_chunks('market_quotes') c;
+SELECT remove_compression_policy('market_quotes', if_exists => TRUE);
+ALTER TABLE market_quotes SET (timescaledb.compress = false);
+
+-- 3. Add the resolution column (existing rows are tagged, new rows must set it).
+ALTER TABLE market_quotes
+    ADD COLUMN IF NOT EXISTS "interval" VARCHAR(10) NOT NULL DEFAULT :'existing_interval';
+ALTER TABLE market_quotes ALTER COLUMN "interval" DROP DEFAULT;
+
+-- 4. Re-key and re-index by (asset, resolution).
+ALTER TABLE market_quotes DROP CONSTRAINT IF EXISTS market_quotes_pkey;
+ALTER TABLE market_quotes ADD PRIMARY KEY (time, asset_id, "interval");
+
+DROP INDEX IF EXISTS idx_market_quotes_asset;
+CREATE INDEX idx_market_quotes_asset ON market_quotes (asset_id, "interval", time DESC);
+
+COMMIT;
+
+-- 5. Recreate the continuous aggregates and re-apply compression (now also
+--    segmented by resolution, so a scan of one resolution never decompresses
+--    the others). Re-add a retention policy here if one was configured.
+\ir ../init/05_continuous_aggregates.sql
+
+\if :{?market_quotes_compress_after}
+\else
+    \set market_quotes_compress_after '7 days'
+\endif
+
+ALTER TABLE market_quotes SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'asset_id, "interval"',
+    timescaledb.compress_orderby = 'time DESC'
+);
+SELECT add_compression_policy('market_quotes', :'market_quotes_compress_after'::INTERVAL, if_not_exists => TRUE);
+
+-- 6. Re-materialize the full history of the recreated aggregates
+--    (hourly first: the daily aggregate is built on top of it).
+CALL refresh_continuous_aggregate('market_quotes_1h', NULL, NULL);
+CALL refresh_continuous_aggregate('market_quotes_1d', NULL, NULL);
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+OHLCV Reader Benchmark.
+
+This script compares the throughput (rows/sec) of the read paths for
+'market_quotes' against a live TimescaleDB instance:
+
+    1. ORM Path: select(MarketQuote) -> ORM objects -> DataFrame built from attributes.
+    2. SELECT Path: read_ohlcv() -> row tuples -> DataFrame (src/database/reader.py).
+    3. COPY Path: load_ohlcv() -> binary COPY -> NumPy columns -> DataFrame.
+    4. COPY Arrow: load_ohlcv_arrow() -> binary COPY -> NumPy columns -> pyarrow.Table.
+
+Safety Note:
+    All work happens inside a transaction that is ROLLED BACK at the end. Temporary
+    assets are created and filled with synthetic 1m candles (COPY loader), so no
+    existing data is touched. Reads are taken from the raw table at '1m'.
+
+Usage:
+    python scripts/benchmark_ohlcv_reader.py --assets 10 --rows-per-asset 1000000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, List
+
+import pandas as pd
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.timeframes import interval_to_timedelta  # noqa: E402
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.models import MarketQuote  # noqa: E402
+from src.database.bulk_loader import copy_upsert_market_quotes  # noqa: E402
+from src.database.reader import load_ohlcv, load_ohlcv_arrow, read_ohlcv  # noqa: E402
+
+from benchmark_market_loader import BENCH_INTERVAL, make_synthetic_ohlcv  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("benchmark_reader")
+
+BENCH_EXCHANGE = "__BENCH__"
+
+
+def orm_read(
+    session: Session, asset_ids: List[int], start: datetime, end: datetime
+) -> pd.DataFrame:
+    """
+    Reproduction of a typical ORM read: load mapped objects, then tabulate them.
+    """
+    quotes = session.execute(
+        select(MarketQuote)
+        .where(
+            MarketQuote.asset_id.in_(asset_ids),
+            MarketQuote.interval == BENCH_INTERVAL,
+            MarketQuote.time >= start,
+            MarketQuote.time < end,
+        )
+        .order_by(MarketQuote.asset_id, MarketQuote.time)
+    ).scalars()
+    return pd.DataFrame(
+        [
+            {
+                "asset_id": q.asset_id,
+                "time": q.time,
+                "open": q.open,
+                "high": q.high,
+                "low": q.low,
+                "close": q.close,
+                "volume": q.volume,
+            }
+            for q in quotes
+        ]
+    )
+
+
+def time_path(name: str, reader: Callable[[], Any]) -> float:
+    """
+    Run one reader and report rows/sec.
+
+    Returns:
+        float: Measured throughput in rows per second.
+    """
+    started = time.perf_counter()
+    result = reader()
+    elapsed = time.perf_counter() - started
+
+    count = len(result)
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    logger.info(f"{name:<10} {count:>12,} rows in {elapsed:8.2f}s -> {rate:>12,.0f} rows/sec")
+    return rate
+
+
+def run_benchmark(assets: int, rows_per_asset: int, skip_orm: bool) -> None:
+    """
+    Load synthetic candles and time every read path inside one rolled-back transaction.
+
+    Args:
+        assets (int): Number of temporary assets.
+        rows_per_asset (int): Synthetic 1m candles per asset.
+        skip_orm (bool): Skip the ORM path (slow and memory hungry at 10M rows).
+    """
+    frame = make_synthetic_ohlcv(rows_per_asset)
+    start = frame["time"].iloc[0].to_pydatetime()
+    end = frame["time"].iloc[-1].to_pydatetime() + interval_to_timedelta(BENCH_INTERVAL)
+
+    session = SessionLocal()
+    try:
+        symbols = [f"__BENCH_{i}__" for i in range(assets)]
+        asset_ids = []
+        for symbol in symbols:
+            # Temporary asset to satisfy the FK; discarded by the rollback below.
+            asset_id = session.execute(
+                text(
+                    "INSERT INTO assets (symbol, asset_class, exchange) "
+                    "VALUES (:symbol, 'CRYPTO', :exchange) RETURNING id"
+                ),
+                {"symbol": symbol, "exchange": BENCH_EXCHANGE},
+            ).scalar_one()
+            copy_upsert_market_quotes(session, asset_id, frame, BENCH_INTERVAL)
+            asset_ids.append(asset_id)
+
+        logger.info(f"Loaded {assets * rows_per_asset:,} synthetic rows. Reading...")
+        session.execute(text("ANALYZE market_quotes"))
+
+        copy_rate = time_path(
+            "COPY",
+            lambda: load_ohlcv(
+                symbols, start, end, BENCH_INTERVAL, BENCH_EXCHANGE, session=session
+            ),
+        )
+        time_path(
+            "COPY ARROW",
+            lambda: load_ohlcv_arrow(
+                symbols, start, end, BENCH_INTERVAL, BENCH_EXCHANGE, session=session
+            ),
+        )
+        select_rate = time_path(
+            "SELECT",
+            lambda: read_ohlcv(session, asset_ids, BENCH_INTERVAL, start, end),
+        )
+        logger.info(f"Speedup (COPY vs SELECT): {copy_rate / select_rate:.1f}x")
+
+        if not skip_orm:
+            orm_rate = time_path("ORM", lambda: orm_read(session, asset_ids, start, end))
+            logger.info(f"Speedup (COPY vs ORM): {copy_rate / orm_rate:.1f}x")
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark market_quotes read paths")
+    parser.add_argument(
+        "--assets",
+        type=int,
+        default=10,
+        help="Number of temporary assets (default: 10).",
+    )
+    parser.add_argument(
+        "--rows-per-asset",
+        type=int,
+        default=1_000_000,
+        help="Synthetic 1m candles per asset (default: 1,000,000 -> 10M rows total).",
+    )
+    parser.add_argument(
+        "--skip-orm",
+        action="store_true",
+        help="Skip the ORM path (materializes one Python object per row).",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.assets, args.rows_per_asset, args.skip_orm)
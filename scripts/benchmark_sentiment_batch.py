@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Sentiment Batch Inference Benchmark.
+
+This script compares the throughput (headlines/sec) of the scoring paths of
+SentimentAnalyzer:
+
+    1. Single Path: analyze() -> one /api/generate request per headline.
+    2. Batch Path: analyze_batch() -> one request per --batch-size headlines,
+       sent one at a time.
+    3. Parallel Path: analyze_batch() with --workers batch requests in flight
+       (match the server's OLLAMA_NUM_PARALLEL).
+
+By default it runs against a local FAKE Ollama server that models inference
+cost as a fixed per-request overhead (prompt evaluation incl. the system
+prompt, --request-ms) plus a per-headline generation cost (--item-ms), and
+serves up to --workers requests concurrently, so the client/protocol side can
+be measured without a GPU. Pass --base-url to benchmark a real Ollama instance
+instead.
+
+Usage:
+    python scripts/benchmark_sentiment_batch.py --headlines 500 --batch-size 20 \\
+        --workers 4
+    python scripts/benchmark_sentiment_batch.py --base-url http://localhost:11434 \\
+        --headlines 100
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ai_analysis.llm_client import OllamaClient  # noqa: E402
+from src.ai_analysis.sentiment_engine import (  # noqa: E402
+    SentimentAnalyzer,
+    SentimentResult,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("benchmark_sentiment")
+
+# Numbered batch items as rendered by SentimentAnalyzer._score_batch().
+_ITEM_PATTERN = re.compile(r"^(\d+)\. \"", re.MULTILINE)
+
+
+def make_fake_ollama(
+    request_ms: float, item_ms: float, slots: int
+) -> ThreadingHTTPServer:
+    """
+    Build a fake Ollama server answering /api/generate after a simulated delay.
+
+    Args:
+        request_ms (float): Fixed cost per request (prompt evaluation).
+        item_ms (float): Cost per scored headline (generation).
+        slots (int): Requests processed at once (OLLAMA_NUM_PARALLEL); the
+            rest wait in line.
+
+    Returns:
+        ThreadingHTTPServer: Server bound to an ephemeral localhost port.
+    """
+    busy = threading.Semaphore(slots)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802 (http.server API)
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            ids = [int(i) for i in _ITEM_PATTERN.findall(payload["prompt"])]
+            scores = {"sentiment_score": 0.1, "impact_score": 0.5, "confidence": 0.9}
+
+            with busy:
+                time.sleep((request_ms + item_ms * max(len(ids), 1)) / 1000)
+            if ids:
+                answer = {"results": [dict(scores, id=i) for i in ids]}
+            else:
+                answer = scores
+
+            body = json.dumps({"response": json.dumps(answer)}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+
+def time_path(
+    name: str,
+    scorer: Callable[[List[str]], List[Optional[SentimentResult]]],
+    headlines: List[str],
+) -> float:
+    """
+    Score all headlines with one path and report headlines/sec.
+
+    Returns:
+        float: Measured throughput in headlines per second.
+    """
+    started = time.perf_counter()
+    results = scorer(headlines)
+    elapsed = time.perf_counter() - started
+
+    scored = sum(result is not None for result in results)
+    rate = len(headlines) / elapsed if elapsed > 0 else float("inf")
+    logger.info(
+        f"{name:<9} {scored:>6,}/{len(headlines):,} scored in {elapsed:8.2f}s "
+        f"-> {rate:>10,.1f} headlines/sec"
+    )
+    return rate
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark single vs batched sentiment scoring"
+    )
+    parser.add_argument(
+        "--headlines", type=int, default=500, help="Number of headlines."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=20, help="Headlines per batch request."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent batch requests for the PARALLEL path.",
+    )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        help="Benchmark a real Ollama server instead of the built-in fake.",
+    )
+    parser.add_argument(
+        "--request-ms",
+        type=float,
+        default=150.0,
+        help="Fake server: fixed cost per request in ms (prompt evaluation).",
+    )
+    parser.add_argument(
+        "--item-ms",
+        type=float,
+        default=25.0,
+        help="Fake server: cost per headline in ms (generation).",
+    )
+    args = parser.parse_args()
+
+    server: Optional[ThreadingHTTPServer] = None
+    base_url = args.base_url
+    if base_url is None:
+        server = make_fake_ollama(args.request_ms, args.item_ms, args.workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        logger.info(
+            f"Fake Ollama at {base_url} ({args.request_ms:.0f}ms/request + "
+            f"{args.item_ms:.0f}ms/headline, {args.workers} slots)."
+        )
+
+    client = OllamaClient(base_url=base_url, max_connections=args.workers)
+    analyzer = SentimentAnalyzer(client=client, max_workers=1)
+    parallel = SentimentAnalyzer(client=client, max_workers=args.workers)
+    texts = [
+        f"Headline {i}: Asset {i % 17} moves on macro news"
+        for i in range(args.headlines)
+    ]
+
+    try:
+        single_rate = time_path(
+            "SINGLE", lambda items: [analyzer.analyze(text) for text in items], texts
+        )
+        batch_rate = time_path(
+            "BATCH", lambda items: analyzer.analyze_batch(items, args.batch_size), texts
+        )
+        parallel_rate = time_path(
+            "PARALLEL",
+            lambda items: parallel.analyze_batch(items, args.batch_size),
+            texts,
+        )
+        logger.info(f"Speedup (BATCH vs SINGLE): {batch_rate / single_rate:.1f}x")
+        logger.info(
+            f"Speedup (PARALLEL vs BATCH): {parallel_rate / batch_rate:.1f}x"
+        )
+    finally:
+        parallel.pool.close()
+        client.close()
+        if server is not None:
+            server.shutdown()
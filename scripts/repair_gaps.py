@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Market Data Gap Repair Script.
+
+This script scans 'market_quotes' for missing candles and re-fetches ONLY the
+missing ranges from the original data source, instead of re-running a wide
+backfill. Neighbouring gaps are batched into the fewest paginated requests.
+
+Workflow:
+    1. Scan: Per asset, find missing candle ranges with SQL (lag window).
+    2. Plan: Merge gaps into minimal fetch ranges (src/database/gaps.py).
+    3. Repair: Fetch each range via BinanceFetcher / YahooFinanceFetcher and upsert it.
+
+Usage:
+    1. Report gaps in the last 30 days without fetching anything:
+       python scripts/repair_gaps.py --source binance --days 30 --dry-run
+
+    2. Repair specific symbols over a period:
+       python scripts/repair_gaps.py --source binance --symbols BTC/USDT --interval 1m \\
+           --start-date 2024-01-01 --end-date 2024-06-30
+
+    3. Repair stock data, ignoring holes shorter than 3 days (weekends/holidays):
+       python scripts/repair_gaps.py --source yahoo --interval 1d --min-gap 3
+"""
+
+import argparse
+import logging
+import sys
+import os
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional
+import yaml
+
+from sqlalchemy.orm import Session
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+# Add the project root to sys.path to allow imports from 'src'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.core.timeframes import interval_to_timedelta  # noqa: E402
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.models import Asset  # noqa: E402
+from src.database.bulk_loader import copy_upsert_market_quotes  # noqa: E402
+from src.database.gaps import count_candles, merge_gaps, scan_gaps  # noqa: E402
+from src.data_ingestion.base import BaseDataFetcher  # noqa: E402
+
+
+# ------------------------------------------------------------------------------
+# Logging Configuration
+# ------------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("gap_repair")
+
+# Source name -> (config section, exchange filter for asset lookup)
+SOURCES: Dict[str, Dict[str, Optional[str]]] = {
+    "binance": {"config": "crypto", "exchange": "BINANCE"},
+    "yahoo": {"config": "yahoo", "exchange": None},
+}
+
+
+def load_etl_config(config_path: str = "configs/etl_config.yaml") -> Dict[str, Any]:
+    """
+    Load ETL configuration from a YAML file.
+
+    Args:
+        config_path (str): Relative path to the config file.
+
+    Returns:
+        Dict[str, Any]: The configuration dictionary.
+    """
+    try:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        full_path = os.path.join(base_path, config_path)
+
+        with open(full_path, "r") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"Failed to load config file: {e}")
+        return {}
+
+
+def build_fetcher(source: str) -> BaseDataFetcher:
+    """
+    Create the fetcher for a source (imported lazily so each source's client
+    library is only required when that source is used).
+
+    Args:
+        source (str): 'binance' or 'yahoo'.
+
+    Returns:
+        BaseDataFetcher: The data fetcher.
+    """
+    if source == "binance":
+        from src.data_ingestion.binance.binance_fetcher import BinanceFetcher
+
+        return BinanceFetcher()
+
+    from src.data_ingestion.yahoo.yfinance_fetcher import YahooFinanceFetcher
+
+    return YahooFinanceFetcher()
+
+
+def get_asset(session: Session, symbol: str, exchange: Optional[str]) -> Optional[Asset]:
+    """
+    Retrieve an asset by symbol (and exchange, when the source defines one).
+
+    Args:
+        session (Session): The database session.
+        symbol (str): The asset symbol.
+        exchange (Optional[str]): Exchange filter (e.g., 'BINANCE').
+
+    Returns:
+        Optional[Asset]: The SQLAlchemy Asset object if found, otherwise None.
+    """
+    query = session.query(Asset).filter(Asset.symbol == symbol)
+    if exchange:
+        query = query.filter(Asset.exchange == exchange)
+    return query.one_or_none()
+
+
+def repair_symbol(
+    session: Session,
+    fetcher: Optional[BaseDataFetcher],
+    asset_id: int,
+    symbol: str,
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    min_gap: int = 1,
+) -> int:
+    """
+    Scan one asset for gaps and re-fetch the missing ranges.
+
+    Args:
+        session (Session): The database session.
+        fetcher (Optional[BaseDataFetcher]): Data source. None = dry run (scan only).
+        asset_id (int): The foreign key ID of the asset.
+        symbol (str): The asset symbol.
+        interval (str): Timeframe interval the asset is stored at.
+        start_date (datetime): Start of the scanned range (UTC).
+        end_date (datetime): End of the scanned range (UTC).
+        min_gap (int): Ignore gaps shorter than this many candles.
+
+    Returns:
+        int: Number of records loaded.
+    """
+    step = interval_to_timedelta(interval)
+
+    gaps = scan_gaps(session, asset_id, interval, start_date, end_date, min_candles=min_gap)
+    if not gaps:
+        logger.info(f"{symbol}: no gaps found.")
+        return 0
+
+    missing = sum(count_candles(g, step) for g in gaps)
+    ranges = merge_gaps(gaps, step)
+    logger.info(
+        f"{symbol}: {len(gaps)} gaps ({missing:,} candles) -> {len(ranges)} fetch ranges."
+    )
+    for gap_start, gap_end in gaps:
+        logger.info(f"  missing {gap_start} .. {gap_end}")
+
+    if fetcher is None:
+        return 0
+
+    loaded = 0
+    for range_start, range_end in ranges:
+        df = fetcher.fetch_ohlcv(
+            symbol=symbol,
+            interval=interval,
+            start_date=range_start,
+            # One extra candle: some sources treat the end bound as exclusive.
+            end_date=range_end + step,
+        )
+        if df.empty:
+            logger.warning(f"{symbol}: source returned no data for {range_start} .. {range_end}.")
+            continue
+
+        df = df[(df["time"] >= range_start) & (df["time"] <= range_end)]
+        loaded += copy_upsert_market_quotes(session, asset_id, df, interval)
+        session.commit()
+
+    logger.info(f"{symbol}: repaired {loaded:,} records.")
+    return loaded
+
+
+def run_repair(
+    source: str,
+    symbols: List[str],
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    min_gap: int = 1,
+    dry_run: bool = False,
+) -> None:
+    """
+    Execute the gap repair for the specified parameters.
+
+    Args:
+        source (str): 'binance' or 'yahoo'.
+        symbols (List[str]): List of symbols.
+        interval (str): Timeframe interval.
+        start_date (datetime): Start datetime (UTC).
+        end_date (datetime): End datetime (UTC).
+        min_gap (int): Ignore gaps shorter than this many candles.
+        dry_run (bool): If True, only report gaps (no API calls, no writes).
+    """
+    if interval.endswith(("M", "mo")):
+        raise ValueError(f"Gap detection requires a fixed candle spacing; got '{interval}'.")
+
+    logger.info(
+        f"Starting Gap Repair ({source}) for {len(symbols)} symbols. "
+        f"Interval: {interval}. Range: {start_date} to {end_date}. Dry run: {dry_run}"
+    )
+
+    fetcher = None if dry_run else build_fetcher(source)
+    exchange = SOURCES[source]["exchange"]
+
+    session = SessionLocal()
+    try:
+        for symbol in symbols:
+            try:
+                asset = get_asset(session, symbol, exchange)
+                if not asset:
+                    logger.error(f"Asset '{symbol}' NOT FOUND in database. Skipping.")
+                    continue
+
+                repair_symbol(
+                    session, fetcher, asset.id, symbol, interval, start_date, end_date, min_gap
+                )
+
+            except Exception as e:
+                logger.error(f"Error repairing {symbol}: {str(e)}")
+                session.rollback()
+                continue
+
+    finally:
+        session.close()
+        logger.info("Gap Repair Completed.")
+
+
+def parse_date_arg(date_str: str) -> datetime:
+    """
+    Parse CLI date argument into UTC datetime.
+    """
+    try:
+        dt = datetime.strptime(date_str, "%Y-%m-%d")
+        return dt.replace(tzinfo=timezone.utc)
+    except ValueError:
+        msg = f"Not a valid date: '{date_str}'. Expected format: YYYY-MM-DD."
+        raise argparse.ArgumentTypeError(msg)
+
+
+if __name__ == "__main__":
+    # 1. Setup CLI Argument Parser
+    parser = argparse.ArgumentParser(description="Detect and repair gaps in market_quotes")
+
+    parser.add_argument(
+        "--source",
+        choices=sorted(SOURCES),
+        required=True,
+        help="Data source to repair from.",
+    )
+    parser.add_argument(
+        "--symbols",
+        nargs="+",
+        help="List of symbols to scan (defaults to the source's configured symbols).",
+    )
+    parser.add_argument(
+        "--interval",
+        type=str,
+        help="Timeframe interval the data is stored at (defaults to config).",
+    )
+
+    # Date Range Arguments
+    parser.add_argument(
+        "--start-date",
+        type=parse_date_arg,
+        help="Start date (YYYY-MM-DD) of the scanned range. Overrides --days.",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=parse_date_arg,
+        help="End date (YYYY-MM-DD). Defaults to NOW if not specified.",
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=30,
+        help="Number of lookback days to scan (only used if --start-date is NOT provided).",
+    )
+
+    # Repair Behaviour
+    parser.add_argument(
+        "--min-gap",
+        type=int,
+        default=1,
+        help="Ignore gaps shorter than this many candles (e.g. market closures).",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report gaps; do not fetch or write anything.",
+    )
+
+    args = parser.parse_args()
+
+    # 2. Resolve Defaults from Config
+    source_config = load_etl_config().get(SOURCES[args.source]["config"] or "", {})
+    symbols = args.symbols or source_config.get("symbols", [])
+    interval = args.interval or source_config.get("intervals", ["1d"])[0]
+
+    # 3. Determine Time Range
+    now_utc = datetime.now(timezone.utc)
+
+    if args.start_date:
+        start_date = args.start_date
+        end_date = args.end_date if args.end_date else now_utc
+    else:
+        end_date = now_utc
+        start_date = end_date - timedelta(days=args.days)
+
+    # 4. Execute
+    run_repair(
+        source=args.source,
+        symbols=symbols,
+        interval=interval,
+        start_date=start_date,
+        end_date=end_date,
+        min_gap=args.min_gap,
+        dry_run=args.dry_run,
+    )
@@ -19,18 +19,41 @@ Usage:
 
     3. Backfill Specific Period:
        python scripts/run_crypto_etl.py --start-date 2025-01-01 --end-date 2025-01-31
+
+    4. Large Backfill (Streaming, committed every 100k rows):
+       python scripts/run_crypto_etl.py --start-date 2020-01-01 --stream --chunk-rows 100000
+
+    5. Parallel Backfill (8 concurrent range shards, within the Binance weight budget):
+       python scripts/run_crypto_etl.py --start-date 2020-01-01 --backfill-workers 8 --stream
+
+    6. Many Symbols Concurrently (8 symbols at a time):
+       python scripts/run_crypto_etl.py --symbols BTC/USDT ETH/USDT SOL/USDT --workers 8
+
+    7. Hundreds of Symbols from One Event Loop (ccxt.async_support):
+       python scripts/run_crypto_etl.py --async --concurrency 32
+
+    8. Scheduled Incremental Run (fetch only past each symbol's latest stored candle):
+       python scripts/run_crypto_etl.py --incremental --overlap 2
+
+    9. Derive Higher Timeframes from the fetched 1m candles (no extra API calls):
+       python scripts/run_crypto_etl.py --interval 1m --derive 5m 15m 1h 4h 1d
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from functools import partial
+from typing import List, Dict, Any, Callable, Optional, Sequence
 import yaml
 
 import pandas as pd
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 # ------------------------------------------------------------------------------
@@ -40,9 +63,17 @@ from sqlalchemy.orm import Session
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.core.config import settings  # noqa: E402
+from src.core.resample import align_start, check_derivable, derive_intervals  # noqa: E402
+from src.core.timeframes import interval_to_timedelta  # noqa: E402
 from src.database.connection import SessionLocal  # noqa: E402
-from src.database.models import Asset, MarketQuote  # noqa: E402
+from src.database.models import Asset  # noqa: E402
+from src.database.bulk_loader import (  # noqa: E402
+    copy_upsert_market_quotes,
+    stream_upsert_market_quotes,
+)
+from src.database.watermarks import incremental_start_dates  # noqa: E402
 from src.data_ingestion.binance.binance_fetcher import BinanceFetcher  # noqa: E402
+from src.data_ingestion.binance.async_binance_fetcher import AsyncBinanceFetcher  # noqa: E402
 
 
 # ------------------------------------------------------------------------------
@@ -100,15 +131,20 @@ def get_asset(session: Session, symbol: str) -> Optional[Asset]:
     )
 
 
-def save_market_data(session: Session, asset_id: int, df: pd.DataFrame) -> int:
+def save_market_data(
+    session: Session, asset_id: int, df: pd.DataFrame, interval: str
+) -> int:
     """
     Bulk upsert market data into the database.
-    Uses PostgreSQL 'ON CONFLICT DO UPDATE' to handle duplicate timestamps.
+
+    Streams the DataFrame via COPY into a staging table and merges it with a
+    single 'INSERT ... SELECT ... ON CONFLICT DO UPDATE' (see src/database/bulk_loader.py).
 
     Args:
         session (Session): The database session.
         asset_id (int): The foreign key ID of the asset.
         df (pd.DataFrame): The DataFrame containing OHLCV data.
+        interval (str): Candle resolution of the frame.
 
     Returns:
         int: Number of records processed.
@@ -116,40 +152,263 @@ def save_market_data(session: Session, asset_id: int, df: pd.DataFrame) -> int:
     if df.empty:
         return 0
 
-    # Convert DataFrame to list of dictionaries for bulk insertion
-    records: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        records.append(
-            {
-                "time": row["time"],
-                "asset_id": asset_id,
-                "open": row["open"],
-                "high": row["high"],
-                "low": row["low"],
-                "close": row["close"],
-                "volume": row["volume"],
-            }
+    count = copy_upsert_market_quotes(session, asset_id, df, interval)
+    session.commit()
+
+    return count
+
+
+@dataclass
+class SymbolResult:
+    """
+    Outcome of the ETL run for a single symbol (used for the final summary).
+    """
+    symbol: str
+    status: str  # 'OK', 'EMPTY', 'SKIPPED' or 'FAILED'
+    rows: int = 0
+    seconds: float = 0.0
+    message: str = ""
+
+
+def check_asset(asset: Optional[Asset], symbol: str) -> Optional[str]:
+    """
+    Validate that an asset is registered and active before loading data for it.
+
+    Args:
+        asset (Optional[Asset]): The asset looked up by symbol (None if not found).
+        symbol (str): The asset symbol (for logging).
+
+    Returns:
+        Optional[str]: The reason to skip the symbol, or None if it can be processed.
+    """
+    if not asset:
+        logger.error(
+            f"Asset '{symbol}' NOT FOUND in database. Skipping ETL."
+        )
+        logger.error(
+            "ACTION REQUIRED: Please register this asset in 'configs/assets.yaml' "
+            "and run 'python scripts/seed_assets.py' first."
         )
+        return "asset not registered"
 
-    # Prepare SQLAlchemy Upsert Statement
-    stmt = insert(MarketQuote).values(records)
-
-    # Define conflict resolution: Update values if (time, asset_id) already exists.
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["time", "asset_id"],
-        set_={
-            "open": stmt.excluded.open,
-            "high": stmt.excluded.high,
-            "low": stmt.excluded.low,
-            "close": stmt.excluded.close,
-            "volume": stmt.excluded.volume,
-        },
-    )
+    # Check if asset is active (Soft delete check)
+    if not asset.is_active:
+        logger.warning(f"Asset '{symbol}' is marked as inactive. Skipping.")
+        return "asset inactive"
 
-    session.execute(stmt)
-    session.commit()
+    return None
+
+
+def validate_derived_intervals(
+    interval: str, derived_intervals: Sequence[str], stream: bool = False
+) -> None:
+    """
+    Check that the requested derived intervals can be built from the fetched candles.
+
+    Args:
+        interval (str): Fetched (base) interval.
+        derived_intervals (Sequence[str]): Intervals to derive from the base candles.
+        stream (bool): Whether streaming mode is enabled.
+
+    Raises:
+        ValueError: If an interval cannot be derived, or streaming mode is enabled.
+    """
+    if not derived_intervals:
+        return
+
+    check_derivable(interval, derived_intervals)
 
-    return len(records)
+    if stream:
+        raise ValueError(
+            "Derived intervals are built from the full fetched frame and cannot be "
+            "combined with streaming mode."
+        )
+
+
+def load_derived(
+    save: Callable[[int, pd.DataFrame, str], int],
+    asset_id: int,
+    symbol: str,
+    interval: str,
+    df: pd.DataFrame,
+    derived_intervals: Sequence[str],
+) -> int:
+    """
+    Resample the fetched base candles into each derived interval and load them.
+
+    Args:
+        save (Callable[[int, pd.DataFrame, str], int]): Loader called as
+                                                        `save(asset_id, frame, interval)`.
+        asset_id (int): The foreign key ID of the asset.
+        symbol (str): The asset symbol (for logging).
+        interval (str): Interval of `df`.
+        df (pd.DataFrame): Fetched base candles.
+        derived_intervals (Sequence[str]): Intervals to derive.
+
+    Returns:
+        int: Number of derived records processed.
+    """
+    total = 0
+    for derived, frame in derive_intervals(df, interval, derived_intervals).items():
+        rows = save(asset_id, frame, derived)
+        logger.info(f"Derived {rows} {derived} candles for {symbol} from {interval}.")
+        total += rows
+    return total
+
+
+def process_symbol(
+    session: Session,
+    fetcher: BinanceFetcher,
+    symbol: str,
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    stream: bool = False,
+    chunk_rows: int = 50_000,
+    chunk_bytes: Optional[int] = None,
+    backfill_workers: int = 1,
+    derived_intervals: Sequence[str] = (),
+) -> SymbolResult:
+    """
+    Run Extract + Load for one symbol. Never raises; failures are reported in the result.
+
+    Args:
+        session (Session): The database session owned by the calling worker.
+        fetcher (BinanceFetcher): Shared fetcher (all workers draw from one rate limiter).
+        symbol (str): Trading pair to process.
+        interval (str): Timeframe interval.
+        start_date (datetime): Start datetime (UTC).
+        end_date (datetime): End datetime (UTC).
+        stream (bool): If True, load page by page with independent commits.
+        chunk_rows (int): Streaming mode flush threshold in rows.
+        chunk_bytes (Optional[int]): Streaming mode flush threshold in bytes.
+        backfill_workers (int): Number of concurrent range shards for this symbol.
+        derived_intervals (Sequence[str]): Higher timeframes resampled from the
+                                           fetched candles and loaded as well.
+
+    Returns:
+        SymbolResult: Status, row count and elapsed time for the symbol.
+    """
+    started = time.perf_counter()
+
+    def result(status: str, rows: int = 0, message: str = "") -> SymbolResult:
+        return SymbolResult(symbol, status, rows, time.perf_counter() - started, message)
+
+    try:
+        logger.info(f"Processing {symbol}...")
+
+        # Step A: Validate Asset Existence (Master Data Check)
+        asset = get_asset(session, symbol)
+
+        skip_reason = check_asset(asset, symbol)
+        if skip_reason or asset is None:
+            return result("SKIPPED", message=skip_reason or "")
+
+        # Streaming Mode: Extract + Load page by page (bounded memory)
+        if stream:
+            pages = fetcher.iter_ohlcv_parallel(
+                symbol=symbol,
+                interval=interval,
+                start_date=start_date,
+                end_date=end_date,
+                limit=1000,
+                max_workers=backfill_workers,
+            )
+            count = stream_upsert_market_quotes(
+                session,
+                asset.id,
+                pages,
+                interval,
+                chunk_rows=chunk_rows,
+                chunk_bytes=chunk_bytes,
+            )
+            if count == 0:
+                logger.warning(f"No data found for {symbol} in the specified range.")
+                return result("EMPTY")
+
+            logger.info(f"Successfully streamed {count} records for {symbol}.")
+            return result("OK", count)
+
+        # Step B: Extract (Fetch Data)
+        df = fetcher.fetch_ohlcv_parallel(
+            symbol=symbol,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date,
+            limit=1000,
+            max_workers=backfill_workers,
+        )
+
+        if df.empty:
+            logger.warning(f"No data found for {symbol} in the specified range.")
+            return result("EMPTY")
+
+        # Step C: Load (Save to DB)
+        count = save_market_data(session, asset.id, df, interval)
+        logger.info(f"Successfully saved {count} records for {symbol}.")
+
+        # Step D: Derive higher timeframes from the same frame (no extra API calls)
+        if derived_intervals:
+            count += load_derived(
+                partial(save_market_data, session), asset.id, symbol, interval, df,
+                derived_intervals,
+            )
+        return result("OK", count)
+
+    except Exception as e:
+        logger.error(f"Error processing {symbol}: {str(e)}")
+        # Reset the (possibly aborted) transaction so the session stays usable
+        # for the next symbol handled by this worker.
+        session.rollback()
+        return result("FAILED", message=str(e))
+
+
+def log_summary(results: List[SymbolResult]) -> None:
+    """
+    Log a per-symbol result table at the end of the job.
+
+    Args:
+        results (List[SymbolResult]): Results in input symbol order.
+    """
+    logger.info("-" * 72)
+    logger.info(f"{'SYMBOL':<16}{'STATUS':<10}{'ROWS':>12}{'SECONDS':>10}  MESSAGE")
+    for r in results:
+        logger.info(f"{r.symbol:<16}{r.status:<10}{r.rows:>12,}{r.seconds:>10.1f}  {r.message}")
+    logger.info("-" * 72)
+
+    failed = sum(1 for r in results if r.status == "FAILED")
+    total_rows = sum(r.rows for r in results)
+    logger.info(f"Symbols: {len(results)} | Failed: {failed} | Rows: {total_rows:,}")
+
+
+def resolve_start_dates(
+    symbols: List[str], interval: str, default_start: datetime, overlap: timedelta
+) -> Dict[str, datetime]:
+    """
+    Look up the incremental fetch start of each registered symbol.
+
+    Args:
+        symbols (List[str]): List of trading pairs.
+        interval (str): Resolution being ingested (its watermarks are used).
+        default_start (datetime): Start used for symbols with no stored data yet.
+        overlap (timedelta): History re-fetched before each watermark.
+
+    Returns:
+        Dict[str, datetime]: Fetch start per registered symbol (unregistered
+                             symbols are omitted and skipped later as usual).
+    """
+    session = SessionLocal()
+    try:
+        asset_ids: Dict[str, int] = {}
+        for symbol in symbols:
+            asset = get_asset(session, symbol)
+            if asset is not None:
+                asset_ids[symbol] = asset.id
+        return incremental_start_dates(
+            session, asset_ids, default_start, overlap, interval
+        )
+    finally:
+        session.close()
 
 
 def run_etl(
@@ -157,7 +416,16 @@ def run_etl(
     interval: str,
     start_date: datetime,
     end_date: datetime,
-) -> None:
+    stream: bool = False,
+    chunk_rows: int = 50_000,
+    chunk_bytes: Optional[int] = None,
+    backfill_workers: int = 1,
+    workers: int = 1,
+    incremental: bool = False,
+    overlap: timedelta = timedelta(0),
+    refresh_markets: bool = False,
+    derived_intervals: Sequence[str] = (),
+) -> List[SymbolResult]:
     """
     Execute the ETL pipeline for the specified parameters.
 
@@ -166,65 +434,227 @@ def run_etl(
         interval (str): Timeframe interval.
         start_date (datetime): Start datetime (UTC).
         end_date (datetime): End datetime (UTC).
+        stream (bool): If True, flush fetched pages to the DB in independently
+                       committed chunks instead of materializing the whole range.
+        chunk_rows (int): Streaming mode flush threshold in rows.
+        chunk_bytes (Optional[int]): Streaming mode flush threshold in bytes.
+        backfill_workers (int): Number of concurrent range shards per symbol
+                                (1 = sequential pagination).
+        workers (int): Number of symbols processed concurrently (1 = sequential).
+        incremental (bool): If True, each symbol starts from its latest stored candle
+                            (minus `overlap`); `start_date` only applies to symbols
+                            with no stored data yet.
+        overlap (timedelta): Incremental mode: history re-fetched before the watermark.
+        refresh_markets (bool): If True, bypass the on-disk market metadata cache.
+        derived_intervals (Sequence[str]): Higher timeframes resampled from the
+                                           fetched candles (fetch starts are moved
+                                           back to their bucket boundaries).
+
+    Returns:
+        List[SymbolResult]: Per-symbol results, in input order.
     """
+    validate_derived_intervals(interval, derived_intervals, stream)
+
     logger.info(
         f"Starting ETL Job for {len(symbols)} symbols. "
-        f"Interval: {interval}. Range: {start_date} to {end_date}"
+        f"Interval: {interval}. Range: {start_date} to {end_date}. Workers: {workers}"
     )
 
     # 1. Initialize Fetcher
-    fetcher = BinanceFetcher()
+    # A single fetcher is shared by all workers: its rate limiter enforces one
+    # Binance weight budget across every concurrent request.
+    fetcher = BinanceFetcher(refresh_markets=refresh_markets)
+
+    # Incremental Mode: resolve every symbol's start with one watermark query.
+    start_dates: Dict[str, datetime] = {}
+    if incremental:
+        start_dates = resolve_start_dates(symbols, interval, start_date, overlap)
+
+    task = partial(
+        process_symbol,
+        fetcher=fetcher,
+        interval=interval,
+        end_date=end_date,
+        stream=stream,
+        chunk_rows=chunk_rows,
+        chunk_bytes=chunk_bytes,
+        backfill_workers=backfill_workers,
+        derived_intervals=derived_intervals,
+    )
 
     # 2. Database Session Management
+    # Each worker thread owns one session (checked out from the engine's pool)
+    # and reuses it for every symbol it processes.
+    worker_state = threading.local()
+    sessions: List[Session] = []
+    sessions_lock = threading.Lock()
+
+    def worker_session() -> Session:
+        session: Optional[Session] = getattr(worker_state, "session", None)
+        if session is None:
+            session = SessionLocal()
+            worker_state.session = session
+            with sessions_lock:
+                sessions.append(session)
+        return session
+
+    def run_one(symbol: str) -> SymbolResult:
+        symbol_start = start_dates.get(symbol, start_date)
+        if derived_intervals:
+            symbol_start = align_start(symbol_start, derived_intervals, interval)
+        return task(worker_session(), symbol=symbol, start_date=symbol_start)
+
+    try:
+        if workers <= 1:
+            results = [run_one(symbol) for symbol in symbols]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="etl-worker"
+            ) as executor:
+                # executor.map preserves input order for the summary.
+                results = list(executor.map(run_one, symbols))
+    finally:
+        for session in sessions:
+            session.close()
+        logger.info("ETL Job Completed.")
+
+    log_summary(results)
+    return results
+
+
+def load_frame(asset_id: int, df: pd.DataFrame, interval: str) -> int:
+    """
+    Save one DataFrame using a short-lived pooled session (thread-safe entry point).
+
+    Args:
+        asset_id (int): The foreign key ID of the asset.
+        df (pd.DataFrame): The DataFrame containing OHLCV data.
+        interval (str): Candle resolution of the frame.
+
+    Returns:
+        int: Number of records processed.
+    """
     session = SessionLocal()
     try:
-        for symbol in symbols:
-            try:
-                logger.info(f"Processing {symbol}...")
+        return save_market_data(session, asset_id, df, interval)
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
-                # Step A: Validate Asset Existence (Master Data Check)
-                asset = get_asset(session, symbol)
 
-                if not asset:
-                    logger.error(
-                        f"Asset '{symbol}' NOT FOUND in database. Skipping ETL."
-                    )
-                    logger.error(
-                        "ACTION REQUIRED: Please register this asset in 'configs/assets.yaml' "
-                        "and run 'python scripts/seed_assets.py' first."
-                    )
-                    continue
-                
-                # Check if asset is active (Soft delete check)
-                if not asset.is_active:
-                    logger.warning(f"Asset '{symbol}' is marked as inactive. Skipping.")
-                    continue
-
-                # Step B: Extract (Fetch Data)
-                df = fetcher.fetch_ohlcv(
-                    symbol=symbol,
-                    interval=interval,
-                    start_date=start_date,
-                    end_date=end_date,
-                    limit=1000,
-                )
-
-                if df.empty:
-                    logger.warning(f"No data found for {symbol} in the specified range.")
-                    continue
-
-                # Step C: Load (Save to DB)
-                count = save_market_data(session, asset.id, df)
-                logger.info(f"Successfully saved {count} records for {symbol}.")
-
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {str(e)}")
-                # Continue to next symbol even if one fails
-                continue
+async def run_etl_async(
+    symbols: List[str],
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    concurrency: int = 16,
+    db_writers: int = 4,
+    incremental: bool = False,
+    overlap: timedelta = timedelta(0),
+    refresh_markets: bool = False,
+    derived_intervals: Sequence[str] = (),
+) -> List[SymbolResult]:
+    """
+    Execute the ETL pipeline from a single asyncio event loop.
+
+    Network I/O for all symbols is multiplexed over `AsyncBinanceFetcher`
+    (bounded by `concurrency` and the shared weight budget). Database loads are
+    blocking, so they run in worker threads, at most `db_writers` at a time.
+
+    Args:
+        symbols (List[str]): List of trading pairs.
+        interval (str): Timeframe interval.
+        start_date (datetime): Start datetime (UTC).
+        end_date (datetime): End datetime (UTC).
+        concurrency (int): Maximum number of HTTP requests in flight.
+        db_writers (int): Maximum number of concurrent database loads.
+        incremental (bool): If True, each symbol starts from its latest stored candle.
+        overlap (timedelta): Incremental mode: history re-fetched before the watermark.
+        refresh_markets (bool): If True, bypass the on-disk market metadata cache.
+        derived_intervals (Sequence[str]): Higher timeframes resampled from the
+                                           fetched candles.
 
+    Returns:
+        List[SymbolResult]: Per-symbol results, in input order.
+    """
+    validate_derived_intervals(interval, derived_intervals)
+
+    logger.info(
+        f"Starting Async ETL Job for {len(symbols)} symbols. "
+        f"Interval: {interval}. Range: {start_date} to {end_date}. Concurrency: {concurrency}"
+    )
+
+    # Step A: Resolve all assets up front with one session (Master Data Check)
+    session = SessionLocal()
+    try:
+        skip_reasons: Dict[str, Optional[str]] = {}
+        asset_ids: Dict[str, int] = {}
+        for symbol in symbols:
+            asset = get_asset(session, symbol)
+            skip_reasons[symbol] = check_asset(asset, symbol)
+            if asset is not None:
+                asset_ids[symbol] = asset.id
+
+        start_dates: Dict[str, datetime] = {}
+        if incremental:
+            start_dates = incremental_start_dates(
+                session, asset_ids, start_date, overlap, interval
+            )
     finally:
         session.close()
-        logger.info("ETL Job Completed.")
+
+    db_slots = asyncio.Semaphore(db_writers)
+
+    async def process(fetcher: AsyncBinanceFetcher, symbol: str) -> SymbolResult:
+        started = time.perf_counter()
+
+        def result(status: str, rows: int = 0, message: str = "") -> SymbolResult:
+            return SymbolResult(symbol, status, rows, time.perf_counter() - started, message)
+
+        reason = skip_reasons[symbol]
+        if reason:
+            return result("SKIPPED", message=reason)
+
+        try:
+            # Step B: Extract (non-blocking)
+            symbol_start = start_dates.get(symbol, start_date)
+            if derived_intervals:
+                symbol_start = align_start(symbol_start, derived_intervals, interval)
+            df = await fetcher.fetch_ohlcv(symbol, interval, symbol_start, end_date, 1000)
+            if df.empty:
+                logger.warning(f"No data found for {symbol} in the specified range.")
+                return result("EMPTY")
+
+            # Step C: Load (blocking -> worker thread)
+            async with db_slots:
+                count = await asyncio.to_thread(load_frame, asset_ids[symbol], df, interval)
+                if derived_intervals:
+                    count += await asyncio.to_thread(
+                        load_derived, load_frame, asset_ids[symbol], symbol, interval, df,
+                        derived_intervals,
+                    )
+
+            logger.info(f"Successfully saved {count} records for {symbol}.")
+            return result("OK", count)
+
+        except Exception as e:
+            logger.error(f"Error processing {symbol}: {str(e)}")
+            return result("FAILED", message=str(e))
+
+    try:
+        async with AsyncBinanceFetcher(
+            max_concurrency=concurrency, refresh_markets=refresh_markets
+        ) as fetcher:
+            results = list(
+                await asyncio.gather(*(process(fetcher, symbol) for symbol in symbols))
+            )
+    finally:
+        logger.info("Async ETL Job Completed.")
+
+    log_summary(results)
+    return results
 
 
 def parse_date_arg(date_str: str) -> datetime:
@@ -257,6 +687,11 @@ if __name__ == "__main__":
     default_symbols = crypto_config.get("symbols", ["BTC/USDT"])
     default_interval = crypto_config.get("intervals", ["1h"])[0]
     default_days = crypto_config.get("lookback_days", 1)
+    default_chunk_rows = crypto_config.get("chunk_rows", 50_000)
+    default_workers = crypto_config.get("workers", 1)
+    default_incremental = crypto_config.get("incremental", False)
+    default_overlap = crypto_config.get("overlap_candles", 0)
+    default_derived = crypto_config.get("derived_intervals", [])
 
     # 2. Setup CLI Argument Parser
     parser = argparse.ArgumentParser(description="Run Crypto ETL Pipeline")
@@ -292,8 +727,102 @@ if __name__ == "__main__":
         help="Number of lookback days (only used if --start-date is NOT provided).",
     )
 
+    # Streaming Arguments (Large Backfills)
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Flush fetched pages to the DB in chunks, committing each chunk independently.",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=default_chunk_rows,
+        help="Streaming mode: commit after this many rows.",
+    )
+    parser.add_argument(
+        "--chunk-mb",
+        type=float,
+        default=None,
+        help="Streaming mode: also commit once buffered pages exceed this many MB.",
+    )
+
+    # Parallel Backfill Argument
+    parser.add_argument(
+        "--backfill-workers",
+        type=int,
+        default=1,
+        help="Fetch each symbol's range as N concurrent shards (shares the Binance weight budget).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of symbols processed concurrently "
+        f"(each worker has its own DB session). Default: {default_workers}.",
+    )
+
+    # Async Mode Arguments
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run all symbols from one asyncio event loop (ccxt.async_support). "
+        "Cannot be combined with --stream, --workers or --backfill-workers.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Async mode: maximum number of HTTP requests in flight.",
+    )
+
+    # Incremental Mode Arguments (Scheduled Runs)
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=default_incremental,
+        help="Fetch from each symbol's latest stored candle instead of a fixed "
+        "lookback window (--no-incremental overrides an enabled config default).",
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        default=default_overlap,
+        help="Incremental mode: also re-fetch this many candles before the watermark.",
+    )
+
+    # Derived Timeframes
+    parser.add_argument(
+        "--derive",
+        nargs="+",
+        default=default_derived,
+        help="Higher timeframes resampled from the fetched candles (e.g. 5m 1h 1d).",
+    )
+
+    # Market Metadata Cache
+    parser.add_argument(
+        "--refresh-markets",
+        action="store_true",
+        help="Ignore the cached exchange market metadata and download it again.",
+    )
+
     args = parser.parse_args()
 
+    if args.use_async:
+        # The async path has its own concurrency model (--concurrency) and
+        # loads whole frames, so these options would be silently ignored.
+        conflicts = [
+            flag
+            for flag, used in (
+                ("--stream", args.stream),
+                ("--workers", args.workers is not None),
+                ("--backfill-workers", args.backfill_workers != 1),
+            )
+            if used
+        ]
+        if conflicts:
+            parser.error(f"--async cannot be combined with {', '.join(conflicts)}.")
+
     # 3. Determine Time Range Logic
     now_utc = datetime.now(timezone.utc)
 
@@ -307,10 +836,36 @@ if __name__ == "__main__":
         end_date = now_utc
         start_date = end_date - timedelta(days=args.days)
 
+    overlap = interval_to_timedelta(args.interval) * args.overlap
+
     # 4. Execute ETL
-    run_etl(
-        symbols=args.symbols,
-        interval=args.interval,
-        start_date=start_date,
-        end_date=end_date,
-    )
\ No newline at end of file
+    if args.use_async:
+        asyncio.run(
+            run_etl_async(
+                symbols=args.symbols,
+                interval=args.interval,
+                start_date=start_date,
+                end_date=end_date,
+                concurrency=args.concurrency,
+                incremental=args.incremental,
+                overlap=overlap,
+                refresh_markets=args.refresh_markets,
+                derived_intervals=args.derive,
+            )
+        )
+    else:
+        run_etl(
+            symbols=args.symbols,
+            interval=args.interval,
+            start_date=start_date,
+            end_date=end_date,
+            stream=args.stream,
+            chunk_rows=args.chunk_rows,
+            chunk_bytes=int(args.chunk_mb * 1024 * 1024) if args.chunk_mb else None,
+            backfill_workers=args.backfill_workers,
+            workers=default_workers if args.workers is None else args.workers,
+            incremental=args.incremental,
+            overlap=overlap,
+            refresh_markets=args.refresh_markets,
+            derived_intervals=args.derive,
+        )
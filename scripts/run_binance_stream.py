@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Crypto Live Stream Ingestion Script.
+
+This script keeps 'market_quotes' continuously up to date by subscribing to
+Binance kline WebSocket streams instead of polling the REST API. Closed candles
+are written in micro-batches (COPY upsert) every few seconds.
+
+Resilience:
+    - On start-up, each symbol resumes from its database watermark: the range
+      between the latest stored candle and "now" is backfilled via REST.
+    - Dropped connections are re-established with exponential backoff and the
+      outage is backfilled the same way.
+    - SIGINT/SIGTERM flush the buffered candles before exiting.
+
+Usage:
+    1. Stream every active BINANCE asset at the configured interval:
+       python scripts/run_binance_stream.py
+
+    2. Specific symbols, 1-minute candles, flushed every 2 seconds:
+       python scripts/run_binance_stream.py --symbols BTC/USDT ETH/USDT --interval 1m \\
+           --flush-seconds 2
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import sys
+import os
+from datetime import datetime
+from functools import partial
+from typing import List, Dict, Any, Optional
+import yaml
+
+import pandas as pd
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+# Add the project root to sys.path to allow imports from 'src'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.models import Asset  # noqa: E402
+from src.database.bulk_loader import copy_upsert_market_quotes  # noqa: E402
+from src.database.watermarks import get_watermarks  # noqa: E402
+from src.data_ingestion.binance.binance_fetcher import BinanceFetcher  # noqa: E402
+from src.data_ingestion.binance.kline_stream import KlineStreamIngestor  # noqa: E402
+
+
+# ------------------------------------------------------------------------------
+# Logging Configuration
+# ------------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("crypto_stream")
+
+
+def load_etl_config(config_path: str = "configs/etl_config.yaml") -> Dict[str, Any]:
+    """
+    Load ETL configuration from a YAML file.
+
+    Args:
+        config_path (str): Relative path to the config file.
+
+    Returns:
+        Dict[str, Any]: The configuration dictionary.
+    """
+    try:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        full_path = os.path.join(base_path, config_path)
+
+        with open(full_path, "r") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"Failed to load config file: {e}")
+        return {}
+
+
+def write_candles(asset_id: int, df: pd.DataFrame, interval: str) -> int:
+    """
+    Upsert one micro-batch using a short-lived pooled session (thread-safe sink).
+
+    Args:
+        asset_id (int): The foreign key ID of the asset.
+        df (pd.DataFrame): Closed candles with time/open/high/low/close/volume.
+        interval (str): Kline interval of the candles.
+
+    Returns:
+        int: Number of records processed.
+    """
+    session = SessionLocal()
+    try:
+        rows = copy_upsert_market_quotes(session, asset_id, df, interval)
+        session.commit()
+        return rows
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+async def run_stream(
+    symbols: Optional[List[str]], interval: str, flush_seconds: float
+) -> None:
+    """
+    Stream closed candles for the given symbols until SIGINT/SIGTERM.
+
+    Args:
+        symbols (Optional[List[str]]): Unified symbols (e.g., 'BTC/USDT').
+            Defaults to every active BINANCE asset.
+        interval (str): Kline interval (e.g., '1m').
+        flush_seconds (float): Seconds between micro-batch writes.
+    """
+    session = SessionLocal()
+    try:
+        query = session.query(Asset).filter(Asset.exchange == "BINANCE")
+        if symbols:
+            query = query.filter(Asset.symbol.in_(symbols))
+        else:
+            query = query.filter(Asset.is_active.is_(True))
+        assets = query.all()
+
+        asset_ids = {}
+        for asset in assets:
+            if not asset.is_active:
+                logger.warning(
+                    f"Asset '{asset.symbol}' is marked as inactive. Skipping."
+                )
+                continue
+            asset_ids[asset.symbol] = asset.id
+        watermarks = get_watermarks(session, asset_ids.values(), interval)
+    finally:
+        session.close()
+
+    found = {asset.symbol for asset in assets}
+    for symbol in sorted(set(symbols or []) - found):
+        logger.error(
+            f"Asset '{symbol}' NOT FOUND in database. "
+            "Please run 'seed_assets.py' first."
+        )
+    if not asset_ids:
+        logger.error("No active BINANCE assets to stream.")
+        return
+
+    last_closed = {
+        symbol: watermarks[asset_id]
+        for symbol, asset_id in asset_ids.items()
+        if asset_id in watermarks
+    }
+
+    fetcher = BinanceFetcher(lazy_markets=True)
+
+    def backfill(symbol: str, start: datetime, end: datetime) -> pd.DataFrame:
+        return fetcher.fetch_ohlcv(
+            symbol=symbol, interval=interval, start_date=start, end_date=end
+        )
+
+    ingestor = KlineStreamIngestor(
+        asset_ids,
+        interval,
+        sink=partial(write_candles, interval=interval),
+        backfill=backfill,
+        flush_interval=flush_seconds,
+        last_closed=last_closed,
+    )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    logger.info(
+        f"Streaming {len(asset_ids)} symbols at {interval} "
+        f"({len(last_closed)} resuming from stored data)."
+    )
+    await ingestor.run(stop)
+    logger.info(f"Stream stopped. {ingestor.rows_written:,} candles written.")
+
+
+if __name__ == "__main__":
+    # 1. Load Configuration
+    crypto_config = load_etl_config().get("crypto", {})
+
+    # 2. Setup CLI Argument Parser
+    parser = argparse.ArgumentParser(
+        description="Stream live Binance klines into market_quotes"
+    )
+
+    parser.add_argument(
+        "--symbols",
+        nargs="+",
+        default=None,
+        help="List of symbols to stream (e.g., BTC/USDT ETH/USDT). "
+        "Defaults to every active BINANCE asset in the database.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=str,
+        default=crypto_config.get("intervals", ["1m"])[0],
+        help="Kline interval (e.g., 1m, 1h)",
+    )
+    parser.add_argument(
+        "--flush-seconds",
+        type=float,
+        default=5.0,
+        help="Seconds between micro-batch writes to the database.",
+    )
+
+    args = parser.parse_args()
+
+    # 3. Execute
+    asyncio.run(run_stream(args.symbols, args.interval, args.flush_seconds))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Parquet Data-Lake Export Script.
+
+This script exports the time-series tables to a Hive-partitioned Parquet
+dataset (by asset and month/year) for offline research, e.g.:
+
+    import pyarrow.dataset as ds
+    quotes = ds.dataset("data/lake/market_quotes", partitioning="hive")
+    btc = quotes.to_table(filter=(ds.field("asset_id") == 1)).to_pandas()
+
+Runs are incremental: each asset (and interval) resumes from the partition
+holding its last exported row, and newly added assets are exported whole
+(see src/database/parquet_export.py). Use --full to rebuild, e.g. after
+backfilling history older than what was already exported.
+
+Usage:
+    1. Export the configured tables incrementally:
+       python scripts/run_parquet_export.py
+
+    2. Rebuild only the quotes dataset into a custom location:
+       python scripts/run_parquet_export.py --tables market_quotes --output /mnt/lake \\
+           --full
+"""
+
+import argparse
+import logging
+import sys
+import os
+import time
+from pathlib import Path
+from typing import Dict, Any
+import yaml
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+# Add the project root to sys.path to allow imports from 'src'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.parquet_export import (  # noqa: E402
+    DEFAULT_BATCH_ROWS,
+    DEFAULT_ROW_GROUP_ROWS,
+    EXPORT_SPECS,
+    run_export,
+)
+
+
+# ------------------------------------------------------------------------------
+# Logging Configuration
+# ------------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("parquet_export")
+
+
+def load_etl_config(config_path: str = "configs/etl_config.yaml") -> Dict[str, Any]:
+    """
+    Load ETL configuration from a YAML file.
+
+    Args:
+        config_path (str): Relative path to the config file.
+
+    Returns:
+        Dict[str, Any]: The configuration dictionary.
+    """
+    try:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        full_path = os.path.join(base_path, config_path)
+
+        with open(full_path, "r") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"Failed to load config file: {e}")
+        return {}
+
+
+if __name__ == "__main__":
+    # 1. Load Configuration
+    export_config = load_etl_config().get("export", {})
+
+    # 2. Setup CLI Argument Parser
+    parser = argparse.ArgumentParser(
+        description="Export tables to a partitioned Parquet lake"
+    )
+
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        choices=sorted(EXPORT_SPECS),
+        default=export_config.get("tables", sorted(EXPORT_SPECS)),
+        help="Tables to export.",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=export_config.get("output_dir", "data/lake"),
+        help="Dataset root directory.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore the stored watermarks and rebuild the datasets from scratch "
+        "(required after backfilling data older than the last export).",
+    )
+    parser.add_argument(
+        "--batch-rows",
+        type=int,
+        default=export_config.get("batch_rows", DEFAULT_BATCH_ROWS),
+        help="Rows fetched per database round trip.",
+    )
+    parser.add_argument(
+        "--row-group-rows",
+        type=int,
+        default=export_config.get("row_group_rows", DEFAULT_ROW_GROUP_ROWS),
+        help="Target rows per Parquet row group.",
+    )
+
+    args = parser.parse_args()
+
+    # 3. Execute (read-only transaction, rolled back on close)
+    started = time.perf_counter()
+    session = SessionLocal()
+    try:
+        written = run_export(
+            session,
+            Path(args.output),
+            args.tables,
+            full=args.full,
+            batch_rows=args.batch_rows,
+            row_group_rows=args.row_group_rows,
+        )
+    except (ValueError, RuntimeError) as e:
+        logger.error(f"Export failed: {e}")
+        sys.exit(1)
+    finally:
+        session.close()
+
+    total = sum(written.values())
+    logger.info(
+        f"Export finished: {total:,} rows into '{args.output}' "
+        f"in {time.perf_counter() - started:.1f}s."
+    )
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+News Sentiment ETL Execution Script.
+
+This script fetches news for the configured assets, scores every headline with
+the local LLM and upserts the results into the 'market_sentiment' hypertable.
+
+Stages run concurrently and are joined by bounded queues
+(see src/ai_analysis/sentiment_pipeline.py):
+
+    fetch (CryptoPanic / Google News) -> dedupe -> score in batches -> upsert
+
+Each batch is written with one multi-row upsert and committed on its own, so
+an interrupted run keeps every batch written so far. Headlines scored before
+(by any run on this host) come from the sentiment result cache.
+
+Usage:
+    1. Standard Run (Default from config):
+       python scripts/run_sentiment_etl.py
+
+    2. Specific Assets and Source:
+       python scripts/run_sentiment_etl.py --symbols BTC/USDT ETH/USDT \\
+           --sources CRYPTOPANIC --limit 100
+
+    3. Larger Batches, 4 Parallel LLM Requests:
+       python scripts/run_sentiment_etl.py --batch-size 200 --llm-workers 4
+"""
+
+import argparse
+import logging
+import sys
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import yaml
+
+from sqlalchemy.orm import Session
+
+# ------------------------------------------------------------------------------
+# Path Setup
+# ------------------------------------------------------------------------------
+# Add the project root to sys.path to allow imports from 'src'
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ai_analysis.sentiment_cache import SentimentCache  # noqa: E402
+from src.ai_analysis.sentiment_engine import SentimentAnalyzer  # noqa: E402
+from src.ai_analysis.sentiment_pipeline import (  # noqa: E402
+    NewsJob,
+    SentimentPipeline,
+)
+from src.core.config import settings  # noqa: E402
+from src.database.bulk_loader import upsert_market_sentiment  # noqa: E402
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.models import Asset  # noqa: E402
+from src.data_ingestion.news.base_news import BaseNewsFetcher  # noqa: E402
+
+# ------------------------------------------------------------------------------
+# Logging Configuration
+# ------------------------------------------------------------------------------
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("sentiment_etl")
+
+SOURCES = ("CRYPTOPANIC", "GOOGLE_NEWS")
+
+
+def load_etl_config(config_path: str = "configs/etl_config.yaml") -> Dict[str, Any]:
+    """
+    Load ETL configuration from a YAML file.
+
+    Args:
+        config_path (str): Relative path to the config file.
+
+    Returns:
+        Dict[str, Any]: The configuration dictionary.
+    """
+    try:
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        full_path = os.path.join(base_path, config_path)
+
+        with open(full_path, "r") as f:
+            return yaml.safe_load(f)
+    except Exception as e:
+        logger.error(f"Failed to load config file: {e}")
+        return {}
+
+
+def build_fetchers(sources: Sequence[str]) -> Dict[str, BaseNewsFetcher]:
+    """
+    Instantiate the news fetchers of the requested sources (imported lazily so
+    each source's client library is only required when that source is used).
+
+    Sources that cannot be initialized (e.g., missing API key) are skipped.
+
+    Args:
+        sources (Sequence[str]): Source keys (see SOURCES).
+
+    Returns:
+        Dict[str, BaseNewsFetcher]: Fetchers by source key.
+    """
+    fetchers: Dict[str, BaseNewsFetcher] = {}
+    for source in sources:
+        try:
+            if source == "CRYPTOPANIC":
+                from src.data_ingestion.news.cryptopanic_fetcher import (
+                    CryptoPanicFetcher,
+                )
+
+                fetchers[source] = CryptoPanicFetcher()
+            elif source == "GOOGLE_NEWS":
+                from src.data_ingestion.news.google_news_fetcher import (
+                    GoogleNewsFetcher,
+                )
+
+                fetchers[source] = GoogleNewsFetcher()
+        except (ValueError, ImportError) as e:
+            logger.warning(f"Skipping news source {source}: {e}")
+    return fetchers
+
+
+def get_asset(
+    session: Session, symbol: str, exchange: Optional[str]
+) -> Optional[Asset]:
+    """
+    Retrieve an asset by symbol (and exchange, when given).
+
+    Args:
+        session (Session): The database session.
+        symbol (str): The asset symbol.
+        exchange (Optional[str]): Exchange filter (e.g., 'BINANCE').
+
+    Returns:
+        Optional[Asset]: The SQLAlchemy Asset object if found, otherwise None.
+    """
+    query = session.query(Asset).filter(Asset.symbol == symbol)
+    if exchange:
+        query = query.filter(Asset.exchange == exchange)
+    return query.order_by(Asset.id).first()
+
+
+def build_jobs(
+    session: Session,
+    symbols: Sequence[str],
+    sources: Sequence[str],
+    limit: int,
+    keywords: Dict[str, str],
+    exchange: Optional[str] = None,
+) -> List[NewsJob]:
+    """
+    Plan one fetch job per (registered, active asset, source).
+
+    CryptoPanic is queried by symbol; Google News by the asset's keyword
+    (config `keywords`), falling back to the asset name and then the symbol.
+
+    Returns:
+        List[NewsJob]: The fetch jobs.
+    """
+    jobs: List[NewsJob] = []
+    for symbol in symbols:
+        asset = get_asset(session, symbol, exchange)
+        if asset is None:
+            logger.error(
+                f"Asset '{symbol}' NOT FOUND in database. Run "
+                "'python scripts/seed_assets.py' first. Skipping."
+            )
+            continue
+        if not asset.is_active:
+            logger.warning(f"Asset '{symbol}' is marked as inactive. Skipping.")
+            continue
+
+        for source in sources:
+            if source == "GOOGLE_NEWS":
+                query = keywords.get(symbol) or asset.name or symbol
+            else:
+                query = symbol
+            jobs.append(NewsJob(asset.id, source, query, limit))
+    return jobs
+
+
+def make_writer(session: Session) -> Callable[[List[Dict[str, Any]]], int]:
+    """
+    Build the pipeline's write stage: one upsert statement + commit per batch.
+
+    Args:
+        session (Session): Session used only by the pipeline's writer thread.
+
+    Returns:
+        Callable[[List[Dict[str, Any]]], int]: The batch writer.
+    """
+
+    def write(rows: List[Dict[str, Any]]) -> int:
+        try:
+            count = upsert_market_sentiment(session, rows)
+            session.commit()
+            return count
+        except Exception:
+            session.rollback()
+            raise
+
+    return write
+
+
+if __name__ == "__main__":
+    # 1. Load Configuration
+    sentiment_config = load_etl_config().get("sentiment", {})
+
+    # 2. Setup CLI Argument Parser
+    parser = argparse.ArgumentParser(
+        description="Score news headlines and load them into market_sentiment"
+    )
+
+    parser.add_argument(
+        "--symbols",
+        nargs="+",
+        default=sentiment_config.get("symbols", []),
+        help="Registered asset symbols to fetch news for.",
+    )
+    parser.add_argument(
+        "--exchange",
+        type=str,
+        default=sentiment_config.get("exchange"),
+        help="Exchange of the assets (when a symbol is listed on several).",
+    )
+    parser.add_argument(
+        "--sources",
+        nargs="+",
+        choices=SOURCES,
+        default=sentiment_config.get("sources", list(SOURCES)),
+        help="News sources to fetch from.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=sentiment_config.get("limit", 50),
+        help="Maximum articles per asset and source.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=sentiment_config.get("batch_size", 100),
+        help="Headlines per scoring batch and per upsert statement.",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=sentiment_config.get("queue_size", 8),
+        help="Capacity of each queue between pipeline stages.",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=sentiment_config.get("fetch_workers", 4),
+        help="Concurrent news fetch jobs.",
+    )
+    parser.add_argument(
+        "--llm-workers",
+        type=int,
+        default=sentiment_config.get("llm_workers", settings.OLLAMA_NUM_PARALLEL),
+        help="Concurrent LLM requests (match the server's OLLAMA_NUM_PARALLEL).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-score every headline instead of using the sentiment result cache.",
+    )
+
+    args = parser.parse_args()
+
+    if not args.symbols:
+        logger.error("No symbols configured (configs/etl_config.yaml -> sentiment).")
+        sys.exit(1)
+
+    # 3. Build Pipeline Components
+    fetchers = build_fetchers(args.sources)
+    if not fetchers:
+        logger.error("No news source could be initialized. Aborting.")
+        sys.exit(1)
+
+    cache = None if args.no_cache else SentimentCache()
+    analyzer = SentimentAnalyzer(cache=cache, max_workers=args.llm_workers)
+
+    # One session for planning + the single writer thread
+    session = SessionLocal()
+    try:
+        jobs = build_jobs(
+            session,
+            args.symbols,
+            list(fetchers),
+            args.limit,
+            sentiment_config.get("keywords") or {},
+            args.exchange,
+        )
+        if not jobs:
+            logger.error("No fetch jobs planned. Aborting.")
+            sys.exit(1)
+        session.commit()  # end the planning transaction before writing
+
+        pipeline = SentimentPipeline(
+            fetchers,
+            analyzer,
+            make_writer(session),
+            batch_size=args.batch_size,
+            queue_size=args.queue_size,
+            fetch_workers=args.fetch_workers,
+        )
+
+        # 4. Execute
+        logger.info(
+            f"Starting sentiment ETL: {len(jobs)} jobs "
+            f"({len(args.symbols)} symbols x {len(fetchers)} sources)."
+        )
+        stats = pipeline.run(jobs)
+    except (ValueError, RuntimeError) as e:
+        logger.error(f"Sentiment ETL failed: {e}")
+        sys.exit(1)
+    finally:
+        session.close()
+        analyzer.pool.close()
+        if cache is not None:
+            logger.info(f"Sentiment cache: {cache.stats()}")
+            cache.close()
+
+    # 5. Summary
+    logger.info(
+        f"Sentiment ETL finished in {stats.seconds:.1f}s: {stats.fetched} fetched, "
+        f"{stats.duplicates} duplicates, {stats.scored} scored, "
+        f"{stats.unscored} unscored, {stats.written} rows written "
+        f"in {stats.batches} batches ({stats.failed_jobs} failed fetch jobs)."
+    )
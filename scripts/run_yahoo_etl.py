@@ -21,6 +21,15 @@ Usage:
 
     3. Backfill Historical Data:
        python scripts/run_yahoo_etl.py --symbols AAPL --start-date 2020-01-01 --end-date 2023-12-31
+
+    4. Large Backfill (Streaming, window by window):
+       python scripts/run_yahoo_etl.py --symbols AAPL --interval 1h --start-date 2024-01-01 --stream
+
+    5. Scheduled Incremental Run (fetch only past each symbol's latest stored candle):
+       python scripts/run_yahoo_etl.py --incremental --overlap 1
+
+    6. Many Tickers (grouped multi-ticker downloads of 100 symbols each):
+       python scripts/run_yahoo_etl.py --symbols AAPL MSFT NVDA ... --batch-size 100
 """
 
 import argparse
@@ -32,7 +41,6 @@ from typing import List, Dict, Any, Optional
 import yaml
 
 import pandas as pd
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 # ------------------------------------------------------------------------------
@@ -42,8 +50,14 @@ from sqlalchemy.orm import Session
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.core.config import settings  # noqa: E402
+from src.core.timeframes import interval_to_timedelta  # noqa: E402
 from src.database.connection import SessionLocal  # noqa: E402
-from src.database.models import Asset, MarketQuote  # noqa: E402
+from src.database.models import Asset  # noqa: E402
+from src.database.bulk_loader import (  # noqa: E402
+    copy_upsert_market_quotes,
+    stream_upsert_market_quotes,
+)
+from src.database.watermarks import incremental_start_dates  # noqa: E402
 from src.data_ingestion.yahoo.yfinance_fetcher import YahooFinanceFetcher  # noqa: E402
 
 
@@ -102,15 +116,20 @@ def get_asset(session: Session, symbol: str) -> Optional[Asset]:
     )
 
 
-def save_market_data(session: Session, asset_id: int, df: pd.DataFrame) -> int:
+def save_market_data(
+    session: Session, asset_id: int, df: pd.DataFrame, interval: str
+) -> int:
     """
     Bulk upsert market data into the database.
-    Uses PostgreSQL 'ON CONFLICT DO UPDATE' to handle duplicate timestamps.
+
+    Streams the DataFrame via COPY into a staging table and merges it with a
+    single 'INSERT ... SELECT ... ON CONFLICT DO UPDATE' (see src/database/bulk_loader.py).
 
     Args:
         session (Session): The database session.
         asset_id (int): The foreign key ID of the asset.
         df (pd.DataFrame): The DataFrame containing OHLCV data.
+        interval (str): Candle resolution of the frame.
 
     Returns:
         int: Number of records processed.
@@ -118,38 +137,116 @@ def save_market_data(session: Session, asset_id: int, df: pd.DataFrame) -> int:
     if df.empty:
         return 0
 
-    records: List[Dict[str, Any]] = []
-    for _, row in df.iterrows():
-        records.append(
-            {
-                "time": row["time"],
-                "asset_id": asset_id,
-                "open": row["open"],
-                "high": row["high"],
-                "low": row["low"],
-                "close": row["close"],
-                "volume": row["volume"],
-            }
+    count = copy_upsert_market_quotes(session, asset_id, df, interval)
+    session.commit()
+
+    return count
+
+
+def stream_symbol(
+    session: Session,
+    fetcher: YahooFinanceFetcher,
+    symbol: str,
+    asset_id: int,
+    interval: str,
+    start_date: datetime,
+    end_date: datetime,
+    chunk_rows: int = 50_000,
+) -> None:
+    """
+    Extract + Load one symbol window by window (streaming mode).
+
+    Failures are logged and do not stop the job.
+
+    Args:
+        session (Session): The database session.
+        fetcher (YahooFinanceFetcher): The Yahoo fetcher.
+        symbol (str): Stock ticker.
+        asset_id (int): The foreign key ID of the asset.
+        interval (str): Timeframe interval.
+        start_date (datetime): Start datetime (UTC) of this symbol.
+        end_date (datetime): End datetime (UTC).
+        chunk_rows (int): Flush threshold in rows.
+    """
+    try:
+        logger.info(f"Processing {symbol}...")
+        pages = fetcher.iter_ohlcv(
+            symbol=symbol,
+            interval=interval,
+            start_date=start_date,
+            end_date=end_date
+        )
+        count = stream_upsert_market_quotes(
+            session, asset_id, pages, interval, chunk_rows=chunk_rows
         )
+        if count == 0:
+            logger.warning(f"No data returned for {symbol}.")
+        else:
+            logger.info(f"Successfully streamed {count} records for {symbol}.")
 
-    stmt = insert(MarketQuote).values(records)
-
-    # Upsert Logic: Update OHLCV if record already exists for (time, asset_id)
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["time", "asset_id"],
-        set_={
-            "open": stmt.excluded.open,
-            "high": stmt.excluded.high,
-            "low": stmt.excluded.low,
-            "close": stmt.excluded.close,
-            "volume": stmt.excluded.volume,
-        },
-    )
+    except Exception as e:
+        logger.error(f"Error processing {symbol}: {str(e)}")
 
-    session.execute(stmt)
-    session.commit()
 
-    return len(records)
+def process_batch(
+    session: Session,
+    fetcher: YahooFinanceFetcher,
+    asset_ids: Dict[str, int],
+    interval: str,
+    start_dates: Dict[str, datetime],
+    end_date: datetime,
+) -> None:
+    """
+    Extract one batch of tickers with a grouped download, then load each symbol.
+
+    A failed download skips the batch; a failed load skips (and rolls back)
+    only that symbol.
+
+    Args:
+        session (Session): The database session.
+        fetcher (YahooFinanceFetcher): The Yahoo fetcher.
+        asset_ids (Dict[str, int]): Asset ID per ticker of the batch.
+        interval (str): Timeframe interval.
+        start_dates (Dict[str, datetime]): Start datetime (UTC) per ticker.
+        end_date (datetime): End datetime (UTC).
+    """
+    batch = list(asset_ids)
+    logger.info(f"Processing batch of {len(batch)} symbols: {', '.join(batch)}")
+
+    # Step B: Extract (Fetch Data)
+    # A batch shares one request, so it starts at the earliest symbol start;
+    # each frame is trimmed back to its own start below.
+    batch_start = min(start_dates[symbol] for symbol in batch)
+    try:
+        frames = fetcher.fetch_ohlcv_many(
+            symbols=batch,
+            interval=interval,
+            start_date=batch_start,
+            end_date=end_date
+        )
+    except Exception as e:
+        logger.error(f"Error fetching batch {', '.join(batch)}: {str(e)}")
+        return
+
+    for symbol in batch:
+        try:
+            df = frames.get(symbol, pd.DataFrame())
+            symbol_start = start_dates[symbol]
+            if not df.empty and symbol_start > batch_start:
+                df = df[df["time"] >= symbol_start]
+
+            if df.empty:
+                logger.warning(f"No data returned for {symbol}.")
+                continue
+
+            # Step C: Load (Save to DB)
+            count = save_market_data(session, asset_ids[symbol], df, interval)
+            logger.info(f"Successfully saved {count} records for {symbol}.")
+
+        except Exception as e:
+            logger.error(f"Error processing {symbol}: {str(e)}")
+            session.rollback()
+            continue
 
 
 def run_etl(
@@ -157,19 +254,35 @@ def run_etl(
     interval: str,
     start_date: datetime,
     end_date: datetime,
+    stream: bool = False,
+    chunk_rows: int = 50_000,
+    incremental: bool = False,
+    overlap: timedelta = timedelta(0),
+    batch_size: int = 50,
 ) -> None:
     """
     Execute the ETL pipeline for the specified parameters.
 
+    Symbols are processed in batches of `batch_size`: each batch is fetched
+    with ONE grouped multi-ticker download instead of one request per symbol.
+
     Args:
         symbols (List[str]): List of stock tickers.
         interval (str): Timeframe interval (e.g., '1d', '1h').
         start_date (datetime): Start datetime (UTC).
         end_date (datetime): End datetime (UTC).
+        stream (bool): If True, load window by window with independent commits
+                       (per symbol; batching does not apply).
+        chunk_rows (int): Streaming mode flush threshold in rows.
+        incremental (bool): If True, each symbol starts from its latest stored candle
+                            (minus `overlap`); `start_date` only applies to symbols
+                            with no stored data yet.
+        overlap (timedelta): Incremental mode: history re-fetched before the watermark.
+        batch_size (int): Number of tickers per grouped download.
     """
     logger.info(
         f"Starting Yahoo ETL Job for {len(symbols)} symbols. "
-        f"Interval: {interval}. Range: {start_date} to {end_date}"
+        f"Interval: {interval}. Range: {start_date} to {end_date}. Batch size: {batch_size}"
     )
 
     # 1. Initialize Fetcher
@@ -178,45 +291,61 @@ def run_etl(
     # 2. Database Session
     session = SessionLocal()
     try:
+        # Step A: Validate Asset Existence
+        assets: Dict[str, Asset] = {}
         for symbol in symbols:
-            try:
-                logger.info(f"Processing {symbol}...")
-
-                # Step A: Validate Asset Existence
-                asset = get_asset(session, symbol)
-
-                if not asset:
-                    logger.error(f"Asset '{symbol}' NOT FOUND in database. Skipping.")
-                    logger.error(
-                        "ACTION REQUIRED: Please register this asset in 'configs/assets.yaml' "
-                        "and run 'seed_assets.py'."
-                    )
-                    continue
-                
-                if not asset.is_active:
-                    logger.warning(f"Asset '{symbol}' is marked as inactive. Skipping.")
-                    continue
-
-                # Step B: Extract (Fetch Data)
-                # Note: yfinance fetcher handles the datetime precision internally now.
-                df = fetcher.fetch_ohlcv(
-                    symbol=symbol,
-                    interval=interval,
-                    start_date=start_date,
-                    end_date=end_date
+            asset = get_asset(session, symbol)
+
+            if not asset:
+                logger.error(f"Asset '{symbol}' NOT FOUND in database. Skipping.")
+                logger.error(
+                    "ACTION REQUIRED: Please register this asset in 'configs/assets.yaml' "
+                    "and run 'seed_assets.py'."
                 )
+                continue
 
-                if df.empty:
-                    logger.warning(f"No data returned for {symbol}.")
-                    continue
+            if not asset.is_active:
+                logger.warning(f"Asset '{symbol}' is marked as inactive. Skipping.")
+                continue
 
-                # Step C: Load (Save to DB)
-                count = save_market_data(session, asset.id, df)
-                logger.info(f"Successfully saved {count} records for {symbol}.")
+            assets[symbol] = asset
+
+        # Incremental Mode: resolve every symbol's start with one watermark query.
+        start_dates: Dict[str, datetime] = {}
+        if incremental:
+            asset_ids = {symbol: asset.id for symbol, asset in assets.items()}
+            start_dates = incremental_start_dates(
+                session, asset_ids, start_date, overlap, interval
+            )
+
+        # Symbols without a watermark (or all, outside incremental mode) use start_date.
+        symbol_starts = {
+            symbol: start_dates.get(symbol, start_date) for symbol in assets
+        }
+
+        # Streaming Mode: Extract + Load window by window, symbol by symbol
+        if stream:
+            for symbol, asset in assets.items():
+                stream_symbol(
+                    session,
+                    fetcher,
+                    symbol,
+                    asset.id,
+                    interval,
+                    start_date=symbol_starts[symbol],
+                    end_date=end_date,
+                    chunk_rows=chunk_rows,
+                )
+            return
 
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {str(e)}")
-                continue
+        # Batched Mode: one grouped download per batch of tickers
+        batch_symbols = list(assets)
+        for i in range(0, len(batch_symbols), max(batch_size, 1)):
+            batch = batch_symbols[i:i + max(batch_size, 1)]
+            batch_ids = {symbol: assets[symbol].id for symbol in batch}
+            process_batch(
+                session, fetcher, batch_ids, interval, symbol_starts, end_date
+            )
 
     finally:
         session.close()
@@ -244,6 +373,10 @@ if __name__ == "__main__":
     default_symbols = yahoo_config.get("symbols", ["SPY"]) # Default fallback
     default_interval = yahoo_config.get("intervals", ["1d"])[0]
     default_days = yahoo_config.get("lookback_days", 1)
+    default_chunk_rows = yahoo_config.get("chunk_rows", 50_000)
+    default_incremental = yahoo_config.get("incremental", False)
+    default_overlap = yahoo_config.get("overlap_candles", 0)
+    default_batch_size = yahoo_config.get("batch_size", 50)
 
     # 2. Setup CLI Argument Parser
     parser = argparse.ArgumentParser(description="Run Yahoo Finance ETL Pipeline")
@@ -279,6 +412,42 @@ if __name__ == "__main__":
         help="Number of lookback days (only used if --start-date is NOT provided).",
     )
 
+    # Streaming Arguments (Large Backfills)
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Load window by window, committing each chunk independently.",
+    )
+    parser.add_argument(
+        "--chunk-rows",
+        type=int,
+        default=default_chunk_rows,
+        help="Streaming mode: commit after this many rows.",
+    )
+
+    # Batching Argument
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=default_batch_size,
+        help="Number of tickers fetched per grouped multi-ticker download.",
+    )
+
+    # Incremental Mode Arguments (Scheduled Runs)
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=default_incremental,
+        help="Fetch from each symbol's latest stored candle instead of a fixed "
+        "lookback window (--no-incremental overrides an enabled config default).",
+    )
+    parser.add_argument(
+        "--overlap",
+        type=int,
+        default=default_overlap,
+        help="Incremental mode: also re-fetch this many candles before the watermark.",
+    )
+
     args = parser.parse_args()
 
     # 3. Determine Time Range
@@ -297,4 +466,9 @@ if __name__ == "__main__":
         interval=args.interval,
         start_date=start_date,
         end_date=end_date,
+        stream=args.stream,
+        chunk_rows=args.chunk_rows,
+        incremental=args.incremental,
+        overlap=interval_to_timedelta(args.interval) * args.overlap,
+        batch_size=args.batch_size,
     )
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Concurrent Inference Executor.
+
+Ollama serves OLLAMA_NUM_PARALLEL requests per loaded model at once; a single
+blocking caller leaves the remaining slots (and the GPU) idle between
+requests. InferencePool keeps that many requests in flight:
+
+- Parallelism: a fixed set of worker threads (default settings.OLLAMA_NUM_PARALLEL)
+  shared by every call, so concurrent callers cannot oversubscribe the server.
+- Backpressure: each `imap` call submits at most `max_pending` tasks ahead of
+  the consumer and pulls from its input lazily, so a large (or generated)
+  input is never queued in memory at once.
+- Ordering: results are delivered in input order.
+
+Per-request timeouts are enforced by the task itself (OllamaClient.generate's
+HTTP timeout), which returns the worker to the pool when a request hangs.
+
+Example:
+    with InferencePool(max_workers=4) as pool:
+        for result in pool.imap(client.generate, prompts):
+            ...
+"""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, TypeVar
+
+from src.core.config import settings
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class InferencePool:
+    """
+    Thread pool with bounded, ordered task submission.
+
+    Attributes:
+        max_workers (int): Maximum number of tasks running at once.
+        max_pending (int): Maximum number of submitted, undelivered tasks per call.
+    """
+
+    def __init__(
+        self, max_workers: Optional[int] = None, max_pending: Optional[int] = None
+    ) -> None:
+        """
+        Initialize the pool (threads are started on first use).
+
+        Args:
+            max_workers (Optional[int]): Concurrent tasks.
+                Defaults to settings.OLLAMA_NUM_PARALLEL.
+            max_pending (Optional[int]): Submission window per `imap` call.
+                Defaults to twice max_workers.
+
+        Raises:
+            ValueError: If max_workers or max_pending is not positive.
+        """
+        self.max_workers = int(max_workers or settings.OLLAMA_NUM_PARALLEL)
+        self.max_pending = int(max_pending or self.max_workers * 2)
+        if self.max_workers <= 0 or self.max_pending <= 0:
+            raise ValueError("max_workers and max_pending must be positive.")
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def imap(self, func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """
+        Apply `func` to every item concurrently, yielding results in input order.
+
+        If a task raises, the exception is re-raised here (at its position) and
+        the tasks not yet started are cancelled, as they are when the consumer
+        stops iterating early.
+
+        Args:
+            func (Callable[[T], R]): Task to run per item.
+            items (Iterable[T]): Inputs, consumed lazily.
+
+        Yields:
+            R: The result of each item, in input order.
+        """
+        if self.max_workers == 1:
+            for item in items:
+                yield func(item)
+            return
+
+        executor = self._get_executor()
+        in_flight: Deque["Future[R]"] = deque()
+        remaining = iter(items)
+
+        def submit_next() -> None:
+            for item in remaining:
+                in_flight.append(executor.submit(func, item))
+                return
+
+        # Prime the pipeline with a bounded window of tasks
+        for _ in range(self.max_pending):
+            submit_next()
+
+        try:
+            while in_flight:
+                result = in_flight.popleft().result()
+                submit_next()
+                yield result
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    def map(self, func: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Eager variant of `imap`.
+
+        Returns:
+            List[R]: One result per item, in input order.
+        """
+        return list(self.imap(func, items))
+
+    def close(self) -> None:
+        """Wait for running tasks and stop the worker threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "InferencePool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the shared executor on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="ollama-infer"
+                )
+            return self._executor
@@ -7,6 +7,9 @@ It abstracts the HTTP communication logic, error handling, and response parsing.
 Features:
 - Auto-pull models if missing (Self-healing).
 - Strict type hinting and error logging.
+- Pooled keep-alive connections (one per parallel inference slot) from the
+  shared session factory (src/core/http.py), so the client can be shared by
+  concurrent workers (see inference_pool.py).
 """
 
 import logging
@@ -14,10 +17,10 @@ import json
 import time
 from typing import Optional, Dict, Any, List
 
-import requests
 from requests.exceptions import RequestException, Timeout
 
 from src.core.config import settings
+from src.core.http import create_session
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -34,6 +37,7 @@ class OllamaClient:
         base_url: Optional[str] = None,
         model: Optional[str] = None,
         timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
     ) -> None:
         """
         Initialize the Ollama Client.
@@ -42,11 +46,19 @@ class OllamaClient:
             base_url (Optional[str]): The API endpoint. Defaults to settings.
             model (Optional[str]): The model name to use. Defaults to settings.
             timeout (Optional[float]): Inference timeout in seconds.
+            max_connections (Optional[int]): Keep-alive connections to pool.
+                Defaults to settings.OLLAMA_NUM_PARALLEL.
         """
         self.base_url = (base_url or settings.OLLAMA_BASE_URL).rstrip("/")
         self.model = model or settings.OLLAMA_MODEL
         self.timeout = timeout or settings.OLLAMA_TIMEOUT
-        
+
+        # Only connection errors are retried: generation requests are POSTs.
+        self.session = create_session(
+            pool_size=max_connections or settings.OLLAMA_NUM_PARALLEL,
+            timeout=self.timeout,
+        )
+
         self.generate_endpoint = f"{self.base_url}/api/generate"
         self.tags_endpoint = f"{self.base_url}/api/tags"
         self.pull_endpoint = f"{self.base_url}/api/pull"
@@ -72,7 +84,7 @@ class OllamaClient:
             bool: True if model exists, False otherwise.
         """
         try:
-            response = requests.get(self.tags_endpoint, timeout=10.0)
+            response = self.session.get(self.tags_endpoint, timeout=10.0)
             if response.status_code == 200:
                 data = response.json()
                 models: List[Dict[str, Any]] = data.get("models", [])
@@ -103,7 +115,7 @@ class OllamaClient:
             # Timeout is set to 30 minutes (1800s) to accommodate large models/slow networks.
             payload = {"name": self.model, "stream": False}
             
-            response = requests.post(
+            response = self.session.post(
                 self.pull_endpoint, 
                 json=payload, 
                 timeout=1800.0  # Hardcoded long timeout for downloading
@@ -124,10 +136,17 @@ class OllamaClient:
         prompt: str,
         system_prompt: Optional[str] = None,
         format: str = "json",
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Send a prompt to the LLM and retrieve the generated response.
+
+        Safe to call from several threads at once.
+
+        Args:
+            timeout (Optional[float]): Per-request timeout in seconds.
+                Defaults to the client timeout.
         """
         payload = {
             "model": self.model,
@@ -145,10 +164,10 @@ class OllamaClient:
         try:
             logger.debug(f"Sending inference request to Ollama ({self.model})...")
             
-            response = requests.post(
+            response = self.session.post(
                 self.generate_endpoint,
                 json=payload,
-                timeout=self.timeout
+                timeout=timeout or self.timeout
             )
             
             response.raise_for_status()
@@ -166,4 +185,10 @@ class OllamaClient:
 
         except Exception as e:
             logger.error(f"Ollama inference failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections.
+        """
+        self.session.close()
@@ -6,6 +6,8 @@ guiding the Large Language Model (LLM). Separating prompts from logic
 ensures cleaner code and easier prompt engineering updates.
 """
 
+import hashlib
+
 # System prompt to define the AI's persona and output constraints.
 # We explicitly enforce JSON format and strict numerical ranges.
 SENTIMENT_ANALYSIS_SYSTEM_PROMPT = """
@@ -30,4 +32,48 @@ Analyze the following news headline:
 "{text}"
 
 Return the JSON analysis.
-"""
\ No newline at end of file
+"""
+# Batch variant: N numbered headlines are scored in ONE request, so the system
+# prompt is evaluated once per batch instead of once per headline.
+# (A JSON object wrapping the array is requested because JSON mode is most
+# reliable with a top-level object; a bare array is accepted as well.)
+SENTIMENT_BATCH_SYSTEM_PROMPT = """
+You are a senior quantitative financial analyst. Your task is to analyze a numbered list of
+financial news headlines and extract sentiment metrics for algorithmic trading.
+
+You must output ONLY a valid JSON object of the form {"results": [...]}, with exactly one
+entry per headline, each entry having the following keys:
+- id: The number of the headline in the list (integer).
+- sentiment_score: Float between -1.0 (Very Negative) and 1.0 (Very Positive).
+- impact_score: Float between 0.0 (Irrelevant) and 1.0 (Market Moving).
+- confidence: Float between 0.0 (Unsure) and 1.0 (Certain).
+
+Rules:
+1. Be objective. Eliminate emotional bias.
+2. Score every headline independently of the others.
+3. If the news is neutral or strictly factual, set sentiment_score to 0.0.
+4. If the news is not finance-related, return sentiment_score: 0.0 and impact_score: 0.0.
+5. Do not output markdown, explanations, or code blocks. Just the JSON.
+"""
+
+# Template for the batch user message. `items` holds one line per headline:
+# '<id>. "<headline>"'.
+SENTIMENT_BATCH_USER_PROMPT_TEMPLATE = """
+Analyze the following {count} news headlines:
+{items}
+
+Return the JSON analysis with {count} results.
+"""
+
+# Fingerprint of all sentiment prompts. Part of the sentiment cache key, so any
+# prompt edit automatically invalidates previously cached scores.
+SENTIMENT_PROMPT_VERSION = hashlib.sha256(
+    "\0".join(
+        [
+            SENTIMENT_ANALYSIS_SYSTEM_PROMPT,
+            SENTIMENT_USER_PROMPT_TEMPLATE,
+            SENTIMENT_BATCH_SYSTEM_PROMPT,
+            SENTIMENT_BATCH_USER_PROMPT_TEMPLATE,
+        ]
+    ).encode("utf-8")
+).hexdigest()[:16]
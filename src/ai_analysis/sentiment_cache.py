@@ -0,0 +1,266 @@
+"""
+Sentiment Result Cache.
+
+The same headline reaches the pipeline many times (syndicated across Google
+News publishers, re-fetched on every CryptoPanic poll). This module stores LLM
+scores content-addressed by
+
+    sha256(model, prompt version, normalized text)
+
+so a headline is scored once per model/prompt combination. Changing the model
+(settings.OLLAMA_MODEL) or editing any sentiment prompt (see
+SENTIMENT_PROMPT_VERSION) changes every key, which invalidates old entries
+without an explicit flush.
+
+Storage is a SQLite file (shared by all processes on the host) with an
+in-memory LRU of recent entries in front of it. Hit/miss counters are kept
+per instance for monitoring.
+
+Example:
+    cache = SentimentCache()
+    analyzer = SentimentAnalyzer(cache=cache)
+    ...
+    logger.info(cache.stats())
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.core.config import settings
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# (sentiment_score, impact_score, confidence)
+CachedScores = Tuple[float, float, float]
+
+_WHITESPACE = re.compile(r"\s+")
+
+# SQLite limits the number of bound parameters per statement.
+_LOOKUP_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """
+    Canonicalize a headline so trivially different copies share one cache key.
+
+    Applies Unicode NFKC normalization, case folding and whitespace collapsing.
+
+    Args:
+        text (str): Raw headline.
+
+    Returns:
+        str: Normalized headline.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def cache_key(text: str, model: str, prompt_version: str) -> str:
+    """
+    Build the content-addressed key of one (text, model, prompt version).
+
+    Args:
+        text (str): Raw headline (normalized internally).
+        model (str): LLM model name (e.g., 'qwen2.5:3b').
+        prompt_version (str): Prompt fingerprint.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    payload = "\0".join([model, prompt_version, normalize_text(text)])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """
+    Two-level (memory LRU + SQLite) store of sentiment scores.
+
+    Thread-safe: one SQLite connection per instance, guarded by a lock.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+        max_memory_entries (int): Capacity of the in-memory LRU.
+        memory_hits (int): Lookups served from memory.
+        disk_hits (int): Lookups served from SQLite.
+        misses (int): Lookups not found.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_memory_entries: Optional[int] = None
+    ) -> None:
+        """
+        Open (or create) the cache.
+
+        Args:
+            path (Optional[str]): SQLite file.
+                Defaults to settings.SENTIMENT_CACHE_PATH.
+            max_memory_entries (Optional[int]): LRU size.
+                Defaults to settings.SENTIMENT_CACHE_MEMORY_ENTRIES (0 disables it).
+        """
+        self.path = path or settings.SENTIMENT_CACHE_PATH
+        self.max_memory_entries = int(
+            settings.SENTIMENT_CACHE_MEMORY_ENTRIES
+            if max_memory_entries is None
+            else max_memory_entries
+        )
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._memory: "OrderedDict[str, CachedScores]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment_cache ("
+                "key TEXT PRIMARY KEY, sentiment_score REAL NOT NULL, "
+                "impact_score REAL NOT NULL, confidence REAL NOT NULL, "
+                "created_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[CachedScores]:
+        """
+        Look up one key.
+
+        Args:
+            key (str): Key from `cache_key`.
+
+        Returns:
+            Optional[CachedScores]: Cached scores, or None on a miss.
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CachedScores]:
+        """
+        Look up several keys (memory first, then one SQLite query per chunk).
+
+        Args:
+            keys (Iterable[str]): Keys from `cache_key`.
+
+        Returns:
+            Dict[str, CachedScores]: Scores of the keys that were found.
+        """
+        wanted = list(dict.fromkeys(keys))
+        found: Dict[str, CachedScores] = {}
+        with self._lock:
+            remaining = []
+            for key in wanted:
+                scores = self._memory.get(key)
+                if scores is None:
+                    remaining.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = scores
+            self.memory_hits += len(found)
+
+            for offset in range(0, len(remaining), _LOOKUP_CHUNK):
+                chunk = remaining[offset : offset + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT key, sentiment_score, impact_score, confidence "
+                    "FROM sentiment_cache "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, sentiment, impact, confidence in rows:
+                    found[key] = (sentiment, impact, confidence)
+                    self._remember(key, found[key])
+                    self.disk_hits += 1
+
+            self.misses += len(wanted) - len(found)
+        return found
+
+    def put(self, key: str, scores: CachedScores) -> None:
+        """
+        Store one entry.
+
+        Args:
+            key (str): Key from `cache_key`.
+            scores (CachedScores): (sentiment_score, impact_score, confidence).
+        """
+        self.put_many({key: scores})
+
+    def put_many(self, entries: Dict[str, CachedScores]) -> None:
+        """
+        Store several entries in one SQLite transaction.
+
+        Failures are logged and swallowed: the cache is an optimization only.
+
+        Args:
+            entries (Dict[str, CachedScores]): Scores per key.
+        """
+        if not entries:
+            return
+        now = time.time()
+        with self._lock:
+            for key, scores in entries.items():
+                self._remember(key, scores)
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO sentiment_cache "
+                        "(key, sentiment_score, impact_score, confidence, created_at) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        [(key, *scores, now) for key, scores in entries.items()],
+                    )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"Failed to persist {len(entries)} sentiment cache entries: {e}"
+                )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the hit/miss counters of this instance.
+
+        Returns:
+            Dict[str, float]: memory_hits, disk_hits, misses, hit_rate, memory_entries.
+        """
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hit_rate, 4),
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: str, scores: CachedScores) -> None:
+        """Insert into the memory LRU (caller holds the lock)."""
+        if self.max_memory_entries <= 0:
+            return
+        self._memory[key] = scores
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
@@ -5,20 +5,41 @@ This module implements the core business logic for converting unstructured text
 into quantitative sentiment metrics using an LLM.
 
 It orchestrates the interaction between the Prompt Templates and the LLM Client.
+
+Headlines can be scored one per request (`analyze`) or N per request
+(`analyze_batch`), which evaluates the system prompt once per batch and keeps
+up to `max_workers` batch requests in flight (see inference_pool.py). With a
+SentimentCache attached, previously scored headlines skip the LLM entirely.
 """
 
+import json
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
 
+from src.ai_analysis.inference_pool import InferencePool
 from src.ai_analysis.llm_client import OllamaClient
 from src.ai_analysis.prompt_templates import (
     SENTIMENT_ANALYSIS_SYSTEM_PROMPT,
     SENTIMENT_USER_PROMPT_TEMPLATE,
+    SENTIMENT_BATCH_SYSTEM_PROMPT,
+    SENTIMENT_BATCH_USER_PROMPT_TEMPLATE,
+    SENTIMENT_PROMPT_VERSION,
 )
+from src.ai_analysis.sentiment_cache import SentimentCache, cache_key
 
 logger = logging.getLogger(__name__)
 
+# Headlines scored per batch request (keeps prompt + output well inside the
+# default context window of small local models).
+DEFAULT_BATCH_SIZE = 20
+
+# Output token budget per headline in a batch response (one JSON entry ~35 tokens).
+BATCH_TOKENS_PER_ITEM = 64
+
+# Keys a response must contain to count as a score (anything else is dropped).
+SCORE_KEYS = ("sentiment_score", "impact_score", "confidence")
+
 
 @dataclass
 class SentimentResult:
@@ -36,17 +57,33 @@ class SentimentAnalyzer:
     Analyzer class responsible for processing news text via LLM.
     """
 
-    def __init__(self, client: Optional[OllamaClient] = None):
+    def __init__(
+        self,
+        client: Optional[OllamaClient] = None,
+        cache: Optional[SentimentCache] = None,
+        max_workers: Optional[int] = None,
+        request_timeout: Optional[float] = None,
+    ):
         """
         Initialize the analyzer.
 
         Args:
             client (Optional[OllamaClient]): The LLM client instance. 
                                              Injectable for testing.
+            cache (Optional[SentimentCache]): Result cache consulted before
+                                              every LLM call (None = disabled).
+            max_workers (Optional[int]): Concurrent requests in `analyze_batch`.
+                                         Defaults to settings.OLLAMA_NUM_PARALLEL.
+            request_timeout (Optional[float]): Per-request timeout in seconds.
+                                               Defaults to the client timeout.
         """
+        self.pool = InferencePool(max_workers=max_workers)
+        self.request_timeout = request_timeout
+
         # If client is provided (e.g. Mock for tests), use it.
         # Otherwise, create a real OllamaClient.
-        self.client = client or OllamaClient()
+        self.client = client or OllamaClient(max_connections=self.pool.max_workers)
+        self.cache = cache
 
         # [AUTO-HEALING LOGIC]
         # Only perform the model check if we are using the real client (not a mock).
@@ -62,32 +99,239 @@ class SentimentAnalyzer:
             logger.warning("Empty text provided for sentiment analysis.")
             return None
 
+        key = self._cache_key(text)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return SentimentResult(*cached)
+
         prompt = SENTIMENT_USER_PROMPT_TEMPLATE.format(text=text.strip())
 
         try:
             response_data = self.client.generate(
                 prompt=prompt,
                 system_prompt=SENTIMENT_ANALYSIS_SYSTEM_PROMPT,
-                format="json"
+                format="json",
+                timeout=self.request_timeout,
             )
 
             if not response_data:
                 return None
 
-            return self._parse_response(response_data)
+            result = self._parse_response(response_data)
+            if result is not None and self.cache is not None:
+                self.cache.put(key, self._scores(result))
+            return result
 
         except Exception as e:
             logger.exception(f"Sentiment analysis failed: {e}")
             return None
 
+    def analyze_batch(
+        self, texts: Sequence[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> List[Optional[SentimentResult]]:
+        """
+        Analyze many texts, scoring `batch_size` of them per LLM request.
+
+        Batches are sent concurrently through the analyzer's InferencePool.
+        Entries the model drops or returns malformed are retried individually
+        via `analyze`. Duplicate texts (after normalization) are scored once,
+        and cached texts are not sent at all.
+
+        Args:
+            texts (Sequence[str]): Texts to analyze.
+            batch_size (int): Texts per request.
+
+        Returns:
+            List[Optional[SentimentResult]]: One result per input text, in input
+                                             order (None for empty or failed texts).
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive.")
+
+        results: List[Optional[SentimentResult]] = [None] * len(texts)
+        pending = [
+            (index, text.strip())
+            for index, text in enumerate(texts)
+            if text and text.strip()
+        ]
+
+        keys = {index: self._cache_key(text) for index, text in pending}
+        cached = self.cache.get_many(keys.values()) if self.cache is not None else {}
+
+        # Score each distinct uncached text once; copies reuse its result.
+        first_index: Dict[str, int] = {}
+        duplicates: Dict[int, int] = {}
+        to_score = []
+        for index, text in pending:
+            key = keys[index]
+            if key in cached:
+                results[index] = SentimentResult(*cached[key])
+            elif key in first_index:
+                duplicates[index] = first_index[key]
+            else:
+                first_index[key] = index
+                to_score.append((index, text))
+
+        chunks = [
+            to_score[offset : offset + batch_size]
+            for offset in range(0, len(to_score), batch_size)
+        ]
+        fallbacks = 0
+        for chunk, (scored, dropped) in zip(
+            chunks, self.pool.imap(self._score_chunk, chunks)
+        ):
+            fallbacks += dropped
+            for (index, _), result in zip(chunk, scored):
+                results[index] = result
+
+        for index, source in duplicates.items():
+            results[index] = results[source]
+
+        if self.cache is not None:
+            self.cache.put_many(
+                {
+                    keys[index]: self._scores(result)
+                    for index, _ in to_score
+                    if (result := results[index]) is not None
+                }
+            )
+
+        if fallbacks:
+            logger.warning(
+                f"{fallbacks} of {len(to_score)} texts were missing from batch "
+                "responses and were analyzed individually."
+            )
+        return results
+
+    def _cache_key(self, text: str) -> str:
+        """
+        Content-addressed key of a text for the configured model and prompts.
+        """
+        model = getattr(self.client, "model", "")
+        return cache_key(text, str(model), SENTIMENT_PROMPT_VERSION)
+
+    @staticmethod
+    def _scores(result: SentimentResult) -> Tuple[float, float, float]:
+        """
+        Cacheable (sentiment, impact, confidence) tuple of a result.
+        """
+        return result.sentiment_score, result.impact_score, result.confidence
+
+    def _score_chunk(
+        self, chunk: List[Tuple[int, str]]
+    ) -> Tuple[List[Optional[SentimentResult]], int]:
+        """
+        Score one chunk of (index, text) pairs (runs on a pool worker).
+
+        Only entries missing from a successful batch response are retried
+        singly; if the batch request itself fails (error or timeout), the whole
+        chunk is None, so an Ollama outage does not multiply the request load.
+
+        Returns:
+            Tuple[List[Optional[SentimentResult]], int]: Results in chunk order,
+                and the number of entries that needed the single-text fallback.
+        """
+        texts = [text for _, text in chunk]
+        if len(texts) == 1:
+            return [self.analyze(texts[0])], 0
+
+        scored = self._score_batch(texts)
+        if scored is None:
+            logger.warning(f"Batch request for {len(texts)} texts failed.")
+            return [None] * len(texts), 0
+
+        dropped = 0
+        for position, result in enumerate(scored):
+            if result is None:
+                dropped += 1
+                scored[position] = self.analyze(texts[position])
+        return scored, dropped
+
+    def _score_batch(
+        self, texts: List[str]
+    ) -> Optional[List[Optional[SentimentResult]]]:
+        """
+        Score several texts in one request.
+
+        Returns None if the request failed, otherwise one result per text
+        (None for entries not returned or without all score keys).
+        """
+        items = "\n".join(
+            f"{i}. {json.dumps(text, ensure_ascii=False)}"
+            for i, text in enumerate(texts, start=1)
+        )
+        prompt = SENTIMENT_BATCH_USER_PROMPT_TEMPLATE.format(
+            count=len(texts), items=items
+        )
+
+        try:
+            response_data = self.client.generate(
+                prompt=prompt,
+                system_prompt=SENTIMENT_BATCH_SYSTEM_PROMPT,
+                format="json",
+                options={"num_predict": BATCH_TOKENS_PER_ITEM * (len(texts) + 1)},
+                timeout=self.request_timeout,
+            )
+        except Exception as e:
+            logger.exception(f"Batch sentiment analysis failed: {e}")
+            return None
+
+        if not response_data:
+            return None
+
+        entries = self._batch_entries(response_data)
+
+        # Match entries by 'id'; fall back to position only for complete answers.
+        by_id: Dict[int, Dict[str, Any]] = {}
+        for position, entry in enumerate(entries, start=1):
+            try:
+                key = int(entry["id"])
+            except (KeyError, TypeError, ValueError):
+                if len(entries) != len(texts):
+                    continue
+                key = position
+            by_id.setdefault(key, entry)
+
+        return [
+            self._parse_response(by_id[i]) if i in by_id else None
+            for i in range(1, len(texts) + 1)
+        ]
+
+    @staticmethod
+    def _batch_entries(data: Any) -> List[Dict[str, Any]]:
+        """
+        Extract the per-headline entries from a batch response.
+
+        Accepts {"results": [...]}, any object holding a single list, or a bare list.
+        """
+        if isinstance(data, dict):
+            lists = [value for value in data.values() if isinstance(value, list)]
+            data = data.get("results", lists[0] if lists else [])
+        if not isinstance(data, list):
+            return []
+        return [entry for entry in data if isinstance(entry, dict)]
+
     def _parse_response(self, data: Dict[str, Any]) -> Optional[SentimentResult]:
         """
         Validate and parse the raw JSON response from the LLM.
+
+        Responses missing any of SCORE_KEYS (e.g. a bare {"id": 1} entry or a
+        {"results": [...]} wrapper) are rejected rather than scored as neutral,
+        since results are cached for the lifetime of the model/prompt.
         """
+        missing = [key for key in SCORE_KEYS if key not in data]
+        if missing:
+            logger.error(f"LLM response is missing {missing}: {data}")
+            return None
+
         try:
-            sentiment = float(data.get("sentiment_score", 0.0))
-            impact = float(data.get("impact_score", 0.0))
-            confidence = float(data.get("confidence", 0.0))
+            sentiment = float(data["sentiment_score"])
+            impact = float(data["impact_score"])
+            confidence = float(data["confidence"])
 
             # Clamp values to valid ranges
             sentiment = max(-1.0, min(1.0, sentiment))
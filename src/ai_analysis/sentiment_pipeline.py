@@ -0,0 +1,349 @@
+"""
+News-to-Sentiment Pipeline.
+
+This module connects the news fetchers to the SentimentAnalyzer and the
+'market_sentiment' writer as four concurrent stages joined by bounded queues:
+
+    fetch (thread pool) -> dedupe/batch -> score (LLM) -> write (DB)
+
+- Fetch: one task per (asset, source) job, `fetch_workers` at a time.
+- Dedupe/batch: drops syndicated copies (same normalized headline for an
+  asset) and primary-key collisions, and groups articles into batches.
+- Score: `SentimentAnalyzer.analyze_batch` per batch (itself concurrent).
+- Write: one `write(rows)` call per batch (e.g. a single upsert + commit).
+
+Every queue holds at most `queue_size` items, so memory stays bounded while
+fetching and writing overlap with inference: fetchers only wait once
+`queue_size` batches are already waiting to be scored. The first stage
+error stops all stages and is re-raised from `run`.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.ai_analysis.sentiment_cache import normalize_text
+from src.ai_analysis.sentiment_engine import SentimentAnalyzer, SentimentResult
+from src.data_ingestion.news.base_news import BaseNewsFetcher, NewsArticle
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Width of market_sentiment.source (VARCHAR(50)).
+SOURCE_MAX_LENGTH = 50
+
+# Marks the end of a stage's output.
+_DONE = object()
+
+
+class _Aborted(Exception):
+    """Raised inside a stage when another stage has failed."""
+
+
+@dataclass(frozen=True)
+class NewsJob:
+    """
+    One fetch task: news for one asset from one source.
+
+    Attributes:
+        asset_id (int): Asset the articles are attributed to.
+        source (str): Key of the fetcher to use (e.g., 'CRYPTOPANIC').
+        query (Optional[str]): Symbol/keyword passed to `fetch_news`.
+        limit (int): Maximum number of articles to fetch.
+    """
+
+    asset_id: int
+    source: str
+    query: Optional[str]
+    limit: int = 50
+
+
+@dataclass
+class PipelineStats:
+    """
+    Counters of one pipeline run (used for the final summary).
+    """
+
+    jobs: int = 0
+    failed_jobs: int = 0
+    fetched: int = 0
+    duplicates: int = 0
+    scored: int = 0
+    unscored: int = 0
+    written: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+class SentimentPipeline:
+    """
+    Staged, bounded-queue pipeline from news fetchers to 'market_sentiment'.
+    """
+
+    def __init__(
+        self,
+        fetchers: Dict[str, BaseNewsFetcher],
+        analyzer: SentimentAnalyzer,
+        write: Callable[[List[Dict[str, Any]]], int],
+        batch_size: int = 100,
+        queue_size: int = 8,
+        fetch_workers: int = 4,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            fetchers (Dict[str, BaseNewsFetcher]): Fetchers by job source key.
+            analyzer (SentimentAnalyzer): Scorer for the headlines.
+            write (Callable[[List[Dict[str, Any]]], int]): Persists one batch of
+                market_sentiment rows and returns the number written
+                (called from a single writer thread).
+            batch_size (int): Articles per scoring/write batch.
+            queue_size (int): Capacity of each inter-stage queue.
+            fetch_workers (int): Concurrent fetch jobs.
+
+        Raises:
+            ValueError: If batch_size, queue_size or fetch_workers is not positive.
+        """
+        if min(batch_size, queue_size, fetch_workers) <= 0:
+            raise ValueError(
+                "batch_size, queue_size and fetch_workers must be positive."
+            )
+
+        self.fetchers = {key.upper(): fetcher for key, fetcher in fetchers.items()}
+        self.analyzer = analyzer
+        self.write = write
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.fetch_workers = fetch_workers
+
+        self._abort = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._error_lock = threading.Lock()
+
+    def run(self, jobs: Iterable[NewsJob]) -> PipelineStats:
+        """
+        Fetch, deduplicate, score and write the news of all jobs.
+
+        Args:
+            jobs (Iterable[NewsJob]): Fetch tasks.
+
+        Returns:
+            PipelineStats: Counters of the run.
+
+        Raises:
+            ValueError: If a job refers to an unknown source.
+            RuntimeError: If a stage fails (rows written by earlier batches are kept).
+        """
+        jobs = list(jobs)
+        unknown = {job.source.upper() for job in jobs} - set(self.fetchers)
+        if unknown:
+            raise ValueError(f"No fetcher configured for source(s): {sorted(unknown)}")
+
+        self._abort.clear()
+        self._error = None
+        stats = PipelineStats(jobs=len(jobs))
+        started = time.perf_counter()
+
+        articles: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        batches: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+        scored: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_size)
+
+        threads = [
+            self._start("news-fetch", self._fetch_stage, jobs, articles),
+            self._start("news-dedupe", self._dedupe_stage, articles, batches, stats),
+            self._start("news-write", self._write_stage, scored, stats),
+        ]
+        try:
+            self._score_stage(batches, scored, stats)
+        except _Aborted:
+            pass
+        except Exception as e:
+            self._fail(e)
+
+        for thread in threads:
+            thread.join()
+        stats.seconds = time.perf_counter() - started
+
+        error = self._error
+        if error is not None:
+            raise RuntimeError(f"Sentiment pipeline failed: {error}") from error
+        return stats
+
+    # --------------------------------------------------------------------------
+    # Stages
+    # --------------------------------------------------------------------------
+    def _fetch_stage(self, jobs: List[NewsJob], out: "queue.Queue[Any]") -> None:
+        """Run the fetch jobs concurrently; emits (job, articles or None)."""
+
+        def fetch(job: NewsJob) -> None:
+            if self._abort.is_set():
+                return
+            fetcher = self.fetchers[job.source.upper()]
+            try:
+                found: Optional[List[NewsArticle]] = fetcher.fetch_news(
+                    job.query, job.limit
+                )
+            except Exception as e:
+                logger.error(f"{job.source} fetch for '{job.query}' failed: {e}")
+                found = None
+            self._put(out, (job, found))
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.fetch_workers, thread_name_prefix="news-fetch"
+        )
+        try:
+            for future in [executor.submit(fetch, job) for job in jobs]:
+                future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        self._put(out, _DONE)
+
+    def _dedupe_stage(
+        self, source: "queue.Queue[Any]", out: "queue.Queue[Any]", stats: PipelineStats
+    ) -> None:
+        """Drop duplicate articles and group the rest into batches."""
+        seen_headlines: Set[Tuple[int, str]] = set()
+        seen_keys: Set[Tuple[datetime, int, str]] = set()
+        batch: List[Tuple[int, NewsArticle]] = []
+
+        while (item := self._get(source)) is not _DONE:
+            job, found = item
+            if found is None:
+                stats.failed_jobs += 1
+                continue
+
+            for article in found:
+                stats.fetched += 1
+                headline = (job.asset_id, normalize_text(article.title))
+                key = (
+                    article_time(article),
+                    job.asset_id,
+                    article.source[:SOURCE_MAX_LENGTH],
+                )
+                if headline in seen_headlines or key in seen_keys:
+                    stats.duplicates += 1
+                    continue
+                seen_headlines.add(headline)
+                seen_keys.add(key)
+
+                batch.append((job.asset_id, article))
+                if len(batch) >= self.batch_size:
+                    self._put(out, batch)
+                    batch = []
+
+        if batch:
+            self._put(out, batch)
+        self._put(out, _DONE)
+
+    def _score_stage(
+        self, source: "queue.Queue[Any]", out: "queue.Queue[Any]", stats: PipelineStats
+    ) -> None:
+        """Score each batch and convert it to market_sentiment rows."""
+        try:
+            while (batch := self._get(source)) is not _DONE:
+                results = self.analyzer.analyze_batch(
+                    [article.title for _, article in batch]
+                )
+                rows = [
+                    sentiment_row(asset_id, article, result)
+                    for (asset_id, article), result in zip(batch, results)
+                    if result is not None
+                ]
+                stats.scored += len(rows)
+                stats.unscored += len(batch) - len(rows)
+                if rows:
+                    self._put(out, rows)
+        finally:
+            if not self._abort.is_set():
+                self._put(out, _DONE)
+
+    def _write_stage(self, source: "queue.Queue[Any]", stats: PipelineStats) -> None:
+        """Persist each scored batch with one `write` call."""
+        while (rows := self._get(source)) is not _DONE:
+            stats.written += self.write(rows)
+            stats.batches += 1
+            logger.info(
+                f"Wrote batch #{stats.batches} ({len(rows)} rows, "
+                f"{stats.written} total) into market_sentiment."
+            )
+
+    # --------------------------------------------------------------------------
+    # Stage plumbing
+    # --------------------------------------------------------------------------
+    def _start(
+        self, name: str, target: Callable[..., None], *args: Any
+    ) -> threading.Thread:
+        """Run a stage in a thread; its first error aborts the pipeline."""
+
+        def run() -> None:
+            try:
+                target(*args)
+            except _Aborted:
+                pass
+            except Exception as e:
+                self._fail(e)
+
+        thread = threading.Thread(target=run, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    def _fail(self, error: BaseException) -> None:
+        """Record the first stage error and stop all stages."""
+        with self._error_lock:
+            if self._error is None:
+                logger.error(f"Sentiment pipeline stage failed: {error}")
+                self._error = error
+        self._abort.set()
+
+    def _put(self, target: "queue.Queue[Any]", item: Any) -> None:
+        """Blocking put that gives up when the pipeline is aborted."""
+        while not self._abort.is_set():
+            try:
+                target.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise _Aborted()
+
+    def _get(self, source: "queue.Queue[Any]") -> Any:
+        """Blocking get that gives up when the pipeline is aborted."""
+        while not self._abort.is_set():
+            try:
+                return source.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        raise _Aborted()
+
+
+def article_time(article: NewsArticle) -> datetime:
+    """
+    Publication time of an article as an aware UTC datetime (naive = UTC).
+    """
+    published = article.published_at
+    if published.tzinfo is None:
+        return published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
+
+
+def sentiment_row(
+    asset_id: int, article: NewsArticle, result: SentimentResult
+) -> Dict[str, Any]:
+    """
+    Build one market_sentiment row from an article and its SentimentResult.
+    """
+    return {
+        "time": article_time(article),
+        "asset_id": asset_id,
+        "source": article.source[:SOURCE_MAX_LENGTH],
+        "headline": article.title.strip(),
+        "sentiment_score": result.sentiment_score,
+        "impact_score": result.impact_score,
+        "confidence": result.confidence,
+        "topics": None,
+    }
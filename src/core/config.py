@@ -48,6 +48,10 @@ class Settings(BaseSettings):
     
     # Timeout in seconds (LLMs can be slow)
     OLLAMA_TIMEOUT: float = 60.0
+
+    # Concurrent inference requests. Keep equal to the server's
+    # OLLAMA_NUM_PARALLEL: more only queues on the server, fewer idles the GPU.
+    OLLAMA_NUM_PARALLEL: int = 4
     
     # --------------------------------------------------------------------------
     # News & Sentiment Data Providers [NEW]
@@ -66,6 +70,46 @@ class Settings(BaseSettings):
     GOOGLE_NEWS_PERIOD: str = "7d"    # Lookback period (e.g., 7d = 7 days)
     GOOGLE_NEWS_MAX_RESULTS: int = 50 # Default limit
 
+    # --------------------------------------------------------------------------
+    # Exchange Market Metadata Cache
+    # --------------------------------------------------------------------------
+    # On-disk cache of CCXT load_markets() results (skips a multi-MB download per run)
+    MARKET_CACHE_DIR: str = ".cache/markets"
+    MARKET_CACHE_TTL: int = 86400     # Seconds before cached markets are re-downloaded
+
+    # --------------------------------------------------------------------------
+    # HTTP Clients (Shared Session Factory, see src/core/http.py)
+    # --------------------------------------------------------------------------
+    HTTP_POOL_SIZE: int = 10          # Keep-alive connections per host
+    HTTP_RETRIES: int = 3             # Retries on connection errors / 429 / 5xx
+    HTTP_BACKOFF_FACTOR: float = 0.3  # Exponential backoff base (seconds)
+    HTTP_CONNECT_TIMEOUT: float = 5.0 # Default timeouts (seconds) when a call
+    HTTP_READ_TIMEOUT: float = 30.0   # does not pass its own
+
+    # --------------------------------------------------------------------------
+    # Rate Limiting (Outbound API Budgets)
+    # --------------------------------------------------------------------------
+    # 'memory': shared by threads of one process.
+    # 'sqlite': shared by all processes on this host via a local SQLite file.
+    RATE_LIMIT_BACKEND: Literal["memory", "sqlite"] = "memory"
+    RATE_LIMIT_DB_PATH: str = ".cache/rate_limits.sqlite"
+
+    # --------------------------------------------------------------------------
+    # Sentiment Result Cache
+    # --------------------------------------------------------------------------
+    # Scores keyed by hash(normalized headline, model, prompt version): SQLite
+    # file on disk with an in-memory LRU of the most recent entries in front.
+    SENTIMENT_CACHE_PATH: str = ".cache/sentiment.sqlite"
+    SENTIMENT_CACHE_MEMORY_ENTRIES: int = 10000
+
+    # --------------------------------------------------------------------------
+    # OHLCV Read-Through Cache
+    # --------------------------------------------------------------------------
+    # Closed months of candles are kept as memory-mapped Arrow files per
+    # (asset, interval, month); least recently used files are evicted above the cap.
+    OHLCV_CACHE_DIR: str = ".cache/ohlcv"
+    OHLCV_CACHE_MAX_BYTES: int = 2 * 1024**3
+
     # --------------------------------------------------------------------------
     # Pydantic Configuration
     # --------------------------------------------------------------------------
@@ -0,0 +1,162 @@
+"""
+Shared HTTP Session Factory.
+
+Every outbound REST client (Ollama, CryptoPanic, future fetchers) gets its
+`requests.Session` from here, so all of them share one tuned setup:
+
+- Keep-alive connection pools sized for the caller's concurrency, so requests
+  after the first skip TCP/TLS setup.
+- A urllib3 retry policy with exponential backoff for connection errors and
+  transient 429/5xx responses (idempotent methods only; 'Retry-After' honored).
+- A default (connect, read) timeout applied to requests that do not pass one,
+  so no call can hang forever.
+
+Sessions are thread-safe for concurrent requests. `get_session` returns a
+process-wide session per name (like `get_rate_limiter`), so short-lived fetcher
+instances reuse warm connections.
+
+Example:
+    session = get_session("CRYPTOPANIC")
+    response = session.get(url, params=params)
+"""
+
+import logging
+import threading
+from typing import Any, Collection, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.core.config import settings
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# (connect, read) seconds, or one value for both (as accepted by requests).
+Timeout = Union[float, Tuple[float, float]]
+
+# Transient statuses worth retrying (rate limited / upstream unavailable).
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that applies a default timeout to requests sent without one.
+    """
+
+    def __init__(self, *args: Any, timeout: Optional[Timeout] = None, **kwargs: Any):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[None, str, Tuple[str, str]] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        return super().send(
+            request,
+            stream=stream,
+            timeout=self.timeout if timeout is None else timeout,
+            verify=verify,
+            cert=cert,
+            proxies=proxies,
+        )
+
+
+def create_session(
+    pool_size: Optional[int] = None,
+    retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    timeout: Optional[Timeout] = None,
+    status_forcelist: Collection[int] = RETRY_STATUSES,
+) -> requests.Session:
+    """
+    Create a new pooled session with retries and a default timeout.
+
+    Args:
+        pool_size (Optional[int]): Keep-alive connections per host (set it to
+            the number of threads sharing the session).
+            Defaults to settings.HTTP_POOL_SIZE.
+        retries (Optional[int]): Retries per request (0 disables them).
+            Defaults to settings.HTTP_RETRIES.
+        backoff_factor (Optional[float]): Exponential backoff base in seconds.
+            Defaults to settings.HTTP_BACKOFF_FACTOR.
+        timeout (Optional[Timeout]): Default timeout. Defaults to
+            (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT).
+        status_forcelist (Collection[int]): Response statuses to retry.
+
+    Returns:
+        requests.Session: The configured session (owned by the caller).
+
+    Raises:
+        ValueError: If pool_size is not positive or retries is negative.
+    """
+    pool_size = settings.HTTP_POOL_SIZE if pool_size is None else pool_size
+    retries = settings.HTTP_RETRIES if retries is None else retries
+    if pool_size <= 0 or retries < 0:
+        raise ValueError("pool_size must be positive and retries non-negative.")
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=(
+            settings.HTTP_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        ),
+        status_forcelist=tuple(status_forcelist),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = TimeoutHTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+        timeout=timeout or (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT),
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_registry: Dict[str, requests.Session] = {}
+_registry_lock = threading.Lock()
+
+
+def get_session(name: str, **kwargs: Any) -> requests.Session:
+    """
+    Return the shared session registered under `name`, creating it on first use.
+
+    Args:
+        name (str): Client identifier (e.g., 'CRYPTOPANIC').
+        **kwargs: `create_session` options (only used on first use).
+
+    Returns:
+        requests.Session: The process-wide session instance.
+    """
+    key = name.upper()
+    with _registry_lock:
+        session = _registry.get(key)
+        if session is None:
+            session = create_session(**kwargs)
+            _registry[key] = session
+            logger.debug(f"Created shared HTTP session '{key}'.")
+        return session
+
+
+def close_sessions() -> None:
+    """
+    Close and forget all shared sessions (e.g., at process shutdown).
+    """
+    with _registry_lock:
+        sessions = list(_registry.values())
+        _registry.clear()
+    for session in sessions:
+        session.close()
@@ -0,0 +1,217 @@
+"""
+OHLCV Resampling Module.
+
+This module derives higher timeframes (e.g., 5m/1h/4h/1d) from a base candle
+frame (typically 1m) in-process, so every additional interval costs zero extra
+API calls.
+
+Aggregation is fully vectorized: candles are assigned to buckets with integer
+arithmetic on epoch nanoseconds, and each OHLCV field is reduced per contiguous
+bucket segment with NumPy `ufunc.reduceat` (no per-bucket Python loop).
+
+Bucket alignment matches exchange conventions: intervals that divide a day are
+aligned to UTC midnight; weekly candles open on Monday 00:00 UTC.
+
+Example:
+    frames = derive_intervals(df_1m, "1m", ["5m", "1h", "1d"])
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.timeframes import interval_to_timedelta
+
+OHLCV_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+
+_DAY = timedelta(days=1)
+_WEEK = timedelta(weeks=1)
+# The Unix epoch is a Thursday; weekly buckets are shifted to open on Monday
+# (matching exchange weekly candles, see BinanceFetcher.iter_ohlcv_parallel).
+WEEK_OFFSET = timedelta(days=4)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_ns(delta: timedelta) -> int:
+    """Convert a timedelta to integer nanoseconds."""
+    return (delta // timedelta(microseconds=1)) * 1_000
+
+
+def _bucket_spec(interval: str, base_interval: str) -> Tuple[timedelta, timedelta]:
+    """
+    Validate a derived interval against the base interval.
+
+    Returns:
+        Tuple[timedelta, timedelta]: (bucket size, bucket offset from the epoch).
+
+    Raises:
+        ValueError: If the interval cannot be built exactly from base candles.
+    """
+    step = interval_to_timedelta(interval)
+    base = interval_to_timedelta(base_interval)
+
+    if step < base or step % base:
+        raise ValueError(
+            f"Cannot derive '{interval}' from '{base_interval}' candles: "
+            "the interval must be a whole multiple of the base interval."
+        )
+
+    if step <= _DAY and not _DAY % step:
+        return step, timedelta(0)
+    if step == _WEEK:
+        return step, WEEK_OFFSET
+
+    raise ValueError(
+        f"Unsupported derived interval '{interval}': only intervals that divide "
+        "a day, or one week, have a fixed bucket alignment."
+    )
+
+
+def check_derivable(base_interval: str, intervals: Iterable[str]) -> None:
+    """
+    Validate that every interval can be derived exactly from base candles.
+
+    Args:
+        base_interval (str): Interval of the source candles.
+        intervals (Iterable[str]): Derived intervals.
+
+    Raises:
+        ValueError: On the first interval that cannot be derived.
+    """
+    for interval in intervals:
+        _bucket_spec(interval, base_interval)
+
+
+def bucket_start(time: datetime, interval: str, base_interval: str = "1m") -> datetime:
+    """
+    Floor a timestamp to the open time of its bucket.
+
+    Args:
+        time (datetime): UTC-aware timestamp.
+        interval (str): Derived interval (e.g., '1h').
+        base_interval (str): Interval of the source candles.
+
+    Returns:
+        datetime: Open time of the bucket containing `time`.
+    """
+    step, offset = _bucket_spec(interval, base_interval)
+    return time - (time - _EPOCH - offset) % step
+
+
+def align_start(start: datetime, intervals: Iterable[str], base_interval: str = "1m") -> datetime:
+    """
+    Move a fetch start back to a bucket boundary of EVERY derived interval.
+
+    Fetching from this point guarantees the first bucket of each derived
+    interval is complete (see `drop_partial_head`).
+
+    Args:
+        start (datetime): Requested fetch start (UTC).
+        intervals (Iterable[str]): Derived intervals.
+        base_interval (str): Interval of the fetched candles.
+
+    Returns:
+        datetime: The latest time <= `start` aligned to all intervals.
+
+    Raises:
+        ValueError: If an interval cannot be derived from `base_interval`.
+    """
+    intervals = list(intervals)
+    aligned = start
+    # Floors only move backwards and UTC Monday midnight is a common boundary,
+    # so this reaches a fixed point within a few iterations.
+    while True:
+        floored = min(
+            (bucket_start(aligned, interval, base_interval) for interval in intervals),
+            default=aligned,
+        )
+        if floored == aligned:
+            return aligned
+        aligned = floored
+
+
+def resample_ohlcv(
+    df: pd.DataFrame,
+    interval: str,
+    base_interval: str = "1m",
+    drop_partial_head: bool = True,
+) -> pd.DataFrame:
+    """
+    Aggregate base candles into candles of a higher timeframe.
+
+    open = first, high = max, low = min, close = last, volume = sum, per bucket.
+    The newest bucket may still be forming; it is kept (like the forming base
+    candle) and completed by the next run's upsert.
+
+    Args:
+        df (pd.DataFrame): Base candles with columns time (UTC), open, high, low,
+                           close, volume. Unique times, any order.
+        interval (str): Target interval (e.g., '1h').
+        base_interval (str): Interval of `df` (e.g., '1m').
+        drop_partial_head (bool): Drop the first bucket if `df` starts after its open
+                                  time (it would overwrite a complete stored candle
+                                  with a partial one).
+
+    Returns:
+        pd.DataFrame: Derived candles with the same columns, sorted by time.
+
+    Raises:
+        ValueError: If `interval` cannot be derived from `base_interval`.
+    """
+    step, offset = _bucket_spec(interval, base_interval)
+    if df.empty:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+    if not df["time"].is_monotonic_increasing:
+        df = df.sort_values("time")
+
+    step_ns, offset_ns = _to_ns(step), _to_ns(offset)
+    ns = df["time"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+    buckets = (ns - offset_ns) // step_ns
+    # Index of the first candle of every bucket segment (input is sorted).
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(ns)] - 1
+
+    opens = buckets[starts] * step_ns + offset_ns
+
+    result = pd.DataFrame(
+        {
+            "time": pd.to_datetime(opens, utc=True),
+            "open": df["open"].to_numpy(dtype=np.float64)[starts],
+            "high": np.maximum.reduceat(df["high"].to_numpy(dtype=np.float64), starts),
+            "low": np.minimum.reduceat(df["low"].to_numpy(dtype=np.float64), starts),
+            "close": df["close"].to_numpy(dtype=np.float64)[ends],
+            "volume": np.add.reduceat(df["volume"].to_numpy(dtype=np.float64), starts),
+        }
+    )
+
+    if drop_partial_head and ns[0] != opens[0]:
+        result = result.iloc[1:].reset_index(drop=True)
+
+    return result
+
+
+def derive_intervals(
+    df: pd.DataFrame,
+    base_interval: str,
+    intervals: Iterable[str],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Build several higher timeframes from one base frame.
+
+    Args:
+        df (pd.DataFrame): Base candles (see `resample_ohlcv`).
+        base_interval (str): Interval of `df`.
+        intervals (Iterable[str]): Target intervals (the base interval itself is skipped).
+
+    Returns:
+        Dict[str, pd.DataFrame]: Derived candles per interval.
+    """
+    return {
+        interval: resample_ohlcv(df, interval, base_interval)
+        for interval in intervals
+        if interval != base_interval
+    }
@@ -0,0 +1,63 @@
+"""
+Timeframe Utilities.
+
+This module converts interval strings used across data sources
+(e.g., '1m', '4h', '1d' for Binance / '60m', '1wk', '1mo' for Yahoo Finance)
+into concrete durations, so pagination, gap detection and resampling logic
+can reason about candle spacing without source-specific code.
+"""
+
+import re
+from datetime import timedelta
+
+# Unit suffix -> duration of one unit.
+# Note: Months are approximated as 30 days (only used for window planning).
+_UNIT_DURATIONS = {
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+    "wk": timedelta(weeks=1),
+    "M": timedelta(days=30),
+    "mo": timedelta(days=30),
+}
+
+_INTERVAL_PATTERN = re.compile(r"^(\d+)(s|m|h|d|w|wk|M|mo)$")
+
+
+def interval_to_timedelta(interval: str) -> timedelta:
+    """
+    Convert an interval string into a timedelta.
+
+    Args:
+        interval (str): Timeframe string (e.g., '1m', '15m', '1h', '1d', '1wk').
+
+    Returns:
+        timedelta: The duration of a single candle.
+
+    Raises:
+        ValueError: If the interval string is not recognized.
+    """
+    match = _INTERVAL_PATTERN.match(interval.strip())
+    if not match:
+        raise ValueError(f"Unsupported interval: '{interval}'")
+
+    amount, unit = match.groups()
+    if int(amount) <= 0:
+        raise ValueError(f"Interval must be positive: '{interval}'")
+
+    return int(amount) * _UNIT_DURATIONS[unit]
+
+
+def interval_to_milliseconds(interval: str) -> int:
+    """
+    Convert an interval string into milliseconds (CCXT timestamp unit).
+
+    Args:
+        interval (str): Timeframe string (e.g., '1m', '1h').
+
+    Returns:
+        int: The duration of a single candle in milliseconds.
+    """
+    return int(interval_to_timedelta(interval).total_seconds() * 1000)
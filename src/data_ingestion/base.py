@@ -11,7 +11,7 @@ with the downstream processing pipeline.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Iterator
 
 import pandas as pd
 
@@ -74,6 +74,43 @@ class BaseDataFetcher(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_ohlcv(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lazily fetch historical OHLCV data as a stream of DataFrame batches.
+
+        This is the incremental counterpart of `fetch_ohlcv`: each yielded batch
+        (one API page / time window) is already normalized to the standardized
+        schema, so consumers can start loading or analyzing data before the
+        whole range has been downloaded, and memory stays bounded for long ranges.
+
+        Contract:
+            - Batches are yielded in ascending time order.
+            - Batches never overlap (no duplicate timestamps across batches).
+            - Empty batches are never yielded.
+
+        Args:
+            symbol (str): The instrument symbol (e.g., 'BTC/USDT', 'AAPL').
+            interval (str): Timeframe interval (e.g., '1h', '1d').
+            start_date (Optional[datetime]): Start time for fetching data.
+            end_date (Optional[datetime]): End time for fetching data.
+            limit (int): Maximum number of data points per batch.
+
+        Yields:
+            pd.DataFrame: A standardized OHLCV DataFrame batch.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        pass
+
     @abstractmethod
     def fetch_fundamental(self, symbol: str) -> Dict[str, Any]:
         """
@@ -88,12 +125,14 @@ class BaseDataFetcher(ABC):
         """
         pass
 
-    def validate_dataframe(self, df: pd.DataFrame) -> bool:
+    @staticmethod
+    def validate_dataframe(df: pd.DataFrame) -> bool:
         """
         Utility method to validate the structure of the returned DataFrame.
         
         This ensures that the concrete implementation returns data compatible
-        with the database schema.
+        with the database schema. Static so fetchers outside this hierarchy
+        (e.g. the asyncio Binance fetcher) apply the same check.
 
         Args:
             df (pd.DataFrame): The DataFrame to validate.
@@ -0,0 +1,295 @@
+"""
+Asynchronous Binance Data Fetcher Implementation.
+
+This module provides an asyncio-native counterpart of `BinanceFetcher` built on
+`ccxt.async_support`. It follows the same normalization contract as the
+synchronous fetcher (`fetch_ohlcv` / `fetch_fundamental` return identical
+structures) but allows hundreds of symbol/interval pairs to be pulled from a
+single event loop with bounded concurrency.
+
+All requests draw from the same process-wide Binance rate limiter as the
+synchronous fetcher, so mixing both in one process cannot exceed the budget.
+
+Dependencies:
+    - ccxt.async_support: Asynchronous unified exchange API (aiohttp based).
+    - pandas: For data structuring.
+
+Example:
+    async with AsyncBinanceFetcher(max_concurrency=32) as fetcher:
+        frames = await fetcher.fetch_many([("BTC/USDT", "1m"), ("ETH/USDT", "1h")], start)
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import ccxt
+import ccxt.async_support as ccxt_async
+import pandas as pd
+
+from src.data_ingestion.binance.binance_fetcher import (
+    BINANCE_KLINES_WEIGHT,
+    BINANCE_TICKER_WEIGHT,
+    BINANCE_WEIGHT_BUDGET,
+    normalize_ohlcv,
+    ticker_to_fundamentals,
+)
+from src.data_ingestion.base import BaseDataFetcher
+from src.data_ingestion.binance.market_cache import MarketCache, load_markets_cached_async
+from src.data_ingestion.rate_limiter import RateLimiter, get_rate_limiter
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Result of `fetch_many`: a DataFrame per pair, or the exception that pair raised.
+PairResult = Union[pd.DataFrame, BaseException]
+
+
+class AsyncBinanceFetcher:
+    """
+    Asynchronous data fetcher for Binance Exchange (Spot & Futures).
+
+    Must be used as an async context manager (or `await load()` / `await close()`
+    manually), because market loading and connection teardown are coroutines.
+
+    Attributes:
+        source_name (str): Identifier for the data source ('BINANCE').
+        exchange (ccxt_async.binance): The asynchronous CCXT exchange instance.
+        rate_limiter (RateLimiter): Shared REQUEST_WEIGHT budget for all Binance calls.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        use_futures: bool = False,
+        max_concurrency: int = 16,
+        exchange: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        market_cache: Optional[MarketCache] = None,
+        refresh_markets: bool = False,
+    ) -> None:
+        """
+        Initialize the asynchronous Binance fetcher.
+
+        Args:
+            api_key (Optional[str]): Binance API Key (required for private endpoints).
+            api_secret (Optional[str]): Binance API Secret.
+            use_futures (bool): If True, connects to Binance Futures API. Default is Spot.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            exchange (Optional[Any]): Pre-built async exchange instance (injectable for testing).
+            rate_limiter (Optional[RateLimiter]): Weight budget to draw from.
+                                                  Defaults to the process-wide Binance limiter.
+            market_cache (Optional[MarketCache]): Market metadata cache. Defaults to
+                                                  the settings-configured cache.
+            refresh_markets (bool): If True, bypass the cache and re-download markets.
+        """
+        self.source_name = "BINANCE"
+        self.api_key = api_key
+
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "BINANCE",
+            capacity=BINANCE_WEIGHT_BUDGET,
+            refill_per_second=BINANCE_WEIGHT_BUDGET / 60.0,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.market_cache = market_cache or MarketCache()
+        self._refresh_markets = refresh_markets
+        self._owns_exchange = exchange is None
+
+        if exchange is not None:
+            self.exchange = exchange
+        else:
+            self.exchange = ccxt_async.binance(
+                {
+                    "apiKey": api_key,
+                    "secret": api_secret,
+                    # Throttling is handled by the shared weight limiter instead.
+                    "enableRateLimit": False,
+                    "options": {"defaultType": "future" if use_futures else "spot"},
+                }
+            )
+
+    # --------------------------------------------------------------------------
+    # Lifecycle
+    # --------------------------------------------------------------------------
+    async def load(self) -> None:
+        """
+        Load markets so symbols can be resolved (required before fetching).
+
+        Served from the on-disk market cache when fresh; injected exchanges
+        are used as-is.
+        """
+        if not self._owns_exchange:
+            return
+        try:
+            await load_markets_cached_async(
+                self.exchange, self.market_cache, refresh=self._refresh_markets
+            )
+        except ccxt.BaseError as e:
+            raise RuntimeError(f"Failed to load Binance markets: {str(e)}") from e
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session (aiohttp)."""
+        await self.exchange.close()
+
+    async def __aenter__(self) -> "AsyncBinanceFetcher":
+        await self.load()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    # --------------------------------------------------------------------------
+    # Data Retrieval
+    # --------------------------------------------------------------------------
+    async def fetch_ohlcv(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> pd.DataFrame:
+        """
+        Fetch OHLCV data from Binance with pagination support.
+
+        Pages of one symbol are requested sequentially (each page depends on
+        the previous one); concurrency comes from running many symbols at once.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            interval (str): Timeframe (e.g., '1m', '1h', '1d').
+            start_date (Optional[datetime]): Start time for fetching data.
+            end_date (Optional[datetime]): End time for fetching data.
+            limit (int): Number of candles to fetch per API call.
+
+        Returns:
+            pd.DataFrame: A standardized DataFrame containing OHLCV data.
+
+        Raises:
+            RuntimeError: If the API request fails or returns invalid data.
+        """
+        since: Optional[int] = None
+        if start_date:
+            since = int(start_date.timestamp() * 1000)
+
+        end_timestamp: Optional[int] = None
+        if end_date:
+            end_timestamp = int(end_date.timestamp() * 1000)
+
+        all_ohlcv: List[List[Union[int, float]]] = []
+
+        # ---------------------------------------------------------
+        # Pagination Loop
+        # ---------------------------------------------------------
+        while True:
+            batch = await self._fetch_page(symbol, interval, since, limit)
+            if not batch:
+                break
+
+            all_ohlcv.extend(batch)
+            last_timestamp = int(batch[-1][0])
+
+            if end_timestamp and last_timestamp >= end_timestamp:
+                break
+            if len(batch) < limit:
+                break
+
+            since = last_timestamp + 1
+
+        if not all_ohlcv:
+            return pd.DataFrame()
+
+        df = normalize_ohlcv(all_ohlcv, end_timestamp)
+
+        # Same schema check as the synchronous fetcher
+        BaseDataFetcher.validate_dataframe(df)
+
+        return df
+
+    async def fetch_fundamental(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch 'fundamental-like' data (24h ticker statistics) for a trading pair.
+
+        Args:
+            symbol (str): Trading pair symbol.
+
+        Returns:
+            Dict[str, Any]: Dictionary containing ticker statistics (e.g., 24h volume).
+
+        Raises:
+            RuntimeError: If the ticker data cannot be retrieved.
+        """
+        async with self._semaphore:
+            await self.rate_limiter.acquire_async(BINANCE_TICKER_WEIGHT)
+            try:
+                ticker: Dict[str, Any] = await self.exchange.fetch_ticker(symbol)
+            except ccxt.BaseError as e:
+                raise RuntimeError(
+                    f"Failed to fetch ticker for {symbol}: {str(e)}"
+                ) from e
+
+        return ticker_to_fundamentals(symbol, ticker)
+
+    async def fetch_many(
+        self,
+        pairs: Sequence[Tuple[str, str]],
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> Dict[Tuple[str, str], PairResult]:
+        """
+        Fetch OHLCV data for many (symbol, interval) pairs concurrently.
+
+        A failure in one pair never cancels the others: its exception is
+        returned in place of the DataFrame.
+
+        Args:
+            pairs (Sequence[Tuple[str, str]]): (symbol, interval) pairs to fetch.
+            start_date (Optional[datetime]): Start time for fetching data.
+            end_date (Optional[datetime]): End time for fetching data.
+            limit (int): Number of candles to fetch per API call.
+
+        Returns:
+            Dict[Tuple[str, str], PairResult]: DataFrame (or exception) per pair.
+        """
+        results = await asyncio.gather(
+            *(
+                self.fetch_ohlcv(symbol, interval, start_date, end_date, limit)
+                for symbol, interval in pairs
+            ),
+            return_exceptions=True,
+        )
+        return dict(zip(pairs, results))
+
+    async def _fetch_page(
+        self, symbol: str, interval: str, since: Optional[int], limit: int
+    ) -> List[List[Union[int, float]]]:
+        """
+        Perform a single rate-limited klines request within the concurrency bound.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        async with self._semaphore:
+            await self.rate_limiter.acquire_async(BINANCE_KLINES_WEIGHT)
+            try:
+                batch: List[List[Union[int, float]]] = await self.exchange.fetch_ohlcv(
+                    symbol=symbol,
+                    timeframe=interval,
+                    since=since,
+                    limit=limit,
+                )
+                return batch
+            except ccxt.BaseError as e:
+                raise RuntimeError(
+                    f"Failed to fetch data from Binance for {symbol}: {str(e)}"
+                ) from e
@@ -6,20 +6,109 @@ from the Binance exchange using the CCXT library. It inherits from the
 abstract BaseDataFetcher to ensure consistency with the system's architecture.
 
 The implementation handles pagination to support fetching large historical datasets
-exceeding the exchange's API limits per request.
+exceeding the exchange's API limits per request. For long backfills, the range can
+also be split into disjoint shards that are fetched concurrently, with all requests
+drawing from one shared, weight-aware rate limiter (Binance REQUEST_WEIGHT budget).
 
 Dependencies:
     - ccxt: For unified exchange API handling.
     - pandas: For data structuring.
 """
 
-from datetime import datetime
-from typing import Optional, List, Any, Dict, Union
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Any, Deque, Dict, Iterator, Tuple, Union
 
 import ccxt
 import pandas as pd
 
+from src.core.resample import WEEK_OFFSET
+from src.core.timeframes import interval_to_milliseconds
 from src.data_ingestion.base import BaseDataFetcher
+from src.data_ingestion.binance.market_cache import MarketCache, load_markets_cached
+from src.data_ingestion.rate_limiter import RateLimiter, get_rate_limiter
+
+# ------------------------------------------------------------------------------
+# Binance Request Weight Budget
+# ------------------------------------------------------------------------------
+# Binance allows 6,000 REQUEST_WEIGHT per minute per IP. We keep a safety margin
+# so other tools sharing the IP (or clock skew) do not trigger HTTP 429/418 bans.
+BINANCE_WEIGHT_PER_MINUTE = 6000
+BINANCE_WEIGHT_BUDGET = int(BINANCE_WEIGHT_PER_MINUTE * 0.8)
+
+# Request weights of the endpoints used by this fetcher (GET /api/v3/...).
+BINANCE_KLINES_WEIGHT = 2
+BINANCE_TICKER_WEIGHT = 2
+
+
+def normalize_ohlcv(
+    rows: List[List[Union[int, float]]],
+    end_timestamp: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Convert raw CCXT candles into the standardized OHLCV schema.
+
+    Shared by the synchronous and asynchronous Binance fetchers so both honor
+    the same normalization contract.
+
+    Args:
+        rows (List[List[Union[int, float]]]): Raw [timestamp_ms, o, h, l, c, v] rows.
+        end_timestamp (Optional[int]): Inclusive upper bound (ms) to clip overshoot.
+
+    Returns:
+        pd.DataFrame: A standardized DataFrame containing OHLCV data.
+    """
+    # ---------------------------------------------------------
+    # Data Normalization
+    # ---------------------------------------------------------
+    # Convert to DataFrame
+    df = pd.DataFrame(
+        rows,
+        columns=["timestamp_ms", "open", "high", "low", "close", "volume"],
+    )
+
+    # Filter strictly by end_date if provided (to clip any overshoot)
+    if end_timestamp:
+        df = df[df["timestamp_ms"] <= end_timestamp]
+
+    # 1. Convert timestamp (ms) to datetime objects (UTC)
+    df["time"] = pd.to_datetime(df["timestamp_ms"], unit="ms", utc=True)
+
+    # 2. Drop the raw timestamp column
+    df = df.drop(columns=["timestamp_ms"])
+
+    # 3. Ensure column order matches the BaseDataFetcher schema
+    df = df[["time", "open", "high", "low", "close", "volume"]]
+
+    # 4. Remove duplicates based on time (safety check for pagination overlaps)
+    df = df.drop_duplicates(subset=["time"])
+
+    return df.reset_index(drop=True)
+
+
+def ticker_to_fundamentals(symbol: str, ticker: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extract the 'fundamental-like' metrics from a CCXT ticker payload.
+
+    Args:
+        symbol (str): Trading pair symbol.
+        ticker (Dict[str, Any]): Raw CCXT unified ticker.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing ticker statistics (e.g., 24h volume).
+    """
+    return {
+        "symbol": symbol,
+        "last_price": ticker.get("last"),
+        "24h_high": ticker.get("high"),
+        "24h_low": ticker.get("low"),
+        "24h_volume": ticker.get("baseVolume"),  # Volume in base asset
+        "24h_quote_volume": ticker.get("quoteVolume"),  # Volume in quote asset
+        "percentage_change": ticker.get("percentage"),
+        "timestamp": datetime.now(),
+    }
 
 
 class BinanceFetcher(BaseDataFetcher):
@@ -28,6 +117,7 @@ class BinanceFetcher(BaseDataFetcher):
 
     Attributes:
         exchange (ccxt.binance): The CCXT exchange instance.
+        rate_limiter (RateLimiter): Shared REQUEST_WEIGHT budget for all Binance calls.
     """
 
     def __init__(
@@ -35,31 +125,87 @@ class BinanceFetcher(BaseDataFetcher):
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         use_futures: bool = False,
+        exchange: Optional[ccxt.Exchange] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        market_cache: Optional[MarketCache] = None,
+        refresh_markets: bool = False,
+        lazy_markets: bool = False,
     ) -> None:
         """
         Initialize the Binance fetcher.
 
+        Market metadata is served from the on-disk cache (see market_cache.py)
+        and only downloaded when the cache is missing, stale or `refresh_markets`
+        is set.
+
         Args:
             api_key (Optional[str]): Binance API Key (required for private endpoints).
             api_secret (Optional[str]): Binance API Secret.
             use_futures (bool): If True, connects to Binance Futures API. Default is Spot.
+            exchange (Optional[ccxt.Exchange]): Pre-built exchange instance.
+                                                Injectable for testing (e.g., a fake exchange).
+            rate_limiter (Optional[RateLimiter]): Weight budget to draw from.
+                                                  Defaults to the process-wide Binance limiter.
+            market_cache (Optional[MarketCache]): Market metadata cache. Defaults to
+                                                  the settings-configured cache.
+            refresh_markets (bool): If True, bypass the cache and re-download markets.
+            lazy_markets (bool): If True, defer loading markets until the first request.
         """
         super().__init__(source_name="BINANCE", api_key=api_key)
 
+        # All requests go through one weight-aware limiter shared across threads,
+        # so concurrent shards/workers respect the budget collectively.
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "BINANCE",
+            capacity=BINANCE_WEIGHT_BUDGET,
+            refill_per_second=BINANCE_WEIGHT_BUDGET / 60.0,
+        )
+
+        self.market_cache = market_cache or MarketCache()
+        self._refresh_markets = refresh_markets
+        self._markets_lock = threading.Lock()
+        self._markets_loaded = False
+
+        if exchange is not None:
+            # Injected exchanges are used as-is (markets assumed ready).
+            self.exchange = exchange
+            self._markets_loaded = True
+            return
+
         # Configure CCXT options
         options: Dict[str, Any] = {
             "apiKey": api_key,
             "secret": api_secret,
-            "enableRateLimit": True,  # CCXT handles rate limiting automatically
+            # CCXT's built-in throttle only spaces calls per instance (and serializes
+            # threads); the shared weight limiter above replaces it.
+            "enableRateLimit": False,
             "options": {"defaultType": "future" if use_futures else "spot"},
         }
 
         # Initialize the exchange instance
         self.exchange = ccxt.binance(options)
 
-        # Load markets to ensure symbols are available
-        # This might take a moment on initialization
-        self.exchange.load_markets()
+        # Load markets to ensure symbols are available (cache hit: milliseconds)
+        if not lazy_markets:
+            self._ensure_markets()
+
+    def _ensure_markets(self) -> None:
+        """
+        Load market metadata once (thread-safe), preferring the on-disk cache.
+        """
+        if self._markets_loaded:
+            return
+
+        with self._markets_lock:
+            if self._markets_loaded:
+                return
+            try:
+                load_markets_cached(
+                    self.exchange, self.market_cache, refresh=self._refresh_markets
+                )
+            except ccxt.BaseError as e:
+                raise RuntimeError(f"Failed to load Binance markets: {str(e)}") from e
+            self._markets_loaded = True
 
     def fetch_ohlcv(
         self,
@@ -85,6 +231,46 @@ class BinanceFetcher(BaseDataFetcher):
         Returns:
             pd.DataFrame: A standardized DataFrame containing OHLCV data.
 
+        Raises:
+            RuntimeError: If the API request fails or returns invalid data.
+        """
+        pages = list(self.iter_ohlcv(symbol, interval, start_date, end_date, limit))
+
+        if not pages:
+            return pd.DataFrame()
+
+        df = pd.concat(pages, ignore_index=True)
+
+        # Remove duplicates based on time (safety check for pagination overlaps)
+        df.drop_duplicates(subset=["time"], inplace=True)
+
+        return df
+
+    def iter_ohlcv(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lazily fetch OHLCV data page by page.
+
+        Each yielded DataFrame holds at most `limit` normalized candles, so
+        consumers (e.g., chunked database loaders) can process arbitrarily long
+        ranges with flat memory usage.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            interval (str): Timeframe (e.g., '1m', '1h', '1d').
+            start_date (Optional[datetime]): Start time for fetching data.
+            end_date (Optional[datetime]): End time for fetching data.
+            limit (int): Number of candles to fetch per API call.
+
+        Yields:
+            pd.DataFrame: A standardized (non-empty) OHLCV page.
+
         Raises:
             RuntimeError: If the API request fails or returns invalid data.
         """
@@ -97,78 +283,233 @@ class BinanceFetcher(BaseDataFetcher):
         if end_date:
             end_timestamp = int(end_date.timestamp() * 1000)
 
-        all_ohlcv: List[List[Union[int, float]]] = []
-
         # ---------------------------------------------------------
         # Pagination Loop
         # ---------------------------------------------------------
         while True:
-            try:
-                # Fetch a batch of data using CCXT
-                # Structure: [[timestamp, open, high, low, close, volume], ...]
-                batch = self.exchange.fetch_ohlcv(
-                    symbol=symbol,
-                    timeframe=interval,
-                    since=since,
-                    limit=limit,
-                )
+            # Fetch a batch of data using CCXT
+            # Structure: [[timestamp, open, high, low, close, volume], ...]
+            batch = self._fetch_page(symbol, interval, since, limit)
 
-                if not batch:
-                    break
+            if not batch:
+                break
 
-                all_ohlcv.extend(batch)
+            page = self._normalize_ohlcv(batch, end_timestamp)
+            if not page.empty:
+                yield page
 
-                # Identify the timestamp of the last candle in the batch
-                last_timestamp = int(batch[-1][0])
+            # Identify the timestamp of the last candle in the batch
+            last_timestamp = int(batch[-1][0])
 
-                # Check termination conditions:
-                # 1. If we've reached or passed the end_date
-                if end_timestamp and last_timestamp >= end_timestamp:
-                    break
+            # Check termination conditions:
+            # 1. If we've reached or passed the end_date
+            if end_timestamp and last_timestamp >= end_timestamp:
+                break
 
-                # 2. If the batch size is smaller than the limit, we've reached the end
-                if len(batch) < limit:
-                    break
+            # 2. If the batch size is smaller than the limit, we've reached the end
+            if len(batch) < limit:
+                break
 
-                # Update 'since' for the next iteration.
-                # Adding 1ms ensures we don't re-fetch the exact same candle,
-                # preventing infinite loops on duplicate timestamps.
-                since = last_timestamp + 1
+            # Update 'since' for the next iteration.
+            # Adding 1ms ensures we don't re-fetch the exact same candle,
+            # preventing infinite loops on duplicate timestamps.
+            since = last_timestamp + 1
 
-            except ccxt.BaseError as e:
-                raise RuntimeError(
-                    f"Failed to fetch data from Binance for {symbol}: {str(e)}"
-                ) from e
+    def fetch_ohlcv_parallel(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+        max_workers: int = 4,
+    ) -> pd.DataFrame:
+        """
+        Fetch a historical range using concurrent, range-sharded requests.
+
+        Produces the same result as `fetch_ohlcv`, but issues up to `max_workers`
+        requests at a time instead of paginating serially. Throughput scales
+        near-linearly with `max_workers` until the shared weight budget is hit.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            interval (str): Timeframe (e.g., '1m', '1h', '1d').
+            start_date (datetime): Start time (required to plan the shards).
+            end_date (Optional[datetime]): End time. Defaults to now (UTC).
+            limit (int): Number of candles per request (shard size).
+            max_workers (int): Maximum number of concurrent requests.
+
+        Returns:
+            pd.DataFrame: A standardized DataFrame containing OHLCV data.
 
-        if not all_ohlcv:
+        Raises:
+            RuntimeError: If any shard request fails.
+        """
+        pages = list(
+            self.iter_ohlcv_parallel(
+                symbol, interval, start_date, end_date, limit, max_workers
+            )
+        )
+
+        if not pages:
             return pd.DataFrame()
 
-        # ---------------------------------------------------------
-        # Data Normalization
-        # ---------------------------------------------------------
-        # Convert to DataFrame
-        df = pd.DataFrame(
-            all_ohlcv,
-            columns=["timestamp_ms", "open", "high", "low", "close", "volume"],
+        # Stitch shards (already ordered) and de-duplicate shard boundaries.
+        df = pd.concat(pages, ignore_index=True)
+        df.drop_duplicates(subset=["time"], inplace=True)
+        return df.reset_index(drop=True)
+
+    def iter_ohlcv_parallel(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000,
+        max_workers: int = 4,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Range-sharded counterpart of `iter_ohlcv` (ordered, bounded memory).
+
+        Candle open times are deterministic for fixed-size intervals, so the
+        range is split into disjoint shards of exactly `limit` candles and every
+        shard is fetched independently. At most `2 * max_workers` shards are in
+        flight, and pages are yielded in chronological order as they complete.
+
+        Calendar-based intervals (e.g. '1M') have no fixed spacing and fall back
+        to sequential pagination. Weekly candles open on Monday, so their shard
+        grid is shifted from the (Thursday) epoch by WEEK_OFFSET.
+
+        Args:
+            symbol (str): Trading pair symbol (e.g., 'BTC/USDT').
+            interval (str): Timeframe (e.g., '1m', '1h', '1d').
+            start_date (datetime): Start time (required to plan the shards).
+            end_date (Optional[datetime]): End time. Defaults to now (UTC).
+            limit (int): Number of candles per request (shard size).
+            max_workers (int): Maximum number of concurrent requests.
+
+        Yields:
+            pd.DataFrame: A standardized (non-empty) OHLCV page.
+        """
+        end = end_date or datetime.now(timezone.utc)
+
+        if interval.endswith("M") or max_workers <= 1:
+            yield from self.iter_ohlcv(symbol, interval, start_date, end, limit)
+            return
+
+        offset_ms = 0
+        if interval.endswith("w"):
+            offset_ms = WEEK_OFFSET // timedelta(milliseconds=1)
+        shards = self._plan_shards(
+            int(start_date.timestamp() * 1000),
+            int(end.timestamp() * 1000),
+            interval_to_milliseconds(interval),
+            limit,
+            offset_ms,
         )
 
-        # Filter strictly by end_date if provided (to clip any overshoot)
-        if end_timestamp:
-            df = df[df["timestamp_ms"] <= end_timestamp]
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="binance-shard"
+        ) as executor:
+            in_flight: Deque["Future[pd.DataFrame]"] = deque()
+            remaining = iter(shards)
 
-        # 1. Convert timestamp (ms) to datetime objects (UTC)
-        df["time"] = pd.to_datetime(df["timestamp_ms"], unit="ms", utc=True)
+            def submit_next() -> None:
+                shard = next(remaining, None)
+                if shard is not None:
+                    in_flight.append(
+                        executor.submit(self._fetch_shard, symbol, interval, shard, limit)
+                    )
 
-        # 2. Drop the raw timestamp column
-        df.drop(columns=["timestamp_ms"], inplace=True)
+            # Prime the pipeline with a bounded window of shards
+            for _ in range(max_workers * 2):
+                submit_next()
 
-        # 3. Ensure column order matches the BaseDataFetcher schema
-        df = df[["time", "open", "high", "low", "close", "volume"]]
+            try:
+                while in_flight:
+                    page = in_flight.popleft().result()
+                    submit_next()
+                    if not page.empty:
+                        yield page
+            finally:
+                # Consumer stopped early or a shard failed: drop queued work.
+                for future in in_flight:
+                    future.cancel()
+
+    @staticmethod
+    def _plan_shards(
+        start_ms: int, end_ms: int, interval_ms: int, limit: int, offset_ms: int = 0
+    ) -> List[Tuple[int, int]]:
+        """
+        Split [start_ms, end_ms] into disjoint shards of `limit` candles.
 
-        # 4. Remove duplicates based on time (safety check for pagination overlaps)
-        df.drop_duplicates(subset=["time"], inplace=True)
+        Shard boundaries are aligned to the interval grid (candle open times,
+        `offset_ms` after multiples of the interval since the epoch), so each
+        shard maps to exactly one API request.
+
+        Returns:
+            List[Tuple[int, int]]: Inclusive (first_open_ms, last_open_ms) pairs.
+        """
+        # ceil to the grid
+        first = -(-(start_ms - offset_ms) // interval_ms) * interval_ms + offset_ms
+        span = interval_ms * limit
+
+        shards: List[Tuple[int, int]] = []
+        shard_start = first
+        while shard_start <= end_ms:
+            shard_end = min(shard_start + span - interval_ms, end_ms)
+            shards.append((shard_start, shard_end))
+            shard_start += span
+        return shards
+
+    def _fetch_shard(
+        self, symbol: str, interval: str, shard: Tuple[int, int], limit: int
+    ) -> pd.DataFrame:
+        """
+        Fetch one shard (single request) and clip it to the shard bounds.
+        """
+        shard_start, shard_end = shard
+        batch = self._fetch_page(symbol, interval, shard_start, limit)
+        if not batch:
+            return pd.DataFrame()
 
-        # 5. Validate schema using the base class utility
+        return self._normalize_ohlcv(batch, shard_end)
+
+    def _fetch_page(
+        self, symbol: str, interval: str, since: Optional[int], limit: int
+    ) -> List[List[Union[int, float]]]:
+        """
+        Perform a single rate-limited klines request.
+
+        Raises:
+            RuntimeError: If the API request fails.
+        """
+        self._ensure_markets()
+        self.rate_limiter.acquire(BINANCE_KLINES_WEIGHT)
+        try:
+            batch: List[List[Union[int, float]]] = self.exchange.fetch_ohlcv(
+                symbol=symbol,
+                timeframe=interval,
+                since=since,
+                limit=limit,
+            )
+            return batch
+        except ccxt.BaseError as e:
+            raise RuntimeError(
+                f"Failed to fetch data from Binance for {symbol}: {str(e)}"
+            ) from e
+
+    def _normalize_ohlcv(
+        self,
+        rows: List[List[Union[int, float]]],
+        end_timestamp: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        Convert raw CCXT candles into the standardized OHLCV schema and validate it.
+        """
+        df = normalize_ohlcv(rows, end_timestamp)
+
+        # Validate schema using the base class utility
         self.validate_dataframe(df)
 
         return df
@@ -189,21 +530,11 @@ class BinanceFetcher(BaseDataFetcher):
         Raises:
             RuntimeError: If the ticker data cannot be retrieved.
         """
+        self._ensure_markets()
+        self.rate_limiter.acquire(BINANCE_TICKER_WEIGHT)
         try:
             ticker: Dict[str, Any] = self.exchange.fetch_ticker(symbol)
-
-            # Extract relevant metrics
-            fundamentals = {
-                "symbol": symbol,
-                "last_price": ticker.get("last"),
-                "24h_high": ticker.get("high"),
-                "24h_low": ticker.get("low"),
-                "24h_volume": ticker.get("baseVolume"),  # Volume in base asset
-                "24h_quote_volume": ticker.get("quoteVolume"),  # Volume in quote asset
-                "percentage_change": ticker.get("percentage"),
-                "timestamp": datetime.now(),
-            }
-            return fundamentals
+            return ticker_to_fundamentals(symbol, ticker)
 
         except ccxt.BaseError as e:
             raise RuntimeError(
@@ -0,0 +1,354 @@
+"""
+Binance Kline Stream Ingestor.
+
+This module implements a long-running, push-based alternative to polling the
+REST API for fresh candles. It subscribes to Binance kline WebSocket streams,
+buffers CLOSED candles only, and hands them to a sink in micro-batches every
+`flush_interval` seconds.
+
+Binance allows at most 1,024 streams per connection, so larger symbol sets
+are split across several connections that share one buffer and flusher.
+
+Resilience:
+    - Each connection is re-established with exponential backoff (Binance also
+      drops every connection after 24h).
+    - After each (re)connect, the range between the last closed candle seen per
+      symbol and "now" is backfilled through a REST callback, so outages leave
+      no gaps. Seeding `last_closed` from the database watermarks extends this
+      to process restarts.
+    - A failed flush keeps its candles buffered and retries on the next tick.
+    - Malformed messages (invalid JSON, incomplete kline payloads) are logged
+      and skipped.
+
+Dependencies:
+    - websockets: asyncio WebSocket client.
+    - pandas: For micro-batch structuring.
+
+Example:
+    ingestor = KlineStreamIngestor({"BTC/USDT": 1}, "1m", sink=write_candles)
+    asyncio.run(ingestor.run(stop_event))
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+
+from src.core.timeframes import interval_to_timedelta
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+BINANCE_SPOT_WS_URL = "wss://stream.binance.com:9443/stream"
+BINANCE_FUTURES_WS_URL = "wss://fstream.binance.com/stream"
+
+# Binance accepts at most 1,024 streams per connection (larger sets are sharded
+# over several connections) and 5 control messages per second, so
+# subscriptions are sent in chunks with a short pause.
+MAX_STREAMS_PER_CONNECTION = 1024
+_SUBSCRIBE_CHUNK = 200
+_SUBSCRIBE_PAUSE_SECONDS = 0.25
+
+# sink(asset_id, candles) -> rows written. Called from a worker thread.
+CandleSink = Callable[[int, pd.DataFrame], int]
+# backfill(symbol, start, end) -> candles. Called from a worker thread.
+BackfillFetcher = Callable[[str, datetime, datetime], pd.DataFrame]
+
+_COLUMNS = ["time", "open", "high", "low", "close", "volume"]
+
+
+def stream_name(symbol: str, interval: str) -> str:
+    """
+    Convert a unified symbol into a Binance kline stream name.
+
+    Args:
+        symbol (str): Unified symbol (e.g., 'BTC/USDT').
+        interval (str): Kline interval (e.g., '1m').
+
+    Returns:
+        str: Stream name (e.g., 'btcusdt@kline_1m').
+    """
+    return f"{symbol.replace('/', '').lower()}@kline_{interval}"
+
+
+def parse_closed_kline(message: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Extract a closed candle from a combined-stream kline message.
+
+    Args:
+        message (Dict[str, Any]): Decoded WebSocket payload.
+
+    Returns:
+        Optional[Tuple[str, Dict[str, Any]]]: (stream name, candle row), or None for
+                                              non-kline messages and still-open candles.
+    """
+    data = message.get("data")
+    if not isinstance(data, dict) or data.get("e") != "kline":
+        return None
+
+    kline = data["k"]
+    if not kline.get("x"):
+        return None
+
+    row = {
+        "time": datetime.fromtimestamp(kline["t"] / 1000, tz=timezone.utc),
+        "open": float(kline["o"]),
+        "high": float(kline["h"]),
+        "low": float(kline["l"]),
+        "close": float(kline["c"]),
+        "volume": float(kline["v"]),
+    }
+    return message["stream"], row
+
+
+class KlineStreamIngestor:
+    """
+    Subscribes to kline streams and micro-batches closed candles into a sink.
+
+    Attributes:
+        interval (str): Kline interval shared by all subscriptions.
+        flush_interval (float): Seconds between micro-batch flushes.
+        last_closed (Dict[str, datetime]): Open time of the latest closed candle per symbol.
+    """
+
+    def __init__(
+        self,
+        asset_ids: Mapping[str, int],
+        interval: str,
+        sink: CandleSink,
+        backfill: Optional[BackfillFetcher] = None,
+        flush_interval: float = 5.0,
+        url: str = BINANCE_SPOT_WS_URL,
+        last_closed: Optional[Mapping[str, datetime]] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+    ) -> None:
+        """
+        Initialize the ingestor.
+
+        Args:
+            asset_ids (Mapping[str, int]): Asset ID per unified symbol to subscribe to.
+            interval (str): Kline interval (e.g., '1m').
+            sink (CandleSink): Writes one symbol's candles (e.g., COPY upsert + commit).
+            backfill (Optional[BackfillFetcher]): REST fetcher used to fill gaps after
+                                                  a (re)connect. None disables backfill.
+            flush_interval (float): Seconds between micro-batch flushes.
+            url (str): Combined-stream WebSocket endpoint.
+            last_closed (Optional[Mapping[str, datetime]]): Known latest candle per symbol
+                                                            (e.g., database watermarks).
+            reconnect_delay (float): Initial reconnect backoff in seconds.
+            max_reconnect_delay (float): Upper bound of the reconnect backoff.
+        """
+        self.asset_ids = dict(asset_ids)
+        self.interval = interval
+        self.sink = sink
+        self.backfill = backfill
+        self.flush_interval = flush_interval
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.step = interval_to_timedelta(interval)
+        self.last_closed: Dict[str, datetime] = dict(last_closed or {})
+        self._symbols_by_stream = {stream_name(s, interval): s for s in self.asset_ids}
+
+        # symbol -> {candle open time -> row}; keyed by time so stream and
+        # backfill duplicates collapse before writing.
+        self._buffer: Dict[str, Dict[datetime, Dict[str, Any]]] = {}
+        self.rows_written = 0
+
+    # --------------------------------------------------------------------------
+    # Public API
+    # --------------------------------------------------------------------------
+    async def run(self, stop: Optional[asyncio.Event] = None) -> None:
+        """
+        Stream until `stop` is set, reconnecting (and backfilling) as needed.
+
+        Streams are split into shards of at most MAX_STREAMS_PER_CONNECTION,
+        each served by its own connection (reconnected independently).
+
+        Args:
+            stop (Optional[asyncio.Event]): Set to shut down gracefully (buffer is flushed).
+        """
+        stop = stop or asyncio.Event()
+        flusher = asyncio.create_task(self._flush_loop(stop))
+        streams = list(self._symbols_by_stream)
+        connections = [
+            asyncio.create_task(
+                self._connection_loop(streams[i:i + MAX_STREAMS_PER_CONNECTION], stop)
+            )
+            for i in range(0, len(streams), MAX_STREAMS_PER_CONNECTION)
+        ]
+
+        try:
+            await asyncio.gather(*connections)
+        finally:
+            stop.set()
+            await asyncio.gather(*connections, return_exceptions=True)
+            await flusher
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all buffered candles through the sink (in a worker thread).
+
+        Returns:
+            int: Number of rows written.
+        """
+        if not self._buffer:
+            return 0
+
+        batch, self._buffer = self._buffer, {}
+        failed: Dict[str, Dict[datetime, Dict[str, Any]]] = {}
+        written = 0
+
+        for symbol, rows in batch.items():
+            df = pd.DataFrame(sorted(rows.values(), key=lambda r: r["time"]), columns=_COLUMNS)
+            try:
+                written += await asyncio.to_thread(self.sink, self.asset_ids[symbol], df)
+            except Exception as e:
+                logger.error(f"Failed to write {len(df)} candles for {symbol}: {e}")
+                failed[symbol] = rows
+
+        # Keep failed rows for the next tick (newer duplicates win).
+        for symbol, rows in failed.items():
+            self._buffer.setdefault(symbol, {})
+            self._buffer[symbol] = {**rows, **self._buffer[symbol]}
+
+        self.rows_written += written
+        if written:
+            logger.info(f"Flushed {written} candles for {len(batch) - len(failed)} symbols.")
+        return written
+
+    # --------------------------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------------------------
+    async def _connection_loop(self, streams: List[str], stop: asyncio.Event) -> None:
+        """Serve one shard of streams on one connection, reconnecting with backoff."""
+        symbols = [self._symbols_by_stream[stream] for stream in streams]
+        delay = self.reconnect_delay
+
+        while not stop.is_set():
+            try:
+                async with connect(self.url, ping_interval=20, ping_timeout=20) as ws:
+                    await self._subscribe(ws, streams)
+                    logger.info(
+                        f"Connected to {self.url} ({len(streams)} kline streams)."
+                    )
+                    delay = self.reconnect_delay
+                    await self._backfill_gaps(symbols)
+                    await self._receive(ws, stop)
+
+            except (ConnectionClosed, InvalidHandshake, OSError) as e:
+                if stop.is_set():
+                    break
+                logger.warning(
+                    f"Kline stream disconnected ({e}). Reconnecting in {delay:.1f}s."
+                )
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _subscribe(self, ws: Any, streams: List[str]) -> None:
+        """Send SUBSCRIBE requests for `streams`, chunked to respect message limits."""
+        for i in range(0, len(streams), _SUBSCRIBE_CHUNK):
+            chunk = streams[i:i + _SUBSCRIBE_CHUNK]
+            await ws.send(json.dumps({"method": "SUBSCRIBE", "params": chunk, "id": i + 1}))
+            if i + _SUBSCRIBE_CHUNK < len(streams):
+                await asyncio.sleep(_SUBSCRIBE_PAUSE_SECONDS)
+
+    async def _receive(self, ws: Any, stop: asyncio.Event) -> None:
+        """Consume messages until the connection drops or `stop` is set."""
+        stop_wait = asyncio.create_task(stop.wait())
+        try:
+            while not stop.is_set():
+                recv = asyncio.create_task(ws.recv())
+                done, _ = await asyncio.wait(
+                    {recv, stop_wait}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if recv not in done:
+                    recv.cancel()
+                    return
+                frame = recv.result()
+                try:
+                    self._handle(json.loads(frame))
+                except (ValueError, KeyError, TypeError) as e:
+                    # One bad frame must not tear down the long-running stream.
+                    logger.warning(
+                        f"Skipping malformed kline message ({e!r}): {frame!r:.200}"
+                    )
+        finally:
+            stop_wait.cancel()
+
+    def _handle(self, message: Dict[str, Any]) -> None:
+        """Buffer a closed candle (subscription acks and open candles are ignored)."""
+        parsed = parse_closed_kline(message)
+        if parsed is None:
+            return
+
+        stream, row = parsed
+        symbol = self._symbols_by_stream.get(stream)
+        if symbol is None:
+            return
+
+        self._buffer.setdefault(symbol, {})[row["time"]] = row
+        if symbol not in self.last_closed or row["time"] > self.last_closed[symbol]:
+            self.last_closed[symbol] = row["time"]
+
+    async def _flush_loop(self, stop: asyncio.Event) -> None:
+        """Flush the buffer every `flush_interval` seconds until stopped."""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+    async def _backfill_gaps(self, symbols: Sequence[str]) -> None:
+        """
+        Fetch candles closed while disconnected (from each symbol's last closed candle).
+
+        Args:
+            symbols (Sequence[str]): Symbols of the (re)connected shard.
+        """
+        if self.backfill is None or not self.last_closed:
+            return
+
+        now = datetime.now(timezone.utc)
+        # Only candles that have fully closed; the stream delivers the current one.
+        latest_closed_open = now - self.step
+
+        for symbol in symbols:
+            last = self.last_closed.get(symbol)
+            if last is None:
+                continue
+            start = last + self.step
+            if start > latest_closed_open:
+                continue
+
+            try:
+                df = await asyncio.to_thread(self.backfill, symbol, start, latest_closed_open)
+            except Exception as e:
+                logger.error(f"Backfill failed for {symbol} from {start}: {e}")
+                continue
+
+            if df.empty:
+                continue
+
+            buffer = self._buffer.setdefault(symbol, {})
+            for row in df[_COLUMNS].to_dict("records"):
+                candle_time = pd.Timestamp(row["time"]).to_pydatetime()
+                row["time"] = candle_time
+                # Stream data (if any arrived already) takes precedence.
+                buffer.setdefault(candle_time, row)
+                if candle_time > self.last_closed[symbol]:
+                    self.last_closed[symbol] = candle_time
+
+            logger.info(f"Backfilled {len(df)} candles for {symbol} from {start}.")
@@ -0,0 +1,190 @@
+"""
+Exchange Market Metadata Cache.
+
+`exchange.load_markets()` downloads the full exchangeInfo payload (several MB
+for Binance) and dominates the start-up time of every ETL run and short-lived
+worker. Market metadata changes rarely, so this module keeps it in an on-disk
+JSON cache with a TTL and hands it to CCXT via `exchange.set_markets()`.
+
+Cache files are written atomically (temp file + rename), so concurrent
+processes never read a half-written cache.
+
+Example:
+    cache = MarketCache()
+    load_markets_cached(exchange, cache, key="binance_spot")
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from src.core.config import settings
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# (markets, currencies) as stored on a CCXT exchange instance.
+MarketData = Tuple[Dict[str, Any], Optional[Dict[str, Any]]]
+
+
+class MarketCache:
+    """
+    TTL-bounded on-disk store of CCXT market metadata (one JSON file per key).
+
+    Attributes:
+        cache_dir (Path): Directory holding the cache files.
+        ttl_seconds (float): Maximum age of a cache file before it is considered stale.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (Optional[str]): Cache directory. Defaults to settings.MARKET_CACHE_DIR.
+            ttl_seconds (Optional[float]): Cache lifetime. Defaults to settings.MARKET_CACHE_TTL.
+        """
+        self.cache_dir = Path(cache_dir or settings.MARKET_CACHE_DIR)
+        self.ttl_seconds = float(
+            settings.MARKET_CACHE_TTL if ttl_seconds is None else ttl_seconds
+        )
+
+    def path(self, key: str) -> Path:
+        """Return the cache file path for a key (e.g., 'binance_spot')."""
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, key: str) -> Optional[MarketData]:
+        """
+        Read cached market metadata if it exists and is still fresh.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            Optional[MarketData]: (markets, currencies), or None on a miss/stale/corrupt file.
+        """
+        path = self.path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > self.ttl_seconds:
+                logger.info(f"Market cache '{key}' is stale ({age:.0f}s old).")
+                return None
+
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            return payload["markets"], payload.get("currencies")
+
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable market cache '{path}': {e}")
+            return None
+
+    def save(
+        self,
+        key: str,
+        markets: Dict[str, Any],
+        currencies: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Atomically write market metadata to the cache.
+
+        Failures are logged and swallowed: the cache is an optimization only.
+
+        Args:
+            key (str): Cache key.
+            markets (Dict[str, Any]): CCXT `exchange.markets`.
+            currencies (Optional[Dict[str, Any]]): CCXT `exchange.currencies`.
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"markets": markets, "currencies": currencies}, f)
+                os.replace(tmp_path, self.path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to write market cache '{key}': {e}")
+
+
+def market_cache_key(exchange: Any) -> str:
+    """
+    Derive the cache key of an exchange instance (id + market type).
+
+    Args:
+        exchange (Any): CCXT exchange instance (sync or async).
+
+    Returns:
+        str: Cache key (e.g., 'binance_spot', 'binance_future').
+    """
+    options = getattr(exchange, "options", None) or {}
+    return f"{exchange.id}_{options.get('defaultType', 'spot')}"
+
+
+def load_markets_cached(
+    exchange: Any,
+    cache: MarketCache,
+    key: Optional[str] = None,
+    refresh: bool = False,
+) -> None:
+    """
+    Populate `exchange.markets` from the cache, downloading only on a miss.
+
+    Args:
+        exchange (Any): Synchronous CCXT exchange instance.
+        cache (MarketCache): The market metadata cache.
+        key (Optional[str]): Cache key. Defaults to `market_cache_key(exchange)`.
+        refresh (bool): If True, ignore the cache and download fresh metadata.
+    """
+    key = key or market_cache_key(exchange)
+
+    cached = None if refresh else cache.load(key)
+    if cached is not None:
+        markets, currencies = cached
+        exchange.set_markets(markets, currencies)
+        logger.debug(f"Loaded {len(markets)} markets from cache '{key}'.")
+        return
+
+    exchange.load_markets(reload=True)
+    cache.save(key, exchange.markets, exchange.currencies)
+    logger.info(f"Downloaded {len(exchange.markets)} markets and refreshed cache '{key}'.")
+
+
+async def load_markets_cached_async(
+    exchange: Any,
+    cache: MarketCache,
+    key: Optional[str] = None,
+    refresh: bool = False,
+) -> None:
+    """
+    Asynchronous variant of `load_markets_cached` for `ccxt.async_support` exchanges.
+
+    Args:
+        exchange (Any): Asynchronous CCXT exchange instance.
+        cache (MarketCache): The market metadata cache.
+        key (Optional[str]): Cache key. Defaults to `market_cache_key(exchange)`.
+        refresh (bool): If True, ignore the cache and download fresh metadata.
+    """
+    key = key or market_cache_key(exchange)
+
+    cached = None if refresh else cache.load(key)
+    if cached is not None:
+        markets, currencies = cached
+        exchange.set_markets(markets, currencies)
+        logger.debug(f"Loaded {len(markets)} markets from cache '{key}'.")
+        return
+
+    await exchange.load_markets(reload=True)
+    cache.save(key, exchange.markets, exchange.currencies)
+    logger.info(f"Downloaded {len(exchange.markets)} markets and refreshed cache '{key}'.")
@@ -14,15 +14,19 @@ from typing import List, Optional, Dict, Any, Union
 from urllib.parse import urlencode
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from src.core.config import settings
+from src.core.http import get_session
 from src.data_ingestion.news.base_news import BaseNewsFetcher, NewsArticle
+from src.data_ingestion.rate_limiter import RateLimiter, get_rate_limiter
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# CryptoPanic request budget (kept below the plan's per-second limit).
+CRYPTOPANIC_BURST = 5
+CRYPTOPANIC_REQUESTS_PER_SECOND = 2.0
+
 
 class CryptoPanicFetcher(BaseNewsFetcher):
     """
@@ -30,17 +34,21 @@ class CryptoPanicFetcher(BaseNewsFetcher):
     
     Attributes:
         base_url (str): The CryptoPanic API endpoint.
-        session (requests.Session): HTTP session with retry logic.
+        session (requests.Session): Shared pooled HTTP session with retry logic.
     """
 
     BASE_URL = "https://cryptopanic.com/api/v1/posts/"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self, api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None
+    ):
         """
         Initialize the CryptoPanic fetcher.
 
         Args:
             api_key (Optional[str]): The API Key. Defaults to settings.CRYPTOPANIC_API_KEY.
+            rate_limiter (Optional[RateLimiter]): Request budget to draw from.
+                                                  Defaults to the shared CryptoPanic limiter.
         
         Raises:
             ValueError: If no API key is provided in args or config.
@@ -56,26 +64,15 @@ class CryptoPanicFetcher(BaseNewsFetcher):
 
         super().__init__(source_name="CRYPTOPANIC", api_key=_key)
         
-        # Setup robust HTTP session with retries
-        self.session = self._create_retry_session()
-
-    def _create_retry_session(self, retries: int = 3, backoff_factor: float = 0.3) -> requests.Session:
-        """
-        Create a requests Session with automatic retry logic.
-        This helps handle transient network glitches or API rate limits.
-        """
-        session = requests.Session()
-        retry = Retry(
-            total=retries,
-            read=retries,
-            connect=retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=(500, 502, 504),
+        # Shared keep-alive session with retries (reused by every instance)
+        self.session = get_session("CRYPTOPANIC")
+
+        # Shared across threads (and processes with the 'sqlite' backend)
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "CRYPTOPANIC",
+            capacity=CRYPTOPANIC_BURST,
+            refill_per_second=CRYPTOPANIC_REQUESTS_PER_SECOND,
         )
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
-        return session
 
     def fetch_news(
         self,
@@ -118,6 +115,7 @@ class CryptoPanicFetcher(BaseNewsFetcher):
                 # Make the request
                 # Note: 'params' are only needed for the first page request constructed manually.
                 # Subsequent 'next' URLs from API already contain params.
+                self.rate_limiter.acquire(1)
                 if page == 1:
                     response = self.session.get(current_url, params=params, timeout=10)
                 else:
@@ -21,10 +21,14 @@ from dateutil import parser as date_parser
 # Internal imports
 from src.core.config import settings
 from src.data_ingestion.news.base_news import BaseNewsFetcher, NewsArticle
+from src.data_ingestion.rate_limiter import RateLimiter, get_rate_limiter
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Google News RSS has no published quota; stay well below bot-detection thresholds.
+GOOGLE_NEWS_REQUESTS_PER_MINUTE = 30
+
 
 class GoogleNewsFetcher(BaseNewsFetcher):
     """
@@ -34,10 +38,14 @@ class GoogleNewsFetcher(BaseNewsFetcher):
         client (GNews): The GNews client instance configured with settings.
     """
 
-    def __init__(self):
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the Google News fetcher with configuration settings.
         Note: Google News (via RSS) typically does not require an API key.
+
+        Args:
+            rate_limiter (Optional[RateLimiter]): Request budget to draw from.
+                                                  Defaults to the shared Google News limiter.
         """
         # Call parent constructor (source_name='GOOGLE_NEWS')
         super().__init__(source_name="GOOGLE_NEWS", api_key=None)
@@ -50,6 +58,11 @@ class GoogleNewsFetcher(BaseNewsFetcher):
             max_results=settings.GOOGLE_NEWS_MAX_RESULTS,
             exclude_websites=None # Can be configured to exclude specific domains
         )
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "GOOGLE_NEWS",
+            capacity=5,
+            refill_per_second=GOOGLE_NEWS_REQUESTS_PER_MINUTE / 60.0,
+        )
         logger.info(f"Initialized GoogleNewsFetcher ({settings.GOOGLE_NEWS_LANG}-{settings.GOOGLE_NEWS_COUNTRY})")
 
     def fetch_news(
@@ -76,6 +89,7 @@ class GoogleNewsFetcher(BaseNewsFetcher):
             
             raw_news: List[Dict[str, Any]] = []
 
+            self.rate_limiter.acquire(1)
             if symbol:
                 # Search for specific topic/coin
                 logger.info(f"Searching Google News for: '{symbol}'")
@@ -0,0 +1,272 @@
+"""
+Rate Limiter Module.
+
+This module provides a thread-safe, weight-aware token bucket used to keep
+outbound API traffic within a provider's published budget (e.g., Binance's
+REQUEST_WEIGHT limit of 6,000 per minute).
+
+Unlike CCXT's per-instance `enableRateLimit` (which only spaces out calls made
+sequentially from a single exchange object), a limiter obtained through
+`get_rate_limiter` is shared by every fetcher and worker thread in the process,
+so concurrent backfills cannot collectively exceed the budget.
+
+Backends (settings.RATE_LIMIT_BACKEND):
+    - 'memory': Bucket state lives in the process (threads share it).
+    - 'sqlite': Bucket state lives in a local SQLite file (RATE_LIMIT_DB_PATH),
+                so several ETL processes on one host share a single budget.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+from src.core.config import settings
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket with weighted acquisition.
+
+    The bucket holds up to `capacity` tokens and refills continuously at
+    `refill_per_second`. Each request consumes its weight. Acquisition is
+    reservation-based: the weight is deducted immediately (the balance may go
+    negative) and the caller sleeps for its share of the deficit, which keeps
+    waiting threads strictly first-come-first-served.
+
+    Attributes:
+        name (str): Identifier used in logs (e.g., 'BINANCE').
+        capacity (float): Maximum burst size in weight units.
+        refill_per_second (float): Sustained throughput in weight units per second.
+    """
+
+    def __init__(self, name: str, capacity: float, refill_per_second: float) -> None:
+        """
+        Initialize the token bucket (starts full).
+
+        Args:
+            name (str): Identifier used in logs.
+            capacity (float): Maximum burst size in weight units.
+            refill_per_second (float): Refill rate in weight units per second.
+
+        Raises:
+            ValueError: If capacity or refill rate is not positive.
+        """
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill_per_second must be positive.")
+
+        self.name = name
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (caller must hold the lock)."""
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+        self._updated_at = now
+
+    def reserve(self, weight: float = 1.0) -> float:
+        """
+        Deduct `weight` tokens and return how long the caller must wait.
+
+        Args:
+            weight (float): Cost of the request in weight units.
+
+        Returns:
+            float: Seconds to wait before the request may be sent (0.0 if immediate).
+
+        Raises:
+            ValueError: If the weight exceeds the bucket capacity (could never be served).
+        """
+        if weight > self.capacity:
+            raise ValueError(
+                f"Request weight {weight} exceeds '{self.name}' capacity {self.capacity}."
+            )
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= weight
+            deficit = -self._tokens
+
+        return deficit / self.refill_per_second if deficit > 0 else 0.0
+
+    def acquire(self, weight: float = 1.0) -> float:
+        """
+        Block until `weight` tokens are available.
+
+        Args:
+            weight (float): Cost of the request in weight units.
+
+        Returns:
+            float: Seconds actually spent waiting.
+        """
+        wait = self.reserve(weight)
+        if wait > 0:
+            logger.debug(f"[{self.name}] Rate limit reached. Waiting {wait:.3f}s.")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, weight: float = 1.0) -> float:
+        """
+        Asyncio-friendly variant of `acquire` (yields to the event loop while waiting).
+
+        Draws from the same bucket as `acquire`, so synchronous and asynchronous
+        fetchers in one process share a single budget.
+
+        Args:
+            weight (float): Cost of the request in weight units.
+
+        Returns:
+            float: Seconds actually spent waiting.
+        """
+        wait = self.reserve(weight)
+        if wait > 0:
+            logger.debug(f"[{self.name}] Rate limit reached. Waiting {wait:.3f}s.")
+            await asyncio.sleep(wait)
+        return wait
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    Token bucket whose state is stored in a SQLite file shared across processes.
+
+    Each reservation is a short `BEGIN IMMEDIATE` transaction (read, refill,
+    deduct, write), which SQLite serializes across every process using the same
+    file. Wall-clock time is used because monotonic clocks are per-process.
+
+    Attributes:
+        path (str): Location of the SQLite database file.
+    """
+
+    def __init__(
+        self, name: str, capacity: float, refill_per_second: float, path: str
+    ) -> None:
+        """
+        Initialize the shared bucket (created full if it does not exist yet).
+
+        Args:
+            name (str): Identifier of the bucket (shared by all processes).
+            capacity (float): Maximum burst size in weight units.
+            refill_per_second (float): Refill rate in weight units per second.
+            path (str): SQLite database file.
+
+        Raises:
+            ValueError: If capacity or refill rate is not positive.
+        """
+        super().__init__(name, capacity, refill_per_second)
+        self.path = path
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        # One connection per limiter, guarded by the inherited thread lock.
+        self._conn = sqlite3.connect(
+            path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (name, self.capacity, time.time()),
+            )
+
+    def reserve(self, weight: float = 1.0) -> float:
+        """
+        Deduct `weight` tokens from the shared bucket and return the wait time.
+
+        Args:
+            weight (float): Cost of the request in weight units.
+
+        Returns:
+            float: Seconds to wait before the request may be sent (0.0 if immediate).
+
+        Raises:
+            ValueError: If the weight exceeds the bucket capacity.
+        """
+        if weight > self.capacity:
+            raise ValueError(
+                f"Request weight {weight} exceeds '{self.name}' capacity {self.capacity}."
+            )
+
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                row = cursor.execute(
+                    "SELECT tokens, updated_at FROM rate_limits WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = time.time()
+                tokens, updated_at = row if row else (self.capacity, now)
+
+                elapsed = max(0.0, now - updated_at)
+                tokens = min(self.capacity, tokens + elapsed * self.refill_per_second) - weight
+
+                cursor.execute(
+                    "INSERT OR REPLACE INTO rate_limits (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    (self.name, tokens, now),
+                )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+        deficit = -tokens
+        return deficit / self.refill_per_second if deficit > 0 else 0.0
+
+
+# ------------------------------------------------------------------------------
+# Process-wide Registry
+# ------------------------------------------------------------------------------
+_registry: Dict[str, RateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str,
+    capacity: Optional[float] = None,
+    refill_per_second: Optional[float] = None,
+) -> RateLimiter:
+    """
+    Return the shared limiter registered under `name`, creating it on first use.
+
+    The backend is chosen by settings.RATE_LIMIT_BACKEND ('memory' or 'sqlite').
+
+    Args:
+        name (str): Limiter identifier (e.g., 'BINANCE').
+        capacity (Optional[float]): Bucket size (required on first use).
+        refill_per_second (Optional[float]): Refill rate (required on first use).
+
+    Returns:
+        RateLimiter: The process-wide limiter instance.
+
+    Raises:
+        ValueError: If the limiter does not exist yet and no budget was given.
+    """
+    key = name.upper()
+    with _registry_lock:
+        limiter = _registry.get(key)
+        if limiter is None:
+            if capacity is None or refill_per_second is None:
+                raise ValueError(f"No rate limiter registered for '{key}'.")
+            if settings.RATE_LIMIT_BACKEND == "sqlite":
+                limiter = SQLiteRateLimiter(
+                    key, capacity, refill_per_second, settings.RATE_LIMIT_DB_PATH
+                )
+            else:
+                limiter = RateLimiter(key, capacity, refill_per_second)
+            _registry[key] = limiter
+        return limiter
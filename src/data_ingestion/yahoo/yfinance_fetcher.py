@@ -5,18 +5,54 @@ This module implements the logic for retrieving Stock market data and
 Fundamental data using the yfinance library. It adheres to the
 BaseDataFetcher interface to ensure uniform data processing.
 
+Intraday intervals are subject to Yahoo's per-request span and maximum
+history limits (e.g., 1m: 7 days per request, last 30 days only). Ranges are
+planned into compliant windows that are downloaded concurrently and merged.
+
 Dependencies:
     - yfinance: For retrieving stock data from Yahoo Finance.
     - pandas: For data manipulation.
 """
 
-from datetime import datetime
-from typing import Optional, Any, Dict
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Callable, Dict, Iterator, List, Tuple, TypeVar, Union
 
 import pandas as pd
 import yfinance as yf
 
+from src.core.timeframes import interval_to_timedelta
 from src.data_ingestion.base import BaseDataFetcher
+from src.data_ingestion.rate_limiter import RateLimiter, get_rate_limiter
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# ------------------------------------------------------------------------------
+# Yahoo Finance Intraday Limits
+# ------------------------------------------------------------------------------
+# interval -> (maximum span of one request, maximum history back from now).
+# Requests violating these limits come back empty (or truncated).
+YAHOO_INTRADAY_LIMITS: Dict[str, Tuple[timedelta, timedelta]] = {
+    "1m": (timedelta(days=7), timedelta(days=30)),
+    "2m": (timedelta(days=60), timedelta(days=60)),
+    "5m": (timedelta(days=60), timedelta(days=60)),
+    "15m": (timedelta(days=60), timedelta(days=60)),
+    "30m": (timedelta(days=60), timedelta(days=60)),
+    "90m": (timedelta(days=60), timedelta(days=60)),
+    "60m": (timedelta(days=730), timedelta(days=730)),
+    "1h": (timedelta(days=730), timedelta(days=730)),
+}
+
+# Kept inside the history limit, which Yahoo evaluates at request time.
+YAHOO_HISTORY_MARGIN = timedelta(hours=1)
+
+# Yahoo publishes no quota; ~2,000 requests/hour per IP is the commonly observed
+# ceiling. One request per ticker per window is charged against this budget.
+YAHOO_REQUESTS_PER_MINUTE = 30
 
 
 class YahooFinanceFetcher(BaseDataFetcher):
@@ -25,12 +61,23 @@ class YahooFinanceFetcher(BaseDataFetcher):
     Supports fetching OHLCV time-series and Fundamental data (Financial info).
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the Yahoo Finance fetcher.
         Note: yfinance does not typically require an API key for basic usage.
+
+        Args:
+            max_workers (int): Maximum number of windows downloaded concurrently.
+            rate_limiter (Optional[RateLimiter]): Request budget to draw from.
+                                                  Defaults to the shared Yahoo limiter.
         """
         super().__init__(source_name="YAHOO", api_key=None)
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            "YAHOO",
+            capacity=YAHOO_REQUESTS_PER_MINUTE,
+            refill_per_second=YAHOO_REQUESTS_PER_MINUTE / 60.0,
+        )
 
     def fetch_ohlcv(
         self,
@@ -54,12 +101,260 @@ class YahooFinanceFetcher(BaseDataFetcher):
         Returns:
             pd.DataFrame: Standardized OHLCV data.
         """
+        if start_date is None:
+            # No anchor to plan windows from: defer to yfinance's default period.
+            return self._normalize_ohlcv(self._download(symbol, interval, None, end_date))
+
+        windows = self._plan_windows(interval, start_date, end_date)
+
+        def fetch_window(window: Tuple[datetime, datetime]) -> pd.DataFrame:
+            raw = self._download(symbol, interval, *window)
+            return self._normalize_ohlcv(raw, *window)
+
+        return self._merge_windows(self._map_windows(fetch_window, windows))
+
+    def fetch_ohlcv_many(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        threads: Union[bool, int] = True,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch OHLCV data for many tickers with grouped yfinance downloads
+        (one per intraday window, see `_plan_windows`).
+
+        yfinance fans the request out over its own worker threads and returns a
+        single frame with (ticker, field) MultiIndex columns on a shared time
+        index, which is split here into per-symbol standardized frames.
+
+        Args:
+            symbols (List[str]): Stock ticker symbols (e.g., ['AAPL', 'MSFT']).
+            interval (str): Timeframe (e.g., '1d', '1h').
+            start_date (Optional[datetime]): Start date (UTC).
+            end_date (Optional[datetime]): End date (UTC).
+            threads (Union[bool, int]): yfinance download threads (True = automatic).
+
+        Returns:
+            Dict[str, pd.DataFrame]: Standardized OHLCV data per symbol
+                                     (empty frame for tickers that returned nothing).
+        """
+        if not symbols:
+            return {}
+
+        windows: List[Tuple[Optional[datetime], Optional[datetime]]]
+        if start_date is None:
+            windows = [(None, end_date)]
+        else:
+            windows = list(self._plan_windows(interval, start_date, end_date))
+
+        def fetch_window(
+            window: Tuple[Optional[datetime], Optional[datetime]]
+        ) -> Dict[str, pd.DataFrame]:
+            raw = self._download(symbols, interval, *window, grouped=True, threads=threads)
+            return self._split_grouped(raw, symbols, *window)
+
+        per_window = self._map_windows(fetch_window, windows)
+        return {
+            symbol: self._merge_windows([frames[symbol] for frames in per_window])
+            for symbol in symbols
+        }
+
+    def iter_ohlcv(
+        self,
+        symbol: str,
+        interval: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 1000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Lazily fetch OHLCV data from Yahoo Finance window by window.
+
+        Yahoo Finance has no cursor-based pagination, so the requested range is
+        split into consecutive time windows spanning roughly `limit` candles each.
+        Every window is downloaded, normalized and yielded before the next one
+        is requested.
+
+        Args:
+            symbol (str): Stock ticker symbol (e.g., 'AAPL', 'TSLA').
+            interval (str): Timeframe (e.g., '1d', '1h').
+            start_date (Optional[datetime]): Start date (UTC).
+                                             If None, a single default-period request is made.
+            end_date (Optional[datetime]): End date (UTC). Defaults to now.
+            limit (int): Approximate number of candles per window.
+
+        Yields:
+            pd.DataFrame: A standardized (non-empty) OHLCV window.
+        """
+        if start_date is None:
+            # No anchor to plan windows from: defer to yfinance's default period.
+            df = self.fetch_ohlcv(symbol, interval, start_date, end_date)
+            if not df.empty:
+                yield df
+            return
+
+        end = end_date or datetime.now(timezone.utc)
+        window = interval_to_timedelta(interval) * max(limit, 1)
+
+        window_start = self._clip_to_history(interval, start_date)
+        while window_start < end:
+            window_end = min(window_start + window, end)
+            is_last = window_end >= end
+
+            page = self.fetch_ohlcv(symbol, interval, window_start, window_end)
+
+            # Windows share their boundary; keep it only in the later window
+            # (except for the final one, where end_date is inclusive).
+            if not page.empty and not is_last:
+                page = page[page['time'] < window_end]
+
+            if not page.empty:
+                yield page.reset_index(drop=True)
+
+            window_start = window_end
+
+    @staticmethod
+    def _plan_windows(
+        interval: str,
+        start_date: datetime,
+        end_date: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Split [start_date, end_date] into windows that respect Yahoo's intraday limits.
+
+        The start is clipped to the provider's maximum history, and the range is
+        cut into consecutive windows no longer than the per-request span.
+        Non-intraday intervals are returned as a single window.
+
+        Args:
+            interval (str): Timeframe (e.g., '1m', '1h', '1d').
+            start_date (datetime): Requested start (UTC).
+            end_date (Optional[datetime]): Requested end (UTC). Defaults to now.
+            now (Optional[datetime]): Reference time for the history limit (testing).
+
+        Returns:
+            List[Tuple[datetime, datetime]]: Ordered windows (empty if nothing is fetchable).
+        """
+        now = now or datetime.now(timezone.utc)
+        end = end_date or now
+
+        limits = YAHOO_INTRADAY_LIMITS.get(interval)
+        if limits is None:
+            return [(start_date, end)]
+
+        span, _ = limits
+        start = YahooFinanceFetcher._clip_to_history(interval, start_date, now)
+
+        windows: List[Tuple[datetime, datetime]] = []
+        window_start = start
+        while window_start < end:
+            window_end = min(window_start + span, end)
+            windows.append((window_start, window_end))
+            window_start = window_end
+
+        return windows
+
+    @staticmethod
+    def _clip_to_history(
+        interval: str, start_date: datetime, now: Optional[datetime] = None
+    ) -> datetime:
+        """
+        Move `start_date` forward to the oldest candle Yahoo still serves for `interval`.
+
+        Args:
+            interval (str): Timeframe (e.g., '1m').
+            start_date (datetime): Requested start (UTC).
+            now (Optional[datetime]): Reference time for the history limit (testing).
+
+        Returns:
+            datetime: The (possibly clipped) start.
+        """
+        limits = YAHOO_INTRADAY_LIMITS.get(interval)
+        if limits is None:
+            return start_date
+
+        history = limits[1]
+        earliest = (now or datetime.now(timezone.utc)) - history + YAHOO_HISTORY_MARGIN
+        if start_date >= earliest:
+            return start_date
+
+        logger.warning(
+            f"Yahoo keeps only {history.days} days of '{interval}' data. "
+            f"Clipping start {start_date} to {earliest}."
+        )
+        return earliest
+
+    def _map_windows(
+        self, fn: Callable[[Any], T], windows: List[Any]
+    ) -> List[T]:
+        """
+        Apply `fn` to every window, concurrently when there is more than one.
+
+        Returns:
+            List[T]: Results in window order.
+        """
+        if len(windows) <= 1:
+            return [fn(window) for window in windows]
+
+        workers = min(self.max_workers, len(windows))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="yahoo-window") as executor:
+            return list(executor.map(fn, windows))
+
+    @staticmethod
+    def _merge_windows(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate per-window frames, de-duplicating shared boundary candles.
+        """
+        frames = [f for f in frames if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+        if len(frames) == 1:
+            return frames[0].reset_index(drop=True)
+
+        merged = pd.concat(frames, ignore_index=True)
+        merged = merged.drop_duplicates(subset=["time"], keep="last")
+        return merged.sort_values("time").reset_index(drop=True)
+
+    def _download(
+        self,
+        tickers: Union[str, List[str]],
+        interval: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        grouped: bool = False,
+        threads: Union[bool, int] = True,
+    ) -> pd.DataFrame:
+        """
+        Perform one `yf.download` call (flat columns, or (ticker, field) if grouped).
+
+        Raises:
+            RuntimeError: If the download fails.
+        """
+        # yfinance issues one HTTP request per ticker.
+        requests = 1 if isinstance(tickers, str) else len(tickers)
+        for _ in range(requests):
+            self.rate_limiter.acquire(1)
+
         try:
-            # Fetch data using yfinance
             # We pass datetime objects directly to let yfinance handle precision.
             # auto_adjust=True ensures we get split/dividend adjusted prices.
-            df = yf.download(
-                tickers=symbol,
+            if grouped:
+                return yf.download(
+                    tickers=tickers,
+                    start=start_date,
+                    end=end_date,
+                    interval=interval,
+                    auto_adjust=True,
+                    progress=False,
+                    group_by="ticker",
+                    threads=threads,
+                    multi_level_index=True,  # Always (ticker, field), even for one ticker
+                )
+            return yf.download(
+                tickers=tickers,
                 start=start_date,
                 end=end_date,
                 interval=interval,
@@ -68,8 +363,50 @@ class YahooFinanceFetcher(BaseDataFetcher):
                 multi_level_index=False  # Ensure flat columns (New in yfinance 0.2.x)
             )
         except Exception as e:
-            raise RuntimeError(f"Failed to fetch stock data for {symbol}: {str(e)}") from e
+            label = tickers if isinstance(tickers, str) else f"{len(tickers)} symbols"
+            raise RuntimeError(f"Failed to fetch stock data for {label}: {str(e)}") from e
+
+    def _split_grouped(
+        self,
+        df: pd.DataFrame,
+        symbols: List[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Split a grouped (ticker, field) download into standardized per-symbol frames.
+        """
+        returned = set(df.columns.get_level_values(0)) if not df.empty else set()
 
+        frames: Dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            if symbol not in returned:
+                frames[symbol] = pd.DataFrame()
+                continue
+
+            # Tickers share one index; rows where this ticker did not trade are all-NaN.
+            frame = df[symbol].dropna(how="all").rename_axis(columns=None)
+            frames[symbol] = self._normalize_ohlcv(frame, start_date, end_date)
+
+        return frames
+
+    def _normalize_ohlcv(
+        self,
+        df: pd.DataFrame,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """
+        Convert a raw (single-ticker, flat-column) yfinance frame into the standardized schema.
+
+        Args:
+            df (pd.DataFrame): Raw frame returned by `yf.download`.
+            start_date (Optional[datetime]): Inclusive lower bound used to trim the result.
+            end_date (Optional[datetime]): Inclusive upper bound used to trim the result.
+
+        Returns:
+            pd.DataFrame: Standardized OHLCV data (empty if no data).
+        """
         if df.empty:
             return pd.DataFrame()
 
@@ -78,11 +415,11 @@ class YahooFinanceFetcher(BaseDataFetcher):
         # ---------------------------------------------------------
 
         # 1. Reset Index (Date is usually the index in yfinance)
-        df.reset_index(inplace=True)
+        df = df.reset_index()
 
         # 2. Rename columns to match our standard schema (lowercase)
         # Handle cases where column names might vary slightly between versions
-        df.rename(columns={
+        df = df.rename(columns={
             'Date': 'time',
             'Datetime': 'time',
             'Open': 'open',
@@ -90,7 +427,7 @@ class YahooFinanceFetcher(BaseDataFetcher):
             'Low': 'low',
             'Close': 'close',
             'Volume': 'volume'
-        }, inplace=True)
+        })
 
         # 3. Handle Timezone
         # Standardize to UTC.
@@ -140,6 +477,8 @@ class YahooFinanceFetcher(BaseDataFetcher):
         """
         try:
             ticker = yf.Ticker(symbol)
+            # `.info` is one quote-summary request (heavily throttled by Yahoo).
+            self.rate_limiter.acquire(1)
             # info dict keys can be unstable in yfinance, so we use safe .get()
             info = ticker.info
 
@@ -0,0 +1,291 @@
+"""
+Bulk Loader Module.
+
+This module implements the high-throughput write path for time-series data.
+Instead of building one giant parameterized `INSERT ... VALUES` statement
+(which is slow to construct in Python and capped by PostgreSQL's 65,535 bind
+parameter limit), data is streamed into a temporary staging table with the
+`COPY` protocol and merged into the target hypertable with a single
+set-based `INSERT ... SELECT ... ON CONFLICT DO UPDATE`.
+
+Workflow:
+    1. Serialize the DataFrame into an in-memory CSV buffer (vectorized).
+    2. COPY the buffer into a transaction-scoped TEMP staging table.
+    3. Merge staging -> hypertable in one statement (Upsert).
+
+Compressed chunks touched by a batch (late writes) are decompressed for the
+merge and recompressed afterwards, in the same transaction
+(see src/database/compression.py).
+
+Sentiment rows arrive in small batches (tens to hundreds of scored headlines),
+so `upsert_market_sentiment` skips the staging table and writes each batch
+with one multi-row `INSERT ... VALUES ... ON CONFLICT DO UPDATE`.
+
+Note:
+    `copy_upsert_market_quotes` and `upsert_market_sentiment` DO NOT commit.
+    Transaction boundaries are owned by the caller (ETL scripts), consistent
+    with `SessionLocal`'s `autocommit=False` configuration. The only exception
+    is the streaming writer (`stream_upsert_market_quotes`), whose contract is
+    to commit each chunk independently.
+"""
+
+import io
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.database.compression import decompressed_at, decompressed_range
+from src.database.models import MarketSentiment
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Column order shared by the CSV buffer, the staging table and the merge statement.
+MARKET_QUOTE_COLUMNS: List[str] = [
+    "time",
+    "asset_id",
+    "interval",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+]
+
+# Columns refreshed when a candle already exists (late corrections, re-runs).
+_MARKET_QUOTE_UPDATE_COLUMNS: List[str] = ["open", "high", "low", "close", "volume"]
+
+_STAGING_TABLE = "_stage_market_quotes"
+
+
+# Conflict target (primary key). "interval" is an SQL keyword and must be quoted.
+_MARKET_QUOTE_KEY = 'time, asset_id, "interval"'
+
+
+# Primary key and refreshed columns of 'market_sentiment'.
+MARKET_SENTIMENT_KEY: List[str] = ["time", "asset_id", "source"]
+_MARKET_SENTIMENT_UPDATE_COLUMNS: List[str] = [
+    "headline",
+    "sentiment_score",
+    "impact_score",
+    "confidence",
+    "topics",
+]
+
+
+def _quote(column: str) -> str:
+    """Quote a column name for raw SQL (only needed for keywords)."""
+    return f'"{column}"' if column == "interval" else column
+
+
+def dataframe_to_csv_buffer(
+    df: pd.DataFrame, asset_id: int, interval: str
+) -> io.StringIO:
+    """
+    Serialize a standardized OHLCV DataFrame into a CSV buffer for COPY.
+
+    The conversion is fully vectorized (no per-row Python loop). NaN values
+    are written as the literal 'NaN' so PostgreSQL stores them as DOUBLE
+    PRECISION NaN (matching the legacy VALUES path) instead of NULL.
+
+    Args:
+        df (pd.DataFrame): DataFrame with columns time, open, high, low, close, volume.
+        asset_id (int): The foreign key ID of the asset.
+        interval (str): Candle resolution of the frame (e.g., '1m').
+
+    Returns:
+        io.StringIO: A buffer positioned at the start, ready for `copy_expert`.
+    """
+    frame = df[["time", "open", "high", "low", "close", "volume"]].copy()
+    frame.insert(1, "asset_id", asset_id)
+    frame.insert(2, "interval", interval)
+
+    buffer = io.StringIO()
+    frame.to_csv(
+        buffer,
+        index=False,
+        header=False,
+        columns=MARKET_QUOTE_COLUMNS,
+        na_rep="NaN",
+        date_format="%Y-%m-%d %H:%M:%S.%f%z",
+    )
+    buffer.seek(0)
+    return buffer
+
+
+def copy_upsert_market_quotes(
+    session: Session, asset_id: int, df: pd.DataFrame, interval: str
+) -> int:
+    """
+    Upsert OHLCV data into 'market_quotes' using COPY + staging merge.
+
+    Args:
+        session (Session): The database session (transaction is NOT committed).
+        asset_id (int): The foreign key ID of the asset.
+        df (pd.DataFrame): The DataFrame containing OHLCV data.
+        interval (str): Candle resolution of the frame (part of the primary key).
+
+    Returns:
+        int: Number of records staged and merged.
+    """
+    if df.empty:
+        return 0
+
+    buffer = dataframe_to_csv_buffer(df, asset_id, interval)
+    columns = ", ".join(_quote(c) for c in MARKET_QUOTE_COLUMNS)
+    updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in _MARKET_QUOTE_UPDATE_COLUMNS)
+
+    # Access the raw DBAPI (psycopg2) connection bound to the session's transaction.
+    raw_connection = session.connection().connection
+    first = df["time"].min().to_pydatetime()
+    last = df["time"].max().to_pydatetime()
+
+    with decompressed_range(session, "market_quotes", first, last):
+        cursor = raw_connection.cursor()
+        try:
+            # 1. Staging table lives only for this transaction.
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+                f"(LIKE market_quotes INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+
+            # 2. Stream the CSV buffer into staging (no bind parameters involved).
+            cursor.copy_expert(
+                f"COPY {_STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+
+            # 3. Set-based merge. DISTINCT ON guards against duplicate keys inside
+            #    the batch, which would otherwise abort ON CONFLICT DO UPDATE.
+            cursor.execute(
+                f"INSERT INTO market_quotes ({columns}) "
+                f"SELECT DISTINCT ON ({_MARKET_QUOTE_KEY}) {columns} "
+                f"FROM {_STAGING_TABLE} "
+                f"ORDER BY {_MARKET_QUOTE_KEY} "
+                f"ON CONFLICT ({_MARKET_QUOTE_KEY}) DO UPDATE SET {updates}"
+            )
+
+            # Drop eagerly so the caller may load several batches in one transaction.
+            cursor.execute(f"DROP TABLE {_STAGING_TABLE}")
+        finally:
+            cursor.close()
+
+    logger.debug(
+        f"COPY-merged {len(df)} rows into market_quotes "
+        f"(asset_id={asset_id}, interval={interval})."
+    )
+    return len(df)
+
+
+def stream_upsert_market_quotes(
+    session: Session,
+    asset_id: int,
+    frames: Iterable[pd.DataFrame],
+    interval: str,
+    chunk_rows: int = 50_000,
+    chunk_bytes: Optional[int] = None,
+) -> int:
+    """
+    Upsert a stream of OHLCV pages in independently committed chunks.
+
+    Pages are buffered until either `chunk_rows` or `chunk_bytes` is reached,
+    then flushed through `copy_upsert_market_quotes` and COMMITTED. Peak memory
+    is bounded by one chunk regardless of the total date range, and a failure
+    only rolls back the chunk in flight (earlier chunks stay persisted, so a
+    re-run can resume from the database watermark).
+
+    Args:
+        session (Session): The database session.
+        asset_id (int): The foreign key ID of the asset.
+        frames (Iterable[pd.DataFrame]): Standardized OHLCV pages (e.g. `iter_ohlcv`).
+        interval (str): Candle resolution of the pages.
+        chunk_rows (int): Flush threshold in rows.
+        chunk_bytes (Optional[int]): Optional flush threshold in in-memory bytes.
+
+    Returns:
+        int: Total number of records written.
+
+    Raises:
+        ValueError: If `chunk_rows` is not positive.
+        Exception: Re-raises the first load error after rolling back the current chunk.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("chunk_rows must be a positive integer.")
+
+    pending: List[pd.DataFrame] = []
+    pending_rows = 0
+    pending_bytes = 0
+    total = 0
+    chunks = 0
+
+    def flush() -> None:
+        nonlocal pending, pending_rows, pending_bytes, total, chunks
+        if not pending:
+            return
+        chunk = pd.concat(pending, ignore_index=True)
+        pending, pending_rows, pending_bytes = [], 0, 0
+
+        try:
+            total += copy_upsert_market_quotes(session, asset_id, chunk, interval)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        chunks += 1
+        logger.info(
+            f"Committed chunk #{chunks} ({len(chunk)} rows, {total} total) "
+            f"for asset_id={asset_id}."
+        )
+
+    for frame in frames:
+        if frame.empty:
+            continue
+
+        pending.append(frame)
+        pending_rows += len(frame)
+        pending_bytes += int(frame.memory_usage(index=True).sum())
+
+        if pending_rows >= chunk_rows or (chunk_bytes and pending_bytes >= chunk_bytes):
+            flush()
+
+    flush()
+    return total
+
+
+def upsert_market_sentiment(session: Session, rows: Sequence[Dict[str, Any]]) -> int:
+    """
+    Upsert scored headlines into 'market_sentiment' with a single statement.
+
+    Rows sharing a primary key (time, asset_id, source) are collapsed to the
+    last one, since ON CONFLICT DO UPDATE cannot touch a row twice.
+
+    Args:
+        session (Session): The database session (transaction is NOT committed).
+        rows (Sequence[Dict[str, Any]]): Column values per row ('time' must be
+            timezone-aware; 'topics' is optional).
+
+    Returns:
+        int: Number of distinct rows written.
+    """
+    if not rows:
+        return 0
+
+    unique = list(
+        {tuple(row[c] for c in MARKET_SENTIMENT_KEY): row for row in rows}.values()
+    )
+    stmt = insert(MarketSentiment).values(unique)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=MARKET_SENTIMENT_KEY,
+        set_={c: stmt.excluded[c] for c in _MARKET_SENTIMENT_UPDATE_COLUMNS},
+    )
+
+    # Headlines are sparse in time: only decompress chunks holding a row.
+    with decompressed_at(session, "market_sentiment", (row["time"] for row in unique)):
+        session.execute(stmt)
+
+    logger.debug(f"Upserted {len(unique)} rows into market_sentiment.")
+    return len(unique)
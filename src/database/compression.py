@@ -0,0 +1,175 @@
+"""
+Compressed Chunk Write Guard.
+
+Hypertable chunks older than the compression policy threshold are stored in
+TimescaleDB's columnar compressed format (see
+database/init/06_compression_retention.sql). Late writes into those chunks
+(gap repairs, backfills, incremental overlaps) are either rejected or
+decompressed row-segment by row-segment inside the INSERT, depending on the
+TimescaleDB version, which is slow for set-based merges.
+
+This module lets loaders decompress exactly the chunks a batch touches, run
+the merge at full speed against plain heap tables, and recompress the same
+chunks before the transaction commits. A rollback restores the compressed
+state, so the guard is atomic with the write.
+
+Contiguous batches (candle pages) use `decompressed_range`; sparse batches
+(news headlines spread over months) use `decompressed_at`, which only touches
+the chunks that contain one of the written timestamps.
+
+Example:
+    with decompressed_range(session, "market_quotes", first, last):
+        ...  # COPY + merge
+"""
+
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterable, Iterator, List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+_COMPRESSED_CHUNKS_SQL = text(
+    """
+    SELECT format('%I.%I', chunk_schema, chunk_name)
+    FROM timescaledb_information.chunks
+    WHERE hypertable_name = :hypertable
+      AND is_compressed
+      AND range_end > :start
+      AND range_start <= :end
+    ORDER BY range_start
+    """
+)
+
+_COMPRESSED_CHUNKS_AT_SQL = text(
+    """
+    SELECT format('%I.%I', chunk_schema, chunk_name)
+    FROM timescaledb_information.chunks
+    WHERE hypertable_name = :hypertable
+      AND is_compressed
+      AND EXISTS (
+          SELECT 1 FROM unnest(CAST(:times AS timestamptz[])) AS t(time)
+          WHERE t.time >= range_start AND t.time < range_end
+      )
+    ORDER BY range_start
+    """
+)
+
+_DECOMPRESS_SQL = text(
+    "SELECT decompress_chunk(CAST(:chunk AS regclass), if_compressed => TRUE)"
+)
+_COMPRESS_SQL = text(
+    "SELECT compress_chunk(CAST(:chunk AS regclass), if_not_compressed => TRUE)"
+)
+
+
+def compressed_chunks(
+    session: Session, hypertable: str, start: datetime, end: datetime
+) -> List[str]:
+    """
+    List the compressed chunks of a hypertable that overlap [start, end].
+
+    Args:
+        session (Session): The database session.
+        hypertable (str): Hypertable name (e.g., 'market_quotes').
+        start (datetime): Inclusive start of the written range.
+        end (datetime): Inclusive end of the written range.
+
+    Returns:
+        List[str]: Qualified chunk names in time order.
+    """
+    params = {"hypertable": hypertable, "start": start, "end": end}
+    return list(session.execute(_COMPRESSED_CHUNKS_SQL, params).scalars().all())
+
+
+def compressed_chunks_at(
+    session: Session, hypertable: str, times: Iterable[datetime]
+) -> List[str]:
+    """
+    List the compressed chunks of a hypertable that contain any of `times`.
+
+    Args:
+        session (Session): The database session.
+        hypertable (str): Hypertable name (e.g., 'market_sentiment').
+        times (Iterable[datetime]): Timestamps of the written rows.
+
+    Returns:
+        List[str]: Qualified chunk names in time order.
+    """
+    params = {"hypertable": hypertable, "times": sorted(set(times))}
+    if not params["times"]:
+        return []
+    return list(session.execute(_COMPRESSED_CHUNKS_AT_SQL, params).scalars().all())
+
+
+@contextmanager
+def decompressed_range(
+    session: Session, hypertable: str, start: datetime, end: datetime
+) -> Iterator[List[str]]:
+    """
+    Decompress the chunks overlapping [start, end] for the duration of a write.
+
+    The chunks are recompressed when the block exits normally. On error nothing
+    is recompressed; the caller's rollback restores the original state.
+
+    Args:
+        session (Session): The database session (transaction is NOT committed).
+        hypertable (str): Hypertable name.
+        start (datetime): Inclusive start of the written range.
+        end (datetime): Inclusive end of the written range.
+
+    Yields:
+        List[str]: The chunks that were decompressed (usually empty).
+    """
+    chunks = compressed_chunks(session, hypertable, start, end)
+    with _decompressed(session, hypertable, chunks, f"{start} .. {end}"):
+        yield chunks
+
+
+@contextmanager
+def decompressed_at(
+    session: Session, hypertable: str, times: Iterable[datetime]
+) -> Iterator[List[str]]:
+    """
+    Decompress only the chunks containing `times` for the duration of a write.
+
+    Unlike `decompressed_range`, chunks between sparse timestamps are left
+    compressed. Recompression and error handling are the same.
+
+    Args:
+        session (Session): The database session (transaction is NOT committed).
+        hypertable (str): Hypertable name.
+        times (Iterable[datetime]): Timestamps of the written rows.
+
+    Yields:
+        List[str]: The chunks that were decompressed (usually empty).
+    """
+    distinct = set(times)
+    chunks = compressed_chunks_at(session, hypertable, distinct)
+    with _decompressed(session, hypertable, chunks, f"{len(distinct)} timestamps"):
+        yield chunks
+
+
+@contextmanager
+def _decompressed(
+    session: Session, hypertable: str, chunks: List[str], span: str
+) -> Iterator[None]:
+    """Decompress `chunks`, run the block, then recompress them."""
+    if chunks:
+        logger.info(
+            f"Late write into {len(chunks)} compressed {hypertable} chunks "
+            f"({span}); decompressing."
+        )
+    for chunk in chunks:
+        session.execute(_DECOMPRESS_SQL, {"chunk": chunk})
+
+    yield
+
+    for chunk in chunks:
+        session.execute(_COMPRESS_SQL, {"chunk": chunk})
+    if chunks:
+        logger.info(f"Recompressed {len(chunks)} {hypertable} chunks.")
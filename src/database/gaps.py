@@ -0,0 +1,223 @@
+"""
+Gap Detection Module.
+
+This module locates holes in the 'market_quotes' time series so they can be
+repaired with targeted fetches instead of wide re-backfills.
+
+A gap is reported as an inclusive range of MISSING candle open times
+`(first_missing, last_missing)`. Interior gaps are computed in SQL with a
+`lag()` window over one asset's rows (served by the (asset_id, time DESC)
+index); `find_gaps` is the vectorized NumPy equivalent for in-memory series.
+
+Note:
+    Scans are restricted to one stored resolution ('market_quotes.interval').
+    Markets with trading hours (stocks) report closed sessions as gaps; use
+    `min_candles` to skip short, expected holes.
+"""
+
+import logging
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.core.timeframes import interval_to_timedelta
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Inclusive range of missing candle open times.
+Gap = Tuple[datetime, datetime]
+
+_INTERIOR_GAPS_SQL = text(
+    """
+    SELECT prev_time + :step AS gap_start, time - :step AS gap_end
+    FROM (
+        SELECT time, lag(time) OVER (ORDER BY time) AS prev_time
+        FROM market_quotes
+        WHERE asset_id = :asset_id AND "interval" = :interval
+          AND time >= :start AND time <= :end
+    ) t
+    WHERE time - prev_time > :step
+    ORDER BY gap_start
+    """
+)
+
+_BOUNDS_SQL = text(
+    """
+    SELECT min(time), max(time)
+    FROM market_quotes
+    WHERE asset_id = :asset_id AND "interval" = :interval
+      AND time >= :start AND time <= :end
+    """
+)
+
+
+def _edge_gaps(
+    first: Optional[datetime],
+    last: Optional[datetime],
+    step: timedelta,
+    start: datetime,
+    end: datetime,
+) -> Tuple[Optional[Gap], Optional[Gap]]:
+    """
+    Compute the leading and trailing gaps around the stored data.
+
+    Edges are anchored on the stored candles (not on the epoch), so grids with
+    an offset (e.g., weekly candles opening on Monday) are handled correctly.
+
+    Returns:
+        Tuple[Optional[Gap], Optional[Gap]]: (leading, trailing) gap, if any.
+    """
+    if first is None or last is None:
+        # No data at all in the range: everything is missing.
+        return (start, end), None
+
+    leading: Optional[Gap] = None
+    missing_before = (first - start) // step
+    if missing_before > 0:
+        leading = (first - missing_before * step, first - step)
+
+    trailing: Optional[Gap] = None
+    missing_after = (end - last) // step
+    if missing_after > 0:
+        trailing = (last + step, last + missing_after * step)
+
+    return leading, trailing
+
+
+def _assemble(
+    interior: Sequence[Gap],
+    leading: Optional[Gap],
+    trailing: Optional[Gap],
+    step: timedelta,
+    min_candles: int,
+) -> List[Gap]:
+    """Combine edge and interior gaps in time order, dropping short ones."""
+    gaps = ([leading] if leading else []) + list(interior) + ([trailing] if trailing else [])
+    return [g for g in gaps if count_candles(g, step) >= min_candles]
+
+
+def count_candles(gap: Gap, step: timedelta) -> int:
+    """
+    Number of candles covered by an inclusive gap range.
+
+    Args:
+        gap (Gap): Inclusive (first, last) range of candle open times.
+        step (timedelta): Candle spacing.
+
+    Returns:
+        int: Candle count.
+    """
+    return (gap[1] - gap[0]) // step + 1
+
+
+def scan_gaps(
+    session: Session,
+    asset_id: int,
+    interval: str,
+    start: datetime,
+    end: datetime,
+    min_candles: int = 1,
+) -> List[Gap]:
+    """
+    Find missing candle ranges of one asset/resolution within [start, end] using SQL.
+
+    Args:
+        session (Session): The database session.
+        asset_id (int): The asset to scan.
+        interval (str): Stored resolution to scan (e.g., '1m'); defines the
+                        expected candle spacing.
+        start (datetime): Inclusive start of the scanned range (UTC).
+        end (datetime): Inclusive end of the scanned range (UTC).
+        min_candles (int): Ignore gaps shorter than this many candles.
+
+    Returns:
+        List[Gap]: Missing ranges in time order.
+    """
+    step = interval_to_timedelta(interval)
+    params = {"asset_id": asset_id, "interval": interval, "start": start, "end": end}
+
+    first, last = session.execute(_BOUNDS_SQL, params).one()
+    leading, trailing = _edge_gaps(first, last, step, start, end)
+
+    interior: List[Gap] = []
+    if first is not None:
+        rows = session.execute(_INTERIOR_GAPS_SQL, {**params, "step": step}).all()
+        interior = [(gap_start, gap_end) for gap_start, gap_end in rows]
+
+    return _assemble(interior, leading, trailing, step, min_candles)
+
+
+def find_gaps(
+    times: pd.Series,
+    step: timedelta,
+    start: datetime,
+    end: datetime,
+    min_candles: int = 1,
+) -> List[Gap]:
+    """
+    Find missing candle ranges in an in-memory series of candle times (vectorized).
+
+    Args:
+        times (pd.Series): UTC-aware candle open times (any order, duplicates allowed).
+        step (timedelta): Expected candle spacing.
+        start (datetime): Inclusive start of the scanned range (UTC).
+        end (datetime): Inclusive end of the scanned range (UTC).
+        min_candles (int): Ignore gaps shorter than this many candles.
+
+    Returns:
+        List[Gap]: Missing ranges in time order.
+    """
+    in_range = times[(times >= start) & (times <= end)]
+    if in_range.empty:
+        return _assemble([], *_edge_gaps(None, None, step, start, end), step, min_candles)
+
+    ns = np.unique(in_range.to_numpy(dtype="datetime64[ns]").astype(np.int64))
+    step_ns = int(step / timedelta(microseconds=1)) * 1_000
+
+    breaks = np.flatnonzero(np.diff(ns) > step_ns)
+    gap_starts = pd.to_datetime(ns[breaks] + step_ns, utc=True)
+    gap_ends = pd.to_datetime(ns[breaks + 1] - step_ns, utc=True)
+    interior = [(s.to_pydatetime(), e.to_pydatetime()) for s, e in zip(gap_starts, gap_ends)]
+
+    first = pd.Timestamp(ns[0], tz="UTC").to_pydatetime()
+    last = pd.Timestamp(ns[-1], tz="UTC").to_pydatetime()
+    return _assemble(interior, *_edge_gaps(first, last, step, start, end), step, min_candles)
+
+
+def merge_gaps(gaps: Sequence[Gap], step: timedelta, page_candles: int = 1000) -> List[Gap]:
+    """
+    Batch gaps into the fewest fetch ranges.
+
+    Two neighbouring ranges are merged whenever fetching their union (including
+    the already-stored candles between them) takes fewer paginated requests
+    than fetching them separately. Re-fetched candles are harmless: the loader
+    upserts.
+
+    Args:
+        gaps (Sequence[Gap]): Missing ranges in time order.
+        step (timedelta): Candle spacing.
+        page_candles (int): Candles returned per API request.
+
+    Returns:
+        List[Gap]: Fetch ranges in time order.
+    """
+
+    def pages(gap: Gap) -> int:
+        return math.ceil(count_candles(gap, step) / page_candles)
+
+    merged: List[Gap] = []
+    for gap in gaps:
+        if merged:
+            union = (merged[-1][0], gap[1])
+            if pages(union) < pages(merged[-1]) + pages(gap):
+                merged[-1] = union
+                continue
+        merged.append(gap)
+
+    return merged
@@ -115,9 +115,13 @@ class MarketQuote(Base):
 
     __tablename__ = "market_quotes"
 
-    # Composite Primary Key (Time + Asset) for TimescaleDB
+    # Composite Primary Key (Time + Asset + Resolution) for TimescaleDB
     time: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id"), primary_key=True)
+    # Candle resolution (e.g., '1m', '1d'). Always quoted: INTERVAL is an SQL keyword.
+    interval: Mapped[str] = mapped_column(
+        "interval", String(10), primary_key=True, quote=True
+    )
 
     # OHLCV Data
     open: Mapped[float] = mapped_column(Double, nullable=False)
@@ -134,7 +138,10 @@ class MarketQuote(Base):
     asset: Mapped["Asset"] = relationship(back_populates="quotes")
 
     def __repr__(self) -> str:
-        return f"<MarketQuote(time='{self.time}', asset_id={self.asset_id}, close={self.close})>"
+        return (
+            f"<MarketQuote(time='{self.time}', asset_id={self.asset_id}, "
+            f"interval='{self.interval}', close={self.close})>"
+        )
 
 
 class FinancialStatement(Base):
@@ -0,0 +1,375 @@
+"""
+OHLCV Read-Through Cache.
+
+Research notebooks re-read the same historical ranges over and over. This
+module sits in front of `load_ohlcv_arrow` and keeps every CLOSED month of
+candles as an uncompressed Arrow IPC file per (asset, interval, month):
+
+    <cache_dir>/<base_interval>/<interval>/<asset_id>/2024-01.arrow
+
+Cached months are opened with `pyarrow.memory_map`, so repeated loads are
+zero-copy local reads. Only uncached months and the still-open tail (months
+ending less than `settle` ago) are read from the database, in one COPY per run
+of consecutive months. Months without candles are cached too (as empty files).
+
+Closed months are treated as immutable: after a gap repair or backfill of an
+old range, call `invalidate()` for the affected assets.
+
+The cache is bounded by size: when it grows beyond `max_bytes`, the least
+recently used files are deleted (reads refresh a file's mtime). Only intervals
+that divide a day are cached; their candles never straddle a month boundary.
+Other intervals (e.g., '1w') are passed through to the database.
+
+Example:
+    cache = OHLCVCache()
+    table = cache.load(["BTC/USDT"], start, end, "1h", exchange="BINANCE")
+    df = table.to_pandas()
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.timeframes import interval_to_timedelta
+from src.database.connection import SessionLocal
+from src.database.reader import (
+    AGGREGATE_BASE_INTERVAL,
+    OHLCV_ARROW_SCHEMA,
+    load_ohlcv_arrow,
+    resolve_symbols,
+)
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".arrow"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def month_start(value: datetime) -> datetime:
+    """Return the first instant (UTC) of the month containing `value`."""
+    value = value.astimezone(timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(month: datetime) -> datetime:
+    """Return the first instant of the month after `month` (a month start)."""
+    year, month_index = divmod(month.month, 12)
+    return month.replace(year=month.year + year, month=month_index + 1)
+
+
+def months_between(start: datetime, end: datetime) -> List[datetime]:
+    """
+    List the month starts overlapping [start, end).
+
+    Args:
+        start (datetime): Inclusive start (timezone-aware).
+        end (datetime): Exclusive end (timezone-aware).
+
+    Returns:
+        List[datetime]: Month starts in ascending order.
+    """
+    months = []
+    month = month_start(start)
+    while month < end:
+        months.append(month)
+        month = next_month(month)
+    return months
+
+
+def is_cacheable(interval: str) -> bool:
+    """
+    Check whether candles of `interval` align to month boundaries.
+
+    Args:
+        interval (str): Candle interval (e.g., '1m', '4h', '1d', '1w').
+
+    Returns:
+        bool: True if the interval divides a day.
+    """
+    if interval.endswith(("M", "mo")):
+        return False
+    step = interval_to_timedelta(interval)
+    return step <= timedelta(days=1) and timedelta(days=1) % step == timedelta(0)
+
+
+def _time_slice(table: pa.Table, start: datetime, end: datetime) -> pa.Table:
+    """
+    Zero-copy slice of a time-sorted table to [start, end).
+    """
+    times = table.column("time").cast(pa.int64()).to_numpy()
+    bounds = [(value - _EPOCH) // timedelta(microseconds=1) for value in (start, end)]
+    lo, hi = np.searchsorted(times, bounds, side="left")
+    return table.slice(int(lo), int(hi - lo))
+
+
+class OHLCVCache:
+    """
+    Size-bounded, memory-mapped cache of closed OHLCV months.
+
+    Attributes:
+        cache_dir (Path): Root directory of the cache files.
+        max_bytes (int): Size above which least recently used files are evicted.
+        settle (timedelta): Time after a month ends before it is considered closed
+                            (lets late candles and repairs land first).
+        hits (int): Cached (asset, month) reads served from disk.
+        misses (int): (asset, month) reads that went to the database.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        settle: timedelta = timedelta(days=1),
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (Optional[str]): Defaults to settings.OHLCV_CACHE_DIR.
+            max_bytes (Optional[int]): Defaults to settings.OHLCV_CACHE_MAX_BYTES.
+            settle (timedelta): Delay after a month's end before it is cached.
+        """
+        self.cache_dir = Path(cache_dir or settings.OHLCV_CACHE_DIR)
+        self.max_bytes = int(
+            settings.OHLCV_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.settle = settle
+        self.hits = 0
+        self.misses = 0
+
+    def path(
+        self, asset_id: int, interval: str, month: datetime, base_interval: str
+    ) -> Path:
+        """Return the cache file of one (asset, interval, month)."""
+        return (
+            self.cache_dir
+            / base_interval
+            / interval
+            / str(asset_id)
+            / f"{month:%Y-%m}{CACHE_SUFFIX}"
+        )
+
+    def load(
+        self,
+        symbols: Sequence[str],
+        start: datetime,
+        end: datetime,
+        interval: str,
+        exchange: Optional[str] = None,
+        base_interval: str = AGGREGATE_BASE_INTERVAL,
+        session: Optional[Session] = None,
+    ) -> pa.Table:
+        """
+        Read candles like `load_ohlcv_arrow`, serving closed months from disk.
+
+        Args:
+            symbols (Sequence[str]): Asset symbols.
+            start (datetime): Inclusive start (UTC).
+            end (datetime): Exclusive end (UTC).
+            interval (str): Requested candle interval.
+            exchange (Optional[str]): Exchange the symbols belong to.
+            base_interval (str): Resolution the assets were ingested at.
+            session (Optional[Session]): Session for database reads; a
+                                         short-lived session is opened when omitted.
+
+        Returns:
+            pa.Table: Same columns as `load_ohlcv_arrow`, sorted by (asset_id, time).
+
+        Raises:
+            ValueError: If the range is empty or the symbols/interval are invalid.
+            RuntimeError: If a database read fails.
+        """
+        if start >= end:
+            raise ValueError(f"Empty time range: {start} >= {end}.")
+        if not is_cacheable(interval):
+            logger.debug(f"'{interval}' is not month-aligned; bypassing the cache.")
+            return load_ohlcv_arrow(
+                symbols, start, end, interval, exchange, base_interval, session
+            )
+
+        owns_session = session is None
+        db = SessionLocal() if session is None else session
+        try:
+            symbol_by_id = resolve_symbols(db, symbols, exchange)
+            months = months_between(start, end)
+            closed_before = datetime.now(timezone.utc) - self.settle
+
+            parts: Dict[Tuple[int, datetime], pa.Table] = {}
+            missing: Dict[datetime, List[int]] = {}
+            for month in months:
+                closed = next_month(month) <= closed_before
+                for asset_id in sorted(symbol_by_id):
+                    path = self.path(asset_id, interval, month, base_interval)
+                    cached = self._read(path) if closed else None
+                    if cached is not None:
+                        parts[(asset_id, month)] = cached
+                        self.hits += 1
+                    else:
+                        missing.setdefault(month, []).append(asset_id)
+                        self.misses += 1
+
+            for run_months, asset_ids in _consecutive_runs(months, missing):
+                fetch_end = next_month(run_months[-1])
+                if fetch_end > closed_before:
+                    fetch_end = min(fetch_end, end)  # open tail: no need to read ahead
+                fetched = load_ohlcv_arrow(
+                    [symbol_by_id[asset_id] for asset_id in asset_ids],
+                    run_months[0],
+                    fetch_end,
+                    interval,
+                    exchange,
+                    base_interval,
+                    db,
+                )
+                for asset_id in asset_ids:
+                    asset_rows = _asset_slice(fetched, asset_id)
+                    for month in run_months:
+                        part = _time_slice(asset_rows, month, next_month(month))
+                        parts[(asset_id, month)] = part
+                        if next_month(month) <= closed_before:
+                            path = self.path(asset_id, interval, month, base_interval)
+                            self._write(path, part)
+        finally:
+            if owns_session:
+                db.close()
+
+        if missing:
+            self.evict()
+
+        tables = []
+        for asset_id in sorted(symbol_by_id):
+            for month in months:
+                part = parts[(asset_id, month)]
+                if month in (months[0], months[-1]):
+                    lo, hi = max(start, month), min(end, next_month(month))
+                    part = _time_slice(part, lo, hi)
+                tables.append(part)
+        table = pa.concat_tables(tables) if tables else OHLCV_ARROW_SCHEMA.empty_table()
+        logger.debug(
+            f"OHLCV cache: {table.num_rows:,} rows "
+            f"({self.hits} hits, {self.misses} misses so far)."
+        )
+        return table
+
+    def invalidate(self, asset_ids: Optional[Sequence[int]] = None) -> None:
+        """
+        Drop cached months (e.g., after repairing or backfilling old data).
+
+        Args:
+            asset_ids (Optional[Sequence[int]]): Assets to drop; None clears the cache.
+        """
+        if asset_ids is None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            return
+        wanted = {str(asset_id) for asset_id in asset_ids}
+        for directory in self.cache_dir.glob("*/*/*"):
+            if directory.name in wanted:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def size(self) -> int:
+        """Return the total size of the cache files in bytes."""
+        files = self.cache_dir.rglob(f"*{CACHE_SUFFIX}")
+        return sum(path.stat().st_size for path in files)
+
+    def evict(self) -> int:
+        """
+        Delete least recently used files until the cache fits `max_bytes`.
+
+        Returns:
+            int: Number of bytes freed.
+        """
+        files = []
+        for path in self.cache_dir.rglob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        excess = sum(size for _, size, _ in files) - self.max_bytes
+        freed = 0
+        for _, size, path in sorted(files):
+            if freed >= excess:
+                break
+            try:
+                path.unlink()
+                freed += size
+            except OSError as e:
+                logger.warning(f"Failed to evict cache file '{path}': {e}")
+        if freed:
+            logger.info(f"Evicted {freed:,} bytes from the OHLCV cache.")
+        return freed
+
+    def _read(self, path: Path) -> Optional[pa.Table]:
+        """
+        Memory-map one cached month (None on a miss or unreadable file).
+        """
+        try:
+            with pa.ipc.open_file(pa.memory_map(str(path), "r")) as reader:
+                table = reader.read_all()
+            os.utime(path)  # LRU bookkeeping
+            return table
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid) as e:
+            logger.warning(f"Ignoring unreadable cache file '{path}': {e}")
+            return None
+
+    def _write(self, path: Path, table: pa.Table) -> None:
+        """
+        Atomically write one month (temp file + rename).
+
+        Failures are logged and swallowed: the cache is an optimization only.
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as sink:
+                    with pa.ipc.new_file(sink, OHLCV_ARROW_SCHEMA) as writer:
+                        writer.write_table(table)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, pa.ArrowException) as e:
+            logger.warning(f"Failed to write cache file '{path}': {e}")
+
+
+def _asset_slice(table: pa.Table, asset_id: int) -> pa.Table:
+    """
+    Zero-copy slice of the rows of one asset (table sorted by asset_id).
+    """
+    ids = table.column("asset_id").to_numpy()
+    lo = int(np.searchsorted(ids, asset_id, side="left"))
+    hi = int(np.searchsorted(ids, asset_id, side="right"))
+    return table.slice(lo, hi - lo)
+
+
+def _consecutive_runs(
+    months: List[datetime], missing: Dict[datetime, List[int]]
+) -> List[Tuple[List[datetime], List[int]]]:
+    """
+    Group consecutive months missing the same assets (one database read each).
+    """
+    runs: List[Tuple[List[datetime], List[int]]] = []
+    for month in months:
+        asset_ids = missing.get(month)
+        if not asset_ids:
+            continue
+        if runs and runs[-1][1] == asset_ids and next_month(runs[-1][0][-1]) == month:
+            runs[-1][0].append(month)
+        else:
+            runs.append(([month], asset_ids))
+    return runs
@@ -0,0 +1,460 @@
+"""
+Parquet Data-Lake Export.
+
+This module dumps the time-series tables to a Hive-partitioned Parquet dataset
+for offline research (pandas, Polars, DuckDB, Spark) without touching the
+database:
+
+    <root>/market_quotes/asset_id=1/interval=1m/month=2024-01/part-0.parquet
+    <root>/market_sentiment/asset_id=1/month=2024-01/part-0.parquet
+    <root>/financial_statements/asset_id=7/year=2024/part-0.parquet
+
+Partition columns are encoded in the directory names only (Hive convention);
+`pyarrow.dataset.dataset(path, partitioning="hive")` restores them.
+
+Rows are pulled through a server-side cursor and written partition by partition
+in fixed-size row groups, so memory stays constant however large the table is.
+
+Incremental exports: the latest exported `time` of every partition key
+(asset_id, plus interval for market_quotes) is kept in
+`<root>/_export_state.json`. The next run re-exports, per key, every partition
+from the one containing its watermark onwards, replacing those partitions
+whole, so repeated runs never duplicate rows. Keys without a watermark (newly
+added assets or intervals) are exported in full. Backfills or corrections
+older than a key's watermark require a full export (`full=True`).
+
+Example:
+    with SessionLocal() as session:
+        run_export(session, Path("data/lake"), ["market_quotes"])
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import groupby
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy.orm import Session
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "_export_state.json"
+PART_FILE = "part-0.parquet"
+# Dot-prefixed: ignored by dataset readers until renamed into place.
+_TMP_FILE = f".{PART_FILE}.tmp"
+
+DEFAULT_BATCH_ROWS = 50_000
+DEFAULT_ROW_GROUP_ROWS = 250_000
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """
+    How one table is exported.
+
+    Attributes:
+        table (str): Source table name (also the dataset directory name).
+        schema (pa.Schema): Arrow schema of the data columns written to the files.
+        partition_by (Tuple[str, ...]): Key columns encoded as directories.
+        period (str): Time partition granularity ('month' or 'year').
+        select (str): SELECT list matching `partition_by` + `schema` order.
+    """
+
+    table: str
+    schema: pa.Schema
+    partition_by: Tuple[str, ...]
+    period: str
+    select: str
+
+
+EXPORT_SPECS: Dict[str, ExportSpec] = {
+    spec.table: spec
+    for spec in [
+        ExportSpec(
+            table="market_quotes",
+            schema=pa.schema(
+                [("time", pa.timestamp("us", tz="UTC"))]
+                + [(c, pa.float64()) for c in ("open", "high", "low", "close")]
+                + [("volume", pa.float64())]
+            ),
+            partition_by=("asset_id", "interval"),
+            period="month",
+            select='asset_id, "interval", time, open, high, low, close, volume',
+        ),
+        ExportSpec(
+            table="market_sentiment",
+            schema=pa.schema(
+                [
+                    ("time", pa.timestamp("us", tz="UTC")),
+                    ("source", pa.string()),
+                    ("headline", pa.string()),
+                    ("sentiment_score", pa.float64()),
+                    ("impact_score", pa.float64()),
+                    ("confidence", pa.float64()),
+                    ("topics", pa.list_(pa.string())),
+                    ("created_at", pa.timestamp("us", tz="UTC")),
+                ]
+            ),
+            partition_by=("asset_id",),
+            period="month",
+            select=(
+                "asset_id, time, source, headline, sentiment_score, impact_score, "
+                "confidence, topics, created_at"
+            ),
+        ),
+        ExportSpec(
+            table="financial_statements",
+            schema=pa.schema(
+                [
+                    ("time", pa.timestamp("us", tz="UTC")),
+                    ("period_end", pa.date32()),
+                    ("period_type", pa.string()),
+                    ("revenue", pa.float64()),
+                    ("net_income", pa.float64()),
+                    ("eps", pa.float64()),
+                    ("total_assets", pa.float64()),
+                    ("total_liabilities", pa.float64()),
+                    ("raw_data", pa.string()),  # JSONB as JSON text
+                ]
+            ),
+            partition_by=("asset_id",),
+            period="year",
+            select=(
+                "asset_id, time, period_end, period_type, revenue, net_income, eps, "
+                "total_assets, total_liabilities, raw_data::text"
+            ),
+        ),
+    ]
+}
+
+_EXPORT_SQL = "SELECT {select} FROM {table}{where} ORDER BY {order}, time"
+
+# Incremental filter: rows from each key's watermark period onwards, and all
+# rows of keys that have no watermark yet.
+_SINCE_SQL = (
+    " LEFT JOIN unnest({arrays}) AS w({keys}, since) USING ({keys})"
+    " WHERE w.since IS NULL OR time >= w.since"
+)
+
+# Array types of the partition key columns (for the watermark unnest).
+_KEY_TYPES = {"asset_id": "integer", "interval": "text"}
+
+# Latest exported `time` per partition key (`ExportSpec.partition_by` values).
+Watermarks = Dict[Tuple[Any, ...], datetime]
+
+_PERIOD_FORMATS = {"month": "%Y-%m", "year": "%Y"}
+
+
+def period_start(value: datetime, period: str) -> datetime:
+    """
+    Return the UTC start of the time partition containing `value`.
+
+    Args:
+        value (datetime): Timezone-aware timestamp.
+        period (str): 'month' or 'year'.
+
+    Returns:
+        datetime: First instant of the month/year (UTC).
+    """
+    value = value.astimezone(timezone.utc)
+    start = value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    return start.replace(month=1) if period == "year" else start
+
+
+def partition_dir(spec: ExportSpec, key: Tuple[Any, ...]) -> Path:
+    """
+    Relative Hive directory of one partition.
+
+    Args:
+        spec (ExportSpec): The table spec.
+        key (Tuple[Any, ...]): `spec.partition_by` values, then the period label.
+
+    Returns:
+        Path: e.g. market_quotes/asset_id=1/interval=1m/month=2024-01
+    """
+    names = spec.partition_by + (spec.period,)
+    return Path(spec.table).joinpath(*(f"{n}={v}" for n, v in zip(names, key)))
+
+
+class ExportState:
+    """
+    Per-partition export watermarks stored as JSON next to the dataset.
+
+    Attributes:
+        path (Path): Location of the state file.
+        watermarks (Dict[str, Watermarks]): Latest exported `time` per
+            partition key, per table.
+    """
+
+    def __init__(self, root: Path) -> None:
+        """
+        Load the state of a dataset root (missing or unreadable -> empty).
+
+        Args:
+            root (Path): Dataset root directory.
+        """
+        self.path = Path(root) / STATE_FILE
+        self.watermarks: Dict[str, Watermarks] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            self.watermarks = {
+                table: {
+                    tuple(entry["key"]): datetime.fromisoformat(entry["time"])
+                    for entry in entries
+                }
+                for table, entries in payload.get("watermarks", {}).items()
+            }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable export state '{self.path}': {e}")
+
+    def save(self) -> None:
+        """
+        Atomically write the state file (temp file + rename).
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "watermarks": {
+                table: [
+                    {"key": list(key), "time": time.isoformat()}
+                    for key, time in sorted(watermarks.items())
+                ]
+                for table, watermarks in sorted(self.watermarks.items())
+            }
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class _PartitionWriter:
+    """
+    Writes consecutive partitions one at a time, buffering up to one row group.
+
+    Files are written under a temporary name and renamed on close, so readers
+    never see a half-written partition.
+    """
+
+    def __init__(self, spec: ExportSpec, root: Path, row_group_rows: int) -> None:
+        self.spec = spec
+        self.root = root
+        self.row_group_rows = row_group_rows
+        self.key: Optional[Tuple[Any, ...]] = None
+        self.writer: Optional[pq.ParquetWriter] = None
+        self.pending: List[Tuple[Any, ...]] = []
+        self.partitions = 0
+
+    def write(self, key: Tuple[Any, ...], rows: List[Tuple[Any, ...]]) -> None:
+        """Append data rows (without the partition columns) to partition `key`."""
+        if key != self.key:
+            self.close()
+            self._open(key)
+        self.pending.extend(rows)
+        while len(self.pending) >= self.row_group_rows:
+            self._write_group(self.pending[: self.row_group_rows])
+            del self.pending[: self.row_group_rows]
+
+    def close(self) -> None:
+        """Flush and publish the current partition file."""
+        if self.writer is None:
+            return
+        if self.pending:
+            self._write_group(self.pending)
+            self.pending = []
+        self.writer.close()
+        self.writer = None
+        os.replace(self._dir() / _TMP_FILE, self._dir() / PART_FILE)
+
+    def _dir(self) -> Path:
+        assert self.key is not None
+        return self.root / partition_dir(self.spec, self.key)
+
+    def _open(self, key: Tuple[Any, ...]) -> None:
+        self.key = key
+        directory = self._dir()
+        # The partition is re-exported whole: drop what an earlier run wrote.
+        if directory.exists():
+            shutil.rmtree(directory)
+        directory.mkdir(parents=True)
+        self.writer = pq.ParquetWriter(directory / _TMP_FILE, self.spec.schema)
+        self.partitions += 1
+
+    def _write_group(self, rows: List[Tuple[Any, ...]]) -> None:
+        assert self.writer is not None
+        columns = list(zip(*rows))
+        table = pa.Table.from_arrays(
+            [
+                pa.array(column, type=field.type)
+                for column, field in zip(columns, self.spec.schema)
+            ],
+            schema=self.spec.schema,
+        )
+        self.writer.write_table(table, row_group_size=len(rows))
+
+
+def export_table(
+    session: Session,
+    spec: ExportSpec,
+    root: Path,
+    since: Optional[Watermarks] = None,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+) -> Tuple[int, int, Watermarks]:
+    """
+    Stream one table into its partitioned Parquet dataset.
+
+    Args:
+        session (Session): The database session.
+        spec (ExportSpec): What to export and how to partition it.
+        root (Path): Dataset root directory.
+        since (Optional[Watermarks]): Per partition key, export partitions from
+                                      the one containing this time onwards;
+                                      keys not listed are exported in full
+                                      (None or empty = rebuild everything).
+        batch_rows (int): Rows fetched per server-side cursor round trip.
+        row_group_rows (int): Target rows per Parquet row group.
+
+    Returns:
+        Tuple[int, int, Watermarks]: (rows written, partitions written,
+                                     latest exported time per key).
+
+    Raises:
+        ValueError: If the batch or row group size is not positive.
+        RuntimeError: If the export fails.
+    """
+    if batch_rows <= 0 or row_group_rows <= 0:
+        raise ValueError("batch_rows and row_group_rows must be positive.")
+
+    params: Dict[str, Any] = {}
+    where = ""
+    if since:
+        arrays = []
+        for i, column in enumerate(spec.partition_by):
+            params[f"key{i}"] = [key[i] for key in since]
+            arrays.append(f"%(key{i})s::{_KEY_TYPES[column]}[]")
+        params["since"] = [period_start(t, spec.period) for t in since.values()]
+        where = _SINCE_SQL.format(
+            arrays=", ".join(arrays + ["%(since)s::timestamptz[]"]),
+            keys=", ".join(f'"{c}"' for c in spec.partition_by),
+        )
+    elif (root / spec.table).exists():
+        # Full export: rebuild the dataset so partitions deleted upstream vanish.
+        shutil.rmtree(root / spec.table)
+
+    sql = _EXPORT_SQL.format(
+        select=spec.select,
+        table=spec.table,
+        where=where,
+        order=", ".join(f'"{c}"' for c in spec.partition_by),
+    )
+    period_format = _PERIOD_FORMATS[spec.period]
+    width = len(spec.partition_by)
+
+    def partition_key(row: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        period = row[width].astimezone(timezone.utc).strftime(period_format)
+        return row[:width] + (period,)
+
+    writer = _PartitionWriter(spec, root, row_group_rows)
+    total = 0
+    watermarks: Watermarks = {}
+    raw_connection = session.connection().connection
+    try:
+        # A named (server-side) cursor streams the result instead of buffering it
+        # (psycopg2-specific, hence untyped: DBAPICursor has no `itersize`).
+        cursor: Any = raw_connection.cursor(name=f"export_{spec.table}")
+        try:
+            cursor.itersize = batch_rows
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_rows)
+                if not rows:
+                    break
+                for key, group in groupby(rows, key=partition_key):
+                    data = [row[width:] for row in group]
+                    writer.write(key, data)
+                    # Rows are ordered by key, then time: the last is the latest.
+                    watermarks[key[:width]] = data[-1][0]
+                total += len(rows)
+        finally:
+            cursor.close()
+        writer.close()
+    except Exception as e:
+        raise RuntimeError(f"Parquet export of '{spec.table}' failed: {e}") from e
+
+    logger.info(
+        f"Exported {total:,} {spec.table} rows into {writer.partitions} partitions."
+    )
+    return total, writer.partitions, watermarks
+
+
+def run_export(
+    session: Session,
+    root: Path,
+    tables: Sequence[str],
+    full: bool = False,
+    batch_rows: int = DEFAULT_BATCH_ROWS,
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+) -> Dict[str, int]:
+    """
+    Export several tables incrementally, advancing their watermarks.
+
+    The state file is updated after each table completes, so an interrupted
+    run resumes from the last finished table.
+
+    Args:
+        session (Session): The database session.
+        root (Path): Dataset root directory.
+        tables (Sequence[str]): Tables to export (keys of EXPORT_SPECS).
+        full (bool): Ignore the watermarks and re-export everything (needed
+            after backfilling history older than a key's watermark).
+        batch_rows (int): Rows fetched per server-side cursor round trip.
+        row_group_rows (int): Target rows per Parquet row group.
+
+    Returns:
+        Dict[str, int]: Rows written per table.
+
+    Raises:
+        ValueError: If a table has no export spec.
+        RuntimeError: If an export fails.
+    """
+    unknown = sorted(set(tables) - set(EXPORT_SPECS))
+    if unknown:
+        raise ValueError(
+            f"Unknown export tables {unknown}. Choose from {sorted(EXPORT_SPECS)}."
+        )
+
+    root = Path(root)
+    state = ExportState(root)
+    written: Dict[str, int] = {}
+    for table in tables:
+        since = None if full else state.watermarks.get(table)
+        logger.info(
+            f"Exporting '{table}' "
+            + (
+                f"from {len(since)} partition watermarks (incremental)."
+                if since
+                else "(full)."
+            )
+        )
+        rows, _, watermarks = export_table(
+            session, EXPORT_SPECS[table], root, since, batch_rows, row_group_rows
+        )
+        written[table] = rows
+        state.watermarks[table] = {**(since or {}), **watermarks}
+        state.save()
+    return written
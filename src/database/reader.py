@@ -0,0 +1,438 @@
+"""
+OHLCV Read API.
+
+This module is the read path for candle data. Candles are read from the
+resolution they were ingested at (`base_interval`, 'market_quotes.interval').
+For 1m data, every request picks the coarsest source that can exactly build
+the requested interval:
+
+    market_quotes_1d  (continuous aggregate)  -> 1d, 1w, ...
+    market_quotes_1h  (continuous aggregate)  -> 1h, 4h, 12h, ...
+    market_quotes     (raw 1m candles)        -> everything else (1m, 5m, 90m, ...)
+
+so daily/hourly queries never scan minute rows. When the requested interval is
+a multiple of the source resolution (e.g., 4h from 1h), the source rows are
+re-bucketed in SQL with `time_bucket` + `first/last`. See
+database/init/05_continuous_aggregates.sql for the aggregate definitions.
+Data ingested at other resolutions (e.g., Yahoo '1d') is read from the raw
+table, filtered to that resolution.
+
+Two readers share the query planning above:
+
+    read_ohlcv  -> row-based SELECT by asset ID (small, interactive reads).
+    load_ohlcv  -> binary `COPY (SELECT ...) TO STDOUT` by symbol, decoded
+                   straight into NumPy columns (bulk research reads; also
+                   available as a `pyarrow.Table` via load_ohlcv_arrow).
+
+Example:
+    df = read_ohlcv(session, [1, 2], "4h", start, end)
+    df = load_ohlcv(["BTC/USDT", "ETH/USDT"], start, end, "1h", exchange="BINANCE")
+"""
+
+import io
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import psycopg2 as pg_dialect
+from sqlalchemy.orm import Session
+
+from src.core.timeframes import interval_to_timedelta
+from src.database.connection import SessionLocal
+from src.database.models import Asset
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+RAW_TABLE = "market_quotes"
+
+# Resolution the continuous aggregates are built from.
+AGGREGATE_BASE_INTERVAL = "1m"
+
+# Continuous aggregates, coarsest first: (view name, bucket size).
+AGGREGATE_SOURCES: List[Tuple[str, timedelta]] = [
+    ("market_quotes_1d", timedelta(days=1)),
+    ("market_quotes_1h", timedelta(hours=1)),
+]
+
+OHLCV_READ_COLUMNS = ["asset_id", "time", "open", "high", "low", "close", "volume"]
+
+# Schema of load_ohlcv_arrow() results.
+OHLCV_ARROW_SCHEMA = pa.schema(
+    [
+        ("symbol", pa.dictionary(pa.int32(), pa.string())),
+        ("asset_id", pa.int32()),
+        ("time", pa.timestamp("us", tz="UTC")),
+    ]
+    + [(column, pa.float64()) for column in OHLCV_READ_COLUMNS[2:]]
+)
+
+_DIRECT_SQL = """
+    SELECT asset_id, time, open, high, low, close, volume
+    FROM {source}
+    WHERE asset_id = ANY(:asset_ids) AND time >= :start AND time < :end{filter}
+    ORDER BY asset_id, time
+"""
+
+# Output columns are named like the source columns so both queries can be
+# wrapped in COPY unchanged (GROUP/ORDER BY are positional: inside them a bare
+# 'time' would mean the source column, not the bucket).
+_BUCKETED_SQL = """
+    SELECT asset_id,
+           time_bucket(:bucket, time) AS time,
+           first(open, time) AS open, max(high) AS high, min(low) AS low,
+           last(close, time) AS close, sum(volume) AS volume
+    FROM {source}
+    WHERE asset_id = ANY(:asset_ids) AND time >= :start AND time < :end{filter}
+    GROUP BY 1, 2
+    ORDER BY 1, 2
+"""
+
+# Raw-table reads are restricted to the ingested resolution.
+_RAW_FILTER = ' AND "interval" = :base_interval'
+
+# PostgreSQL binary COPY framing: 11-byte signature, int32 flags, int32 header
+# extension length (+ extension), tuples, int16 -1 trailer.
+_PGCOPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+_PGCOPY_TRAILER = b"\xff\xff"
+
+# Every OHLCV column is fixed-width and NOT NULL (INTEGER, TIMESTAMPTZ, 5 x
+# DOUBLE PRECISION), so each tuple has the same 82-byte big-endian layout:
+# int16 field count, then an int32 length before each value.
+_PGCOPY_ROW = np.dtype(
+    [("fields", ">i2")]
+    + [
+        field
+        for name, kind in [("asset_id", ">i4"), ("time", ">i8")]
+        + [(column, ">f8") for column in ("open", "high", "low", "close", "volume")]
+        for field in ((f"{name}_len", ">i4"), (name, kind))
+    ]
+)
+
+# Binary timestamps are microseconds since 2000-01-01 00:00:00 UTC.
+_PG_EPOCH_OFFSET_US = 946_684_800_000_000
+
+# SQL text is compiled for psycopg2 so parameters can be inlined with mogrify
+# (COPY does not accept bind parameters).
+_COPY_DIALECT = pg_dialect.dialect()
+
+
+def choose_source(
+    interval: str, base_interval: str = AGGREGATE_BASE_INTERVAL
+) -> Tuple[str, bool]:
+    """
+    Pick the coarsest table/aggregate that can exactly produce `interval`.
+
+    Args:
+        interval (str): Requested candle interval (e.g., '1m', '4h', '1d', '1w').
+        base_interval (str): Resolution the data was ingested at.
+
+    Returns:
+        Tuple[str, bool]: (source relation, whether rows must be re-bucketed).
+
+    Raises:
+        ValueError: If an interval has no fixed spacing (e.g., '1mo') or `interval`
+                    is not a whole multiple of `base_interval`.
+    """
+    for value in (interval, base_interval):
+        if value.endswith(("M", "mo")):
+            raise ValueError(f"Reading requires a fixed candle spacing; got '{value}'.")
+
+    step = interval_to_timedelta(interval)
+    base = interval_to_timedelta(base_interval)
+    if step < base or step % base:
+        raise ValueError(
+            f"Cannot build '{interval}' candles from '{base_interval}' data."
+        )
+
+    if base_interval == AGGREGATE_BASE_INTERVAL:
+        for source, bucket in AGGREGATE_SOURCES:
+            if step >= bucket and step % bucket == timedelta(0):
+                return source, step != bucket
+
+    return RAW_TABLE, step != base
+
+
+def read_ohlcv(
+    session: Session,
+    asset_ids: Sequence[int],
+    interval: str,
+    start: datetime,
+    end: datetime,
+    base_interval: str = AGGREGATE_BASE_INTERVAL,
+) -> pd.DataFrame:
+    """
+    Read candles of one interval for several assets in a single query.
+
+    Args:
+        session (Session): The database session.
+        asset_ids (Sequence[int]): Assets to read.
+        interval (str): Requested candle interval.
+        start (datetime): Inclusive start (UTC).
+        end (datetime): Exclusive end (UTC).
+        base_interval (str): Resolution the assets were ingested at (e.g., '1m'
+                             for Binance, '1d' for Yahoo daily data).
+
+    Returns:
+        pd.DataFrame: Columns asset_id, time, open, high, low, close, volume,
+                      sorted by (asset_id, time).
+
+    Raises:
+        ValueError: If no assets are given, the range is empty or the interval is unsupported.
+    """
+    sql, params = _build_query(asset_ids, interval, start, end, base_interval)
+    rows = session.execute(text(sql), params).all()
+
+    df = pd.DataFrame(rows, columns=OHLCV_READ_COLUMNS)
+    df["time"] = pd.to_datetime(df["time"], utc=True)
+    return df
+
+
+def load_ohlcv(
+    symbols: Sequence[str],
+    start: datetime,
+    end: datetime,
+    interval: str,
+    exchange: Optional[str] = None,
+    base_interval: str = AGGREGATE_BASE_INTERVAL,
+    session: Optional[Session] = None,
+) -> pd.DataFrame:
+    """
+    Bulk-read candles for many symbols in one binary COPY round trip.
+
+    Args:
+        symbols (Sequence[str]): Asset symbols (e.g., 'BTC/USDT', 'AAPL').
+        start (datetime): Inclusive start (UTC).
+        end (datetime): Exclusive end (UTC).
+        interval (str): Requested candle interval.
+        exchange (Optional[str]): Exchange the symbols belong to. Required only
+                                  when a symbol is listed on several exchanges.
+        base_interval (str): Resolution the assets were ingested at.
+        session (Optional[Session]): Session to read with; a short-lived
+                                     session is opened when omitted.
+
+    Returns:
+        pd.DataFrame: Columns symbol (categorical), asset_id, time, open, high,
+                      low, close, volume, sorted by (asset_id, time).
+
+    Raises:
+        ValueError: If no symbol is known, a symbol is ambiguous, or the
+                    interval/range is invalid.
+        RuntimeError: If the COPY stream cannot be decoded.
+    """
+    columns, symbol_by_id = _load_columns(
+        symbols, start, end, interval, exchange, base_interval, session
+    )
+    df = pd.DataFrame(columns, columns=OHLCV_READ_COLUMNS, copy=False)
+    df["time"] = pd.to_datetime(columns["time"]).tz_localize("UTC")
+    df.insert(0, "symbol", _symbol_codes(columns["asset_id"], symbol_by_id))
+    return df
+
+
+def load_ohlcv_arrow(
+    symbols: Sequence[str],
+    start: datetime,
+    end: datetime,
+    interval: str,
+    exchange: Optional[str] = None,
+    base_interval: str = AGGREGATE_BASE_INTERVAL,
+    session: Optional[Session] = None,
+) -> pa.Table:
+    """
+    Same as `load_ohlcv`, returned as a `pyarrow.Table`.
+
+    The decoded NumPy columns are wrapped without another copy; 'symbol' is a
+    dictionary-encoded column and 'time' a timestamp[us, UTC] column.
+
+    Returns:
+        pa.Table: Columns symbol, asset_id, time, open, high, low, close, volume.
+
+    Raises:
+        ValueError: See `load_ohlcv`.
+        RuntimeError: If the COPY stream cannot be decoded.
+    """
+    columns, symbol_by_id = _load_columns(
+        symbols, start, end, interval, exchange, base_interval, session
+    )
+    symbol = _symbol_codes(columns["asset_id"], symbol_by_id)
+    arrays = [
+        pa.DictionaryArray.from_arrays(
+            pa.array(symbol.codes, type=pa.int32()),
+            pa.array(symbol.categories, type=pa.string()),
+        )
+    ]
+    for field in OHLCV_ARROW_SCHEMA.remove(0):
+        arrays.append(pa.array(columns[field.name], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=OHLCV_ARROW_SCHEMA)
+
+
+def decode_binary_copy(data: memoryview) -> Dict[str, np.ndarray]:
+    """
+    Decode a binary COPY stream of OHLCV rows into native NumPy columns.
+
+    The tuples are viewed in place as a structured array (no per-row Python
+    work); each column is then converted to native byte order once.
+
+    Args:
+        data (memoryview): The complete `COPY ... TO STDOUT (FORMAT binary)` output.
+
+    Returns:
+        Dict[str, np.ndarray]: asset_id (int32), time (datetime64[us], UTC) and
+                               float64 open/high/low/close/volume columns.
+
+    Raises:
+        RuntimeError: If the stream is not a binary COPY of the OHLCV columns.
+    """
+    if bytes(data[:11]) != _PGCOPY_SIGNATURE or bytes(data[-2:]) != _PGCOPY_TRAILER:
+        raise RuntimeError("Not a PostgreSQL binary COPY stream.")
+    body_start = 19 + int.from_bytes(data[15:19], "big")
+    body = data[body_start:-2]
+    if len(body) % _PGCOPY_ROW.itemsize:
+        raise RuntimeError(
+            "Unexpected binary COPY row layout (NULL or non-OHLCV column)."
+        )
+
+    rows = np.frombuffer(body, dtype=_PGCOPY_ROW)
+    if (rows["fields"] != len(OHLCV_READ_COLUMNS)).any():
+        raise RuntimeError("Unexpected binary COPY field count.")
+    for name in OHLCV_READ_COLUMNS:
+        expected = _PGCOPY_ROW[name].itemsize
+        if (rows[f"{name}_len"] != expected).any():
+            raise RuntimeError(f"Unexpected binary COPY width for column '{name}'.")
+
+    columns = {
+        name: rows[name].astype(_PGCOPY_ROW[name].newbyteorder("="))
+        for name in OHLCV_READ_COLUMNS
+    }
+    columns["time"] = (columns["time"] + _PG_EPOCH_OFFSET_US).view("datetime64[us]")
+    return columns
+
+
+def _build_query(
+    asset_ids: Sequence[int],
+    interval: str,
+    start: datetime,
+    end: datetime,
+    base_interval: str,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Validate a read request and build its SQL (named parameters) and parameters.
+    """
+    if not asset_ids:
+        raise ValueError("At least one asset ID is required.")
+    if start >= end:
+        raise ValueError(f"Empty time range: {start} >= {end}.")
+
+    source, bucketed = choose_source(interval, base_interval)
+    params: Dict[str, Any] = {"asset_ids": list(asset_ids), "start": start, "end": end}
+
+    row_filter = ""
+    if source == RAW_TABLE:
+        row_filter = _RAW_FILTER
+        params["base_interval"] = base_interval
+
+    if bucketed:
+        sql = _BUCKETED_SQL.format(source=source, filter=row_filter)
+        params["bucket"] = interval_to_timedelta(interval)
+    else:
+        sql = _DIRECT_SQL.format(source=source, filter=row_filter)
+
+    logger.debug(f"Reading {interval} candles for {len(asset_ids)} assets from {source}.")
+    return sql, params
+
+
+def resolve_symbols(
+    session: Session, symbols: Sequence[str], exchange: Optional[str] = None
+) -> Dict[int, str]:
+    """
+    Map symbols to asset IDs in one query.
+
+    Args:
+        session (Session): The database session.
+        symbols (Sequence[str]): Asset symbols.
+        exchange (Optional[str]): Exchange filter (needed for ambiguous symbols).
+
+    Returns:
+        Dict[int, str]: Symbol per asset ID (unknown symbols are skipped).
+
+    Raises:
+        ValueError: If no symbol is known or a symbol is ambiguous.
+    """
+    if not symbols:
+        raise ValueError("At least one symbol is required.")
+
+    query = select(Asset.id, Asset.symbol).where(Asset.symbol.in_(list(symbols)))
+    if exchange is not None:
+        query = query.where(Asset.exchange == exchange)
+    symbol_by_id = dict(session.execute(query).all())
+
+    found = list(symbol_by_id.values())
+    ambiguous = sorted({symbol for symbol in found if found.count(symbol) > 1})
+    if ambiguous:
+        raise ValueError(
+            f"Symbols listed on several exchanges: {ambiguous}. Pass `exchange`."
+        )
+    missing = sorted(set(symbols) - set(found))
+    if missing:
+        logger.warning(f"Unknown symbols skipped: {missing}")
+    if not symbol_by_id:
+        raise ValueError(f"None of the symbols exist in 'assets': {list(symbols)}")
+    return symbol_by_id
+
+
+def _load_columns(
+    symbols: Sequence[str],
+    start: datetime,
+    end: datetime,
+    interval: str,
+    exchange: Optional[str],
+    base_interval: str,
+    session: Optional[Session],
+) -> Tuple[Dict[str, np.ndarray], Dict[int, str]]:
+    """
+    Resolve symbols and stream the OHLCV rows through binary COPY.
+    """
+    owns_session = session is None
+    db = SessionLocal() if session is None else session
+    try:
+        symbol_by_id = resolve_symbols(db, symbols, exchange)
+        sql, params = _build_query(
+            list(symbol_by_id), interval, start, end, base_interval
+        )
+        statement = str(text(sql).compile(dialect=_COPY_DIALECT))
+
+        buffer = io.BytesIO()
+        raw_connection = db.connection().connection
+        cursor = raw_connection.cursor()
+        try:
+            query = cursor.mogrify(statement, params).decode()
+            cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT binary)", buffer)
+        finally:
+            cursor.close()
+    except (ValueError, RuntimeError):
+        raise
+    except Exception as e:
+        raise RuntimeError(f"OHLCV COPY read failed: {e}") from e
+    finally:
+        if owns_session:
+            db.close()
+
+    columns = decode_binary_copy(buffer.getbuffer())
+    logger.debug(f"Loaded {len(columns['asset_id']):,} {interval} candles via COPY.")
+    return columns, symbol_by_id
+
+
+def _symbol_codes(
+    asset_ids: np.ndarray, symbol_by_id: Dict[int, str]
+) -> pd.Categorical:
+    """
+    Build the categorical symbol column from the asset ID column.
+    """
+    ids = np.array(sorted(symbol_by_id), dtype=asset_ids.dtype)
+    codes = np.searchsorted(ids, asset_ids).astype(np.int32)
+    categories = [symbol_by_id[asset_id] for asset_id in ids.tolist()]
+    return pd.Categorical.from_codes(codes, categories=categories)
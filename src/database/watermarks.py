@@ -0,0 +1,115 @@
+"""
+Watermarks Module.
+
+This module resolves the ingestion watermark (latest stored candle time) of each
+asset so scheduled ETL runs can fetch only new data instead of re-downloading a
+fixed lookback window.
+
+All watermarks are read with ONE grouped aggregate query. On TimescaleDB,
+`max(time)` per `asset_id` is answered from the (asset_id, time DESC) index of
+each chunk, so the cost does not grow with the table size.
+
+Note:
+    The candle AT the watermark is always re-fetched (fetch ranges are
+    start-inclusive), so a candle that was still forming during the previous
+    run is completed by the next one.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Mapping, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.database.models import MarketQuote
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+def get_watermarks(
+    session: Session, asset_ids: Iterable[int], interval: Optional[str] = None
+) -> Dict[int, datetime]:
+    """
+    Return the latest stored candle time per asset in a single grouped query.
+
+    Args:
+        session (Session): The database session.
+        asset_ids (Iterable[int]): The asset IDs to look up.
+        interval (Optional[str]): Only consider candles of this resolution
+                                  (None = any stored resolution).
+
+    Returns:
+        Dict[int, datetime]: Latest 'market_quotes.time' per asset ID. Assets with
+                             no stored data are absent from the mapping.
+    """
+    ids = sorted(set(asset_ids))
+    if not ids:
+        return {}
+
+    stmt = (
+        select(MarketQuote.asset_id, func.max(MarketQuote.time))
+        .where(MarketQuote.asset_id.in_(ids))
+        .group_by(MarketQuote.asset_id)
+    )
+    if interval is not None:
+        stmt = stmt.where(MarketQuote.interval == interval)
+    return {asset_id: latest for asset_id, latest in session.execute(stmt).all()}
+
+
+def incremental_start(
+    watermark: Optional[datetime],
+    default_start: datetime,
+    overlap: timedelta = timedelta(0),
+) -> datetime:
+    """
+    Compute where an incremental fetch should begin.
+
+    Args:
+        watermark (Optional[datetime]): Latest stored candle time (None if no data yet).
+        default_start (datetime): Start used when the asset has no data yet.
+        overlap (timedelta): Extra history to re-fetch before the watermark
+                             (picks up late corrections from the provider).
+
+    Returns:
+        datetime: The start datetime for the fetch.
+    """
+    if watermark is None:
+        return default_start
+    return watermark - overlap
+
+
+def incremental_start_dates(
+    session: Session,
+    asset_ids: Mapping[str, int],
+    default_start: datetime,
+    overlap: timedelta = timedelta(0),
+    interval: Optional[str] = None,
+) -> Dict[str, datetime]:
+    """
+    Resolve the incremental start date of every symbol with one watermark query.
+
+    Args:
+        session (Session): The database session.
+        asset_ids (Mapping[str, int]): Asset ID per symbol (registered assets only).
+        default_start (datetime): Start used for assets with no data yet.
+        overlap (timedelta): Extra history to re-fetch before each watermark.
+        interval (Optional[str]): Resolution being ingested (watermarks of other
+                                  resolutions are ignored).
+
+    Returns:
+        Dict[str, datetime]: Fetch start per symbol.
+    """
+    watermarks = get_watermarks(session, asset_ids.values(), interval)
+
+    starts: Dict[str, datetime] = {}
+    for symbol, asset_id in asset_ids.items():
+        watermark = watermarks.get(asset_id)
+        starts[symbol] = incremental_start(watermark, default_start, overlap)
+        if watermark is None:
+            logger.info(f"{symbol}: no stored data, starting from {default_start}.")
+        else:
+            logger.info(f"{symbol}: watermark {watermark}, fetching from {starts[symbol]}.")
+
+    return starts
@@ -0,0 +1,108 @@
+"""
+Unit Tests for the Asynchronous Binance Fetcher.
+
+Runs many symbols from one event loop against a local fake async exchange,
+so no network access or API keys are required.
+"""
+
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pandas as pd
+
+try:
+    from src.data_ingestion.binance.async_binance_fetcher import AsyncBinanceFetcher
+except ImportError:  # ccxt is not installed in minimal environments
+    AsyncBinanceFetcher = None
+
+from src.data_ingestion.rate_limiter import RateLimiter
+
+MINUTE_MS = 60_000
+
+
+class FakeAsyncExchange:
+    """
+    Minimal stand-in for `ccxt.async_support.binance`.
+
+    Serves a continuous 1m candle history with simulated latency and tracks
+    peak request concurrency. Symbols starting with 'BAD' raise.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.active = 0
+        self.peak_active = 0
+        self.closed = False
+
+    async def load_markets(self):
+        return {}
+
+    async def close(self):
+        self.closed = True
+
+    async def fetch_ohlcv(self, symbol, timeframe, since=None, limit=500):
+        if symbol.startswith("BAD"):
+            raise ValueError(f"unknown symbol {symbol}")
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.latency)
+            first = -(-(since or 0) // MINUTE_MS) * MINUTE_MS
+            return [
+                [first + i * MINUTE_MS, 1.0, 2.0, 0.5, 1.5, float(i)]
+                for i in range(limit)
+            ]
+        finally:
+            self.active -= 1
+
+
+@unittest.skipIf(AsyncBinanceFetcher is None, "ccxt is not installed")
+class TestAsyncBinanceFetcher(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(2024, 1, 1, 2, tzinfo=timezone.utc)  # 121 candles inclusive
+        self.limiter = RateLimiter("TEST", capacity=10_000, refill_per_second=10_000)
+
+    def test_fetch_many_bounded_and_isolates_failures(self):
+        """Pairs run concurrently within the bound; one failure does not sink the rest."""
+        exchange = FakeAsyncExchange(latency=0.01)
+        pairs = [(f"S{i}/USDT", "1m") for i in range(20)] + [("BAD/USDT", "1m")]
+
+        async def run():
+            async with AsyncBinanceFetcher(
+                max_concurrency=5, exchange=exchange, rate_limiter=self.limiter
+            ) as fetcher:
+                return await fetcher.fetch_many(pairs, self.start, self.end, limit=50)
+
+        results = asyncio.run(run())
+
+        self.assertTrue(exchange.closed)
+        self.assertLessEqual(exchange.peak_active, 5)
+        self.assertGreater(exchange.peak_active, 1)
+        self.assertIsInstance(results[("BAD/USDT", "1m")], ValueError)
+        for symbol, _ in pairs[:-1]:
+            df = results[(symbol, "1m")]
+            self.assertEqual(len(df), 121)
+            self.assertTrue(df["time"].is_monotonic_increasing)
+
+    def test_fetch_ohlcv_validates_schema(self):
+        """Frames are validated like the synchronous fetcher's before loading."""
+        module = "src.data_ingestion.binance.async_binance_fetcher"
+
+        async def run():
+            async with AsyncBinanceFetcher(
+                exchange=FakeAsyncExchange(), rate_limiter=self.limiter
+            ) as fetcher:
+                return await fetcher.fetch_ohlcv("S/USDT", "1m", self.start, self.end)
+
+        incomplete = pd.DataFrame({"time": []})
+        with patch(f"{module}.normalize_ohlcv", return_value=incomplete):
+            with self.assertRaises(ValueError):
+                asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit Tests for the COPY-based Bulk Loader.
+
+Verifies CSV serialization and the COPY -> staging -> merge statement sequence.
+Uses mocking to avoid a live database connection.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.dialects import postgresql
+
+from src.database.bulk_loader import (
+    copy_upsert_market_quotes,
+    dataframe_to_csv_buffer,
+    stream_upsert_market_quotes,
+    upsert_market_sentiment,
+)
+
+
+def _make_frame(rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=rows, freq="1min", tz="UTC"),
+            "open": np.arange(rows, dtype=float),
+            "high": np.arange(rows, dtype=float) + 1,
+            "low": np.arange(rows, dtype=float) - 1,
+            "close": np.arange(rows, dtype=float) + 0.5,
+            "volume": np.full(rows, 10.0),
+        }
+    )
+
+
+class TestBulkLoader(unittest.TestCase):
+
+    def setUp(self):
+        """Wire a mock session -> raw connection -> cursor chain."""
+        self.cursor = MagicMock()
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value = self.cursor
+        self.session = MagicMock()
+        self.session.connection.return_value.connection = raw_connection
+
+    def test_csv_buffer_layout(self):
+        """Rows follow MARKET_QUOTE_COLUMNS order with the asset id and interval injected."""
+        lines = (
+            dataframe_to_csv_buffer(_make_frame(2), asset_id=7, interval="1m")
+            .read()
+            .splitlines()
+        )
+
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(
+            lines[0], "2024-01-01 00:00:00.000000+0000,7,1m,0.0,1.0,-1.0,0.5,10.0"
+        )
+
+    def test_csv_buffer_preserves_nan(self):
+        """NaN is written as a literal so it is not loaded as NULL."""
+        df = _make_frame(1)
+        df.loc[0, "volume"] = np.nan
+
+        line = dataframe_to_csv_buffer(df, asset_id=1, interval="1m").read().strip()
+        self.assertTrue(line.endswith(",NaN"))
+
+    def test_copy_upsert_statement_sequence(self):
+        """COPY into staging, then merge with ON CONFLICT, then drop staging."""
+        count = copy_upsert_market_quotes(self.session, 3, _make_frame(5), "1m")
+
+        self.assertEqual(count, 5)
+        self.cursor.copy_expert.assert_called_once()
+        self.assertIn("COPY _stage_market_quotes", self.cursor.copy_expert.call_args[0][0])
+
+        executed = [c[0][0] for c in self.cursor.execute.call_args_list]
+        self.assertIn("CREATE TEMP TABLE", executed[0])
+        self.assertIn('ON CONFLICT (time, asset_id, "interval") DO UPDATE', executed[1])
+        self.assertIn("DROP TABLE", executed[2])
+        self.cursor.close.assert_called_once()
+
+        # The loader must leave transaction control to the caller.
+        self.session.commit.assert_not_called()
+
+    def test_copy_upsert_empty_frame(self):
+        """An empty frame never touches the database."""
+        self.assertEqual(
+            copy_upsert_market_quotes(self.session, 1, pd.DataFrame(), "1m"), 0
+        )
+        self.session.connection.assert_not_called()
+
+    def test_stream_commits_each_chunk(self):
+        """Pages are flushed and committed once the row threshold is reached."""
+        pages = (_make_frame(400) for _ in range(5))  # 2,000 rows in total
+
+        total = stream_upsert_market_quotes(self.session, 1, pages, "1m", chunk_rows=1000)
+
+        self.assertEqual(total, 2000)
+        # 1,200 rows once the threshold is crossed, then the 800-row remainder.
+        self.assertEqual(self.cursor.copy_expert.call_count, 2)
+        self.assertEqual(self.session.commit.call_count, 2)
+
+    def test_stream_rolls_back_failed_chunk(self):
+        """A failing chunk is rolled back and the error surfaces to the caller."""
+        self.cursor.copy_expert.side_effect = RuntimeError("COPY failed")
+
+        with self.assertRaises(RuntimeError):
+            stream_upsert_market_quotes(
+                self.session, 1, [_make_frame(10)], "1m", chunk_rows=5
+            )
+
+        self.session.rollback.assert_called_once()
+        self.session.commit.assert_not_called()
+
+    def test_sentiment_upsert_single_statement(self):
+        """A batch is one INSERT ... ON CONFLICT; duplicate keys keep the last row."""
+        time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        rows = [
+            {
+                "time": time,
+                "asset_id": 1,
+                "source": "CryptoPanic-X",
+                "headline": headline,
+                "sentiment_score": 0.5,
+                "impact_score": 0.5,
+                "confidence": 0.5,
+                "topics": None,
+            }
+            for headline in ("old", "new")
+        ]
+
+        self.assertEqual(upsert_market_sentiment(self.session, rows), 1)
+        self.assertEqual(upsert_market_sentiment(self.session, []), 0)
+
+        inserts = [
+            c[0][0]
+            for c in self.session.execute.call_args_list
+            if "market_sentiment" in str(getattr(c[0][0], "table", ""))
+        ]
+        self.assertEqual(len(inserts), 1)
+        sql = str(inserts[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (time, asset_id, source) DO UPDATE", sql)
+        self.assertEqual(inserts[0].compile().params["headline_m0"], "new")
+        self.session.commit.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit Tests for the Compressed Chunk Write Guard.
+"""
+
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.database.bulk_loader import copy_upsert_market_quotes, upsert_market_sentiment
+from src.database.compression import decompressed_at, decompressed_range
+
+
+class TestCompressionGuard(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.session = MagicMock()
+        self.chunks = ["_timescaledb_internal._hyper_1_1_chunk"]
+        self.session.execute.return_value.scalars.return_value.all.return_value = self.chunks
+
+    def statements(self):
+        return [str(c[0][0]) for c in self.session.execute.call_args_list]
+
+    def test_decompress_then_recompress(self):
+        """Overlapping compressed chunks are decompressed around the write."""
+        with decompressed_range(self.session, "market_quotes", self.start, self.end) as chunks:
+            self.assertEqual(chunks, self.chunks)
+            self.assertIn("decompress_chunk", self.statements()[-1])
+
+        self.assertIn("timescaledb_information.chunks", self.statements()[0])
+        self.assertIn("compress_chunk", self.statements()[-1])
+        self.assertNotIn("decompress_chunk", self.statements()[-1])
+
+    def test_no_recompress_on_error(self):
+        """A failed write leaves recompression to the rollback."""
+        with self.assertRaises(RuntimeError):
+            with decompressed_range(self.session, "market_quotes", self.start, self.end):
+                raise RuntimeError("merge failed")
+
+        self.assertEqual(len(self.statements()), 2)  # lookup + decompress
+
+    def test_loader_guards_batch_range(self):
+        """The COPY loader looks up chunks for exactly the batch's time range."""
+        self.session.execute.return_value.scalars.return_value.all.return_value = []
+        df = pd.DataFrame(
+            {
+                "time": pd.date_range(self.start, periods=3, freq="1min", tz="UTC"),
+                "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0,
+            }
+        )
+
+        copy_upsert_market_quotes(self.session, 1, df, "1m")
+
+        params = self.session.execute.call_args_list[0][0][1]
+        self.assertEqual(params["start"], self.start)
+        self.assertEqual(params["end"], df["time"].max().to_pydatetime())
+        self.assertEqual(len(self.statements()), 1)
+
+    def test_decompress_only_chunks_holding_timestamps(self):
+        """Sparse writes look up chunks by their distinct timestamps, not a range."""
+        times = [self.end, self.start, self.end]
+        with decompressed_at(self.session, "market_sentiment", times) as chunks:
+            self.assertEqual(chunks, self.chunks)
+
+        lookup, params = self.session.execute.call_args_list[0][0]
+        self.assertIn("unnest", str(lookup))
+        self.assertEqual(params["times"], [self.start, self.end])
+        self.assertIn("compress_chunk", self.statements()[-1])
+
+        self.session.reset_mock()
+        with decompressed_at(self.session, "market_sentiment", []) as chunks:
+            self.assertEqual(chunks, [])
+        self.session.execute.assert_not_called()
+
+    def test_sentiment_upsert_guards_row_times(self):
+        """The sentiment upsert passes its row times, not their min/max range."""
+        self.session.execute.return_value.scalars.return_value.all.return_value = []
+        far = datetime(2025, 6, 1, tzinfo=timezone.utc)
+        rows = [
+            {
+                "time": time,
+                "asset_id": 1,
+                "source": "CryptoPanic-X",
+                "headline": "headline",
+                "sentiment_score": 0.5,
+                "impact_score": 0.5,
+                "confidence": 0.5,
+                "topics": None,
+            }
+            for time in (self.start, far)
+        ]
+
+        upsert_market_sentiment(self.session, rows)
+
+        params = self.session.execute.call_args_list[0][0][1]
+        self.assertEqual(params["times"], [self.start, far])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Unit Tests for the Gap Detection Module.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from src.database.gaps import count_candles, find_gaps, merge_gaps, scan_gaps
+
+STEP = timedelta(minutes=1)
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def minute(n: int) -> datetime:
+    return T0 + n * STEP
+
+
+class TestGaps(unittest.TestCase):
+
+    def test_find_gaps_interior_and_edges(self):
+        """Reports leading, interior and trailing holes as inclusive ranges."""
+        present = [2, 3, 4, 7, 8, 12]
+        times = pd.Series(pd.to_datetime([minute(n) for n in present], utc=True))
+
+        gaps = find_gaps(times, STEP, minute(0), minute(14))
+
+        self.assertEqual(
+            gaps,
+            [
+                (minute(0), minute(1)),
+                (minute(5), minute(6)),
+                (minute(9), minute(11)),
+                (minute(13), minute(14)),
+            ],
+        )
+
+    def test_find_gaps_min_candles_and_empty(self):
+        """Short gaps can be ignored; no data means the whole range is missing."""
+        times = pd.Series(pd.to_datetime([minute(0), minute(2), minute(10)], utc=True))
+        self.assertEqual(
+            find_gaps(times, STEP, minute(0), minute(10), min_candles=2),
+            [(minute(3), minute(9))],
+        )
+
+        empty = pd.Series(pd.to_datetime([], utc=True))
+        self.assertEqual(find_gaps(empty, STEP, minute(0), minute(5)), [(minute(0), minute(5))])
+
+    def test_scan_gaps_combines_sql_results(self):
+        """Interior gaps from SQL are combined with edges derived from min/max."""
+        session = MagicMock()
+        bounds, interior = MagicMock(), MagicMock()
+        bounds.one.return_value = (minute(3), minute(20))
+        interior.all.return_value = [(minute(8), minute(9))]
+        session.execute.side_effect = [bounds, interior]
+
+        gaps = scan_gaps(session, 1, "1m", minute(0), minute(21))
+
+        self.assertEqual(
+            gaps,
+            [(minute(0), minute(2)), (minute(8), minute(9)), (minute(21), minute(21))],
+        )
+        # Both queries are restricted to the scanned resolution.
+        for call in session.execute.call_args_list:
+            self.assertEqual(call[0][1]["interval"], "1m")
+
+    def test_merge_gaps_minimizes_requests(self):
+        """Gaps are merged only when the union needs fewer paginated requests."""
+        gaps = [(minute(0), minute(9)), (minute(20), minute(29)), (minute(500), minute(509))]
+
+        merged = merge_gaps(gaps, STEP, page_candles=100)
+
+        self.assertEqual(merged, [(minute(0), minute(29)), (minute(500), minute(509))])
+        self.assertEqual(count_candles(merged[0], STEP), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
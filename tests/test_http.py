@@ -0,0 +1,92 @@
+"""
+Unit Tests for the Shared HTTP Session Factory.
+"""
+
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from requests.adapters import HTTPAdapter
+
+from src.core.http import close_sessions, create_session, get_session
+
+
+def make_server(statuses):
+    """Local server answering GET with the given statuses in turn (then 200)."""
+    calls = []
+    ports = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):  # noqa: N802 (http.server API)
+            calls.append(self.path)
+            ports.add(self.client_address[1])
+            status = statuses[len(calls) - 1] if len(calls) <= len(statuses) else 200
+            self.send_response(status)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, calls, ports
+
+
+class TestHTTPSessionFactory(unittest.TestCase):
+
+    def tearDown(self):
+        close_sessions()
+
+    def test_adapter_configuration(self):
+        """Pool size, retry policy and default timeout come from the arguments."""
+        session = create_session(pool_size=7, retries=2, timeout=(1.0, 2.0))
+        adapter = session.get_adapter("https://example.com")
+
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertEqual(adapter.timeout, (1.0, 2.0))
+        with self.assertRaises(ValueError):
+            create_session(pool_size=0)
+
+    def test_default_timeout_only_when_missing(self):
+        """Requests without a timeout get the default; explicit ones are kept."""
+        adapter = create_session(timeout=3.0).get_adapter("http://x")
+        with patch.object(HTTPAdapter, "send", return_value="sent") as send:
+            adapter.send("request")
+            adapter.send("request", timeout=9.0)
+
+        self.assertEqual(send.call_args_list[0].kwargs["timeout"], 3.0)
+        self.assertEqual(send.call_args_list[1].kwargs["timeout"], 9.0)
+
+    def test_retries_transient_errors_on_one_connection(self):
+        """503s are retried and all requests reuse one keep-alive connection."""
+        server, calls, ports = make_server([503, 503])
+        url = f"http://127.0.0.1:{server.server_address[1]}/ping"
+        try:
+            session = create_session(retries=3, backoff_factor=0)
+            self.assertEqual(session.get(url).status_code, 200)
+            self.assertEqual(session.get(url).status_code, 200)
+        finally:
+            server.shutdown()
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(ports), 1)
+
+    def test_shared_registry(self):
+        """get_session returns one session per (case-insensitive) name."""
+        first = get_session("cryptopanic")
+        self.assertIs(get_session("CRYPTOPANIC"), first)
+        self.assertIsNot(get_session("OTHER"), first)
+
+        close_sessions()
+        self.assertIsNot(get_session("CRYPTOPANIC"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Unit Tests for the Concurrent Inference Executor.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.ai_analysis.inference_pool import InferencePool
+from src.ai_analysis.llm_client import OllamaClient
+from src.ai_analysis.sentiment_engine import SentimentAnalyzer
+
+
+class TestInferencePool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = InferencePool(max_workers=3, max_pending=4)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_results_in_input_order(self):
+        """Slow early tasks do not reorder the results."""
+
+        def task(i):
+            time.sleep(0.02 * (5 - i))
+            return i * 10
+
+        self.assertEqual(self.pool.map(task, range(6)), [0, 10, 20, 30, 40, 50])
+
+    def test_parallelism_is_capped(self):
+        """No more than max_workers tasks run at once."""
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def task(i):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return i
+
+        self.pool.map(task, range(12))
+        self.assertEqual(peak[0], 3)
+
+    def test_backpressure_consumes_input_lazily(self):
+        """Only max_pending items are pulled ahead of the consumer."""
+        pulled = []
+        release = threading.Event()
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield i
+
+        def task(i):
+            release.wait(5)
+            return i
+
+        results = self.pool.imap(task, items())
+        started = threading.Thread(target=lambda: next(results))
+        started.start()
+        time.sleep(0.05)
+        self.assertEqual(len(pulled), 4)
+
+        release.set()
+        started.join()
+        self.assertEqual(next(results), 1)
+
+    def test_task_error_is_raised_in_order(self):
+        """A failing task raises at its position, after earlier results."""
+
+        def task(i):
+            if i == 2:
+                raise RuntimeError("boom")
+            return i
+
+        results = self.pool.imap(task, range(5))
+        self.assertEqual([next(results), next(results)], [0, 1])
+        with self.assertRaises(RuntimeError):
+            next(results)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            InferencePool(max_workers=-1)
+
+
+class TestConcurrentBatchScoring(unittest.TestCase):
+
+    def test_batches_run_concurrently(self):
+        """analyze_batch keeps several batch requests in flight, results ordered."""
+        client = MagicMock(spec=OllamaClient)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def generate(prompt, **kwargs):
+            barrier.wait()  # deadlocks (and times out) unless both run at once
+            count = prompt.count('"\n') + 1
+            value = 0.5 if "first" in prompt else -0.5
+            return {
+                "results": [
+                    dict(id=i, sentiment_score=value, impact_score=1, confidence=1)
+                    for i in range(1, count + 1)
+                ]
+            }
+
+        client.generate.side_effect = generate
+        analyzer = SentimentAnalyzer(client=client, max_workers=2, request_timeout=3)
+
+        results = analyzer.analyze_batch(
+            ["first a", "first b", "second a", "second b"], batch_size=2
+        )
+
+        self.assertEqual(client.generate.call_count, 2)
+        self.assertEqual(client.generate.call_args.kwargs["timeout"], 3)
+        self.assertEqual(
+            [result.sentiment_score for result in results], [0.5, 0.5, -0.5, -0.5]
+        )
+        analyzer.pool.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
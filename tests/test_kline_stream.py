@@ -0,0 +1,216 @@
+"""
+Unit Tests for the Binance Kline Stream Ingestor.
+
+Runs the ingestor against a local WebSocket server that mimics Binance's
+combined-stream protocol, including a dropped connection.
+"""
+
+import asyncio
+import json
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+from websockets.asyncio.server import serve
+
+from src.data_ingestion.binance.kline_stream import KlineStreamIngestor
+
+STEP = timedelta(minutes=1)
+
+
+def kline(stream: str, open_time: datetime, close: float, closed: bool = True) -> str:
+    symbol = stream.split("@")[0].upper()
+    ms = int(open_time.timestamp() * 1000)
+    return json.dumps(
+        {
+            "stream": stream,
+            "data": {
+                "e": "kline",
+                "s": symbol,
+                "k": {"t": ms, "o": "1", "h": "2", "l": "0.5", "c": str(close), "v": "10", "x": closed},
+            },
+        }
+    )
+
+
+class TestKlineStreamIngestor(unittest.TestCase):
+
+    def setUp(self):
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        self.t = [now - timedelta(minutes=10) + i * STEP for i in range(7)]
+        self.written = {}
+        self.backfill_calls = []
+
+    def sink(self, asset_id, df):
+        for row in df.itertuples():
+            key = (asset_id, row.time)
+            self.assertNotIn(key, self.written)  # each candle written once
+            self.written[key] = row.close
+        return len(df)
+
+    def backfill(self, symbol, start, end):
+        self.backfill_calls.append((symbol, start))
+        if symbol != "BTC/USDT":
+            return pd.DataFrame()
+        times = [t for t in self.t[2:5] if start <= t <= end]
+        return pd.DataFrame(
+            {"time": pd.to_datetime(times, utc=True), "open": 1.0, "high": 2.0,
+             "low": 0.5, "close": 50.0, "volume": 10.0}
+        )
+
+    def test_stream_reconnect_and_backfill(self):
+        """Closed candles are flushed once; the outage is backfilled via REST after reconnect."""
+        t = self.t
+        connections = []
+
+        async def handler(ws):
+            connections.append(ws)
+            subscribe = json.loads(await ws.recv())
+            await ws.send(json.dumps({"result": None, "id": subscribe["id"]}))
+
+            if len(connections) == 1:
+                await ws.send(kline("btcusdt@kline_1m", t[0], 999.0, closed=False))
+                await ws.send(kline("btcusdt@kline_1m", t[0], 10.0))
+                await ws.send(kline("btcusdt@kline_1m", t[1], 11.0))
+                await ws.send(kline("ethusdt@kline_1m", t[0], 20.0))
+                await asyncio.sleep(0.1)
+                return  # drop the connection
+
+            await ws.send(kline("btcusdt@kline_1m", t[5], 15.0))
+            await ws.wait_closed()  # stay connected until the client leaves
+
+        async def scenario():
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                ingestor = KlineStreamIngestor(
+                    {"BTC/USDT": 1, "ETH/USDT": 2},
+                    "1m",
+                    sink=self.sink,
+                    backfill=self.backfill,
+                    flush_interval=0.05,
+                    url=f"ws://127.0.0.1:{port}",
+                    reconnect_delay=0.05,
+                )
+                stop = asyncio.Event()
+                task = asyncio.create_task(ingestor.run(stop))
+
+                for _ in range(200):
+                    if (1, t[5]) in self.written:
+                        break
+                    await asyncio.sleep(0.02)
+                stop.set()
+                await asyncio.wait_for(task, timeout=5)
+                return ingestor
+
+        ingestor = asyncio.run(scenario())
+
+        self.assertEqual(len(ingestor.last_closed), 2)
+        btc_times = sorted(time for asset_id, time in self.written if asset_id == 1)
+        self.assertEqual(btc_times, [pd.Timestamp(x) for x in t[:6]])
+        self.assertEqual(self.written[(1, pd.Timestamp(t[0]))], 10.0)  # open candle ignored
+        self.assertIn((2, pd.Timestamp(t[0])), self.written)
+        self.assertIn(("BTC/USDT", t[2]), self.backfill_calls)
+
+    def test_malformed_frames_are_skipped(self):
+        """Invalid JSON and incomplete klines are skipped; the stream keeps going."""
+        t = self.t
+
+        async def handler(ws):
+            subscribe = json.loads(await ws.recv())
+            await ws.send(json.dumps({"result": None, "id": subscribe["id"]}))
+            await ws.send("not json")
+            no_kline = {"stream": "btcusdt@kline_1m", "data": {"e": "kline"}}
+            await ws.send(json.dumps(no_kline))
+            no_time = json.loads(kline("btcusdt@kline_1m", t[0], 10.0))
+            del no_time["data"]["k"]["t"]
+            await ws.send(json.dumps(no_time))
+            await ws.send(kline("btcusdt@kline_1m", t[1], 11.0))
+            await ws.wait_closed()
+
+        async def scenario():
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                ingestor = KlineStreamIngestor(
+                    {"BTC/USDT": 1},
+                    "1m",
+                    sink=self.sink,
+                    flush_interval=0.05,
+                    url=f"ws://127.0.0.1:{port}",
+                )
+                stop = asyncio.Event()
+                task = asyncio.create_task(ingestor.run(stop))
+
+                for _ in range(200):
+                    if self.written or task.done():
+                        break
+                    await asyncio.sleep(0.02)
+                stop.set()
+                await asyncio.wait_for(task, timeout=5)
+
+        asyncio.run(scenario())
+
+        self.assertEqual(self.written, {(1, pd.Timestamp(t[1])): 11.0})
+
+    def test_streams_are_sharded_across_connections(self):
+        """Symbol sets above the per-connection limit use several connections."""
+        t = self.t
+        subscriptions = []
+
+        async def handler(ws):
+            subscribe = json.loads(await ws.recv())
+            subscriptions.append(subscribe["params"])
+            await ws.send(json.dumps({"result": None, "id": subscribe["id"]}))
+            for stream in subscribe["params"]:
+                await ws.send(kline(stream, t[0], 10.0))
+            await ws.wait_closed()
+
+        async def scenario():
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                ingestor = KlineStreamIngestor(
+                    {"BTC/USDT": 1, "ETH/USDT": 2, "SOL/USDT": 3},
+                    "1m",
+                    sink=self.sink,
+                    flush_interval=0.05,
+                    url=f"ws://127.0.0.1:{port}",
+                )
+                stop = asyncio.Event()
+                task = asyncio.create_task(ingestor.run(stop))
+
+                for _ in range(200):
+                    if len(self.written) == 3 or task.done():
+                        break
+                    await asyncio.sleep(0.02)
+                stop.set()
+                await asyncio.wait_for(task, timeout=5)
+
+        module = "src.data_ingestion.binance.kline_stream"
+        with patch(f"{module}.MAX_STREAMS_PER_CONNECTION", 2):
+            asyncio.run(scenario())
+
+        self.assertEqual(sorted(len(params) for params in subscriptions), [1, 2])
+        self.assertEqual(sorted(asset_id for asset_id, _ in self.written), [1, 2, 3])
+
+    def test_failed_flush_is_retried(self):
+        """Candles stay buffered when the sink fails and are written on the next flush."""
+        attempts = []
+
+        def flaky_sink(asset_id, df):
+            attempts.append(len(df))
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return len(df)
+
+        ingestor = KlineStreamIngestor({"BTC/USDT": 1}, "1m", sink=flaky_sink)
+        ingestor._handle(json.loads(kline("btcusdt@kline_1m", self.t[0], 10.0)))
+
+        async def flush_twice():
+            return await ingestor.flush(), await ingestor.flush()
+
+        self.assertEqual(asyncio.run(flush_twice()), (0, 1))
+        self.assertEqual(attempts, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Unit Tests for the Exchange Market Metadata Cache.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from src.data_ingestion.binance.market_cache import (
+    MarketCache,
+    load_markets_cached,
+    market_cache_key,
+)
+
+MARKETS = {"BTC/USDT": {"id": "BTCUSDT", "precision": {"price": 0.01}}}
+
+
+def fake_exchange() -> MagicMock:
+    exchange = MagicMock()
+    exchange.id = "binance"
+    exchange.options = {"defaultType": "spot"}
+    exchange.markets = MARKETS
+    exchange.currencies = None
+    return exchange
+
+
+class TestMarketCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = MarketCache(cache_dir=self.tmp.name, ttl_seconds=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_and_ttl(self):
+        """Fresh entries are returned; stale or corrupt ones are treated as misses."""
+        self.assertIsNone(self.cache.load("binance_spot"))
+
+        self.cache.save("binance_spot", MARKETS)
+        self.assertEqual(self.cache.load("binance_spot"), (MARKETS, None))
+
+        old = time.time() - 120
+        os.utime(self.cache.path("binance_spot"), (old, old))
+        self.assertIsNone(self.cache.load("binance_spot"))
+
+        self.cache.path("binance_spot").write_text("{not json")
+        self.assertIsNone(self.cache.load("binance_spot"))
+
+    def test_download_only_on_miss_or_refresh(self):
+        """load_markets runs on a cold cache or forced refresh; hits use set_markets."""
+        cold = fake_exchange()
+        load_markets_cached(cold, self.cache)
+        cold.load_markets.assert_called_once_with(reload=True)
+
+        warm = fake_exchange()
+        load_markets_cached(warm, self.cache)
+        warm.load_markets.assert_not_called()
+        warm.set_markets.assert_called_once_with(MARKETS, None)
+
+        forced = fake_exchange()
+        load_markets_cached(forced, self.cache, refresh=True)
+        forced.load_markets.assert_called_once_with(reload=True)
+
+    def test_key_includes_market_type(self):
+        """Spot and futures metadata are cached separately."""
+        exchange = fake_exchange()
+        exchange.options = {"defaultType": "future"}
+        self.assertEqual(market_cache_key(exchange), "binance_future")
+
+
+if __name__ == "__main__":
+    unittest.main()
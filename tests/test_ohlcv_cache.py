@@ -0,0 +1,131 @@
+"""
+Unit Tests for the OHLCV Read-Through Cache.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+
+from src.database.ohlcv_cache import OHLCVCache, is_cacheable, months_between
+from src.database.reader import OHLCV_ARROW_SCHEMA
+
+SYMBOLS = {1: "BTC/USDT", 2: "ETH/USDT"}
+
+
+def fake_load(symbols, start, end, interval, exchange, base_interval, session):
+    """Daily candles for every requested symbol in [start, end)."""
+    ids = {symbol: asset_id for asset_id, symbol in SYMBOLS.items()}
+    rows = []
+    for symbol in sorted(symbols, key=ids.get):
+        day = start
+        while day < end:
+            rows.append((symbol, ids[symbol], day, 1.0, 2.0, 0.5, 1.5, 10.0))
+            day += timedelta(days=1)
+    columns = list(zip(*rows)) or [[] for _ in OHLCV_ARROW_SCHEMA]
+    arrays = [pa.array(c, type=f.type) for c, f in zip(columns, OHLCV_ARROW_SCHEMA)]
+    return pa.Table.from_arrays(arrays, schema=OHLCV_ARROW_SCHEMA)
+
+
+@patch("src.database.ohlcv_cache.resolve_symbols", return_value=SYMBOLS)
+@patch("src.database.ohlcv_cache.load_ohlcv_arrow", side_effect=fake_load)
+class TestOHLCVCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = OHLCVCache(cache_dir=self.tmp.name, max_bytes=10**9)
+        self.session = MagicMock()
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(2024, 4, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def load(self, start=None, end=None, interval="1d"):
+        return self.cache.load(
+            list(SYMBOLS.values()),
+            start or self.start,
+            end or self.end,
+            interval,
+            session=self.session,
+        )
+
+    def test_helpers(self, load, resolve):
+        """Months overlapping a range are listed; only day divisors are cached."""
+        months = months_between(self.start + timedelta(days=40), self.end)
+        self.assertEqual([m.month for m in months], [2, 3])
+        self.assertTrue(is_cacheable("4h"))
+        self.assertTrue(is_cacheable("1d"))
+        self.assertFalse(is_cacheable("1w"))
+        self.assertFalse(is_cacheable("7h"))
+
+    def test_read_through_then_local_hits(self, load, resolve):
+        """Closed months are fetched once in one COPY, then served from disk."""
+        first = self.load()
+
+        load.assert_called_once()
+        self.assertEqual(first.num_rows, 2 * 91)
+        self.assertEqual(self.cache.misses, 6)
+        path = self.cache.path(2, "1d", self.start, "1m")
+        self.assertTrue(path.exists())
+
+        second = self.load()
+
+        load.assert_called_once()
+        self.assertEqual(self.cache.hits, 6)
+        self.assertTrue(second.equals(first))
+        self.assertEqual(second.column("asset_id").to_pylist()[-1], 2)
+
+    def test_trims_to_requested_range(self, load, resolve):
+        """Whole months are cached, but only [start, end) is returned."""
+        start = self.start + timedelta(days=10)
+        table = self.load(start, start + timedelta(days=35))
+
+        self.assertEqual(table.num_rows, 2 * 35)
+        first_time = table.column("time")[0].as_py()
+        self.assertEqual(first_time, start)
+        self.assertEqual(load.call_args[0][1], self.start)  # whole months fetched
+
+    def test_open_month_not_cached(self, load, resolve):
+        """The current month is always read from the database and never stored."""
+        now = datetime.now(timezone.utc)
+        end = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start = end - timedelta(days=70)
+
+        self.load(start, end)
+        self.load(start, end)
+
+        current = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        self.assertFalse(self.cache.path(1, "1d", current, "1m").exists())
+        self.assertEqual(load.call_args[0][2], end)  # open tail not read ahead
+        self.assertGreaterEqual(self.cache.hits, 2)
+
+    def test_lru_eviction(self, load, resolve):
+        """Above the size cap, least recently used files are deleted first."""
+        self.load()
+        oldest = self.cache.path(1, "1d", self.start, "1m")
+        os.utime(oldest, (0, 0))
+        self.cache.max_bytes = self.cache.size() - 1
+
+        freed = self.cache.evict()
+
+        self.assertGreater(freed, 0)
+        self.assertFalse(oldest.exists())
+        self.assertTrue(self.cache.path(2, "1d", self.start, "1m").exists())
+
+    def test_bypass_and_invalidate(self, load, resolve):
+        """Non month-aligned intervals skip the cache; invalidate drops one asset."""
+        self.load(interval="1w")
+        self.assertEqual(self.cache.hits + self.cache.misses, 0)
+
+        self.load()
+        self.cache.invalidate([1])
+        self.assertFalse(self.cache.path(1, "1d", self.start, "1m").exists())
+        self.assertTrue(self.cache.path(2, "1d", self.start, "1m").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
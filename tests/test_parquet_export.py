@@ -0,0 +1,148 @@
+"""
+Unit Tests for the Parquet Data-Lake Export.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.database.parquet_export import (
+    EXPORT_SPECS,
+    ExportState,
+    export_table,
+    period_start,
+    run_export,
+)
+
+START = datetime(2024, 1, 31, 23, 58, tzinfo=timezone.utc)
+
+
+def quote_rows(asset_id, count, start=START):
+    return [
+        (asset_id, "1m", start + timedelta(minutes=i), 1.0, 2.0, 0.5, 1.5, float(i))
+        for i in range(count)
+    ]
+
+
+def make_session(rows, batch_rows=None):
+    """Session whose server-side cursor returns `rows` in fetchmany batches."""
+    session = MagicMock()
+    cursor = session.connection.return_value.connection.cursor.return_value
+    batches = []
+
+    def fetchmany(size):
+        step = batch_rows or size
+        batch = rows[len(batches) * step : (len(batches) + 1) * step]
+        batches.append(batch)
+        return batch
+
+    cursor.fetchmany.side_effect = fetchmany
+    return session, cursor
+
+
+class TestParquetExport(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_period_start(self):
+        """Time partitions start at the UTC month/year boundary."""
+        value = datetime(2024, 5, 17, 13, 5, tzinfo=timezone.utc)
+        may = datetime(2024, 5, 1, tzinfo=timezone.utc)
+        self.assertEqual(period_start(value, "month"), may)
+        self.assertEqual(period_start(value, "year"), may.replace(month=1))
+
+    def test_hive_layout_and_row_groups(self):
+        """Rows are split into asset/interval/month partitions + bounded row groups."""
+        rows = quote_rows(1, 5) + quote_rows(2, 1)
+        session, cursor = make_session(rows, batch_rows=2)
+
+        total, partitions, watermarks = export_table(
+            session,
+            EXPORT_SPECS["market_quotes"],
+            self.root,
+            batch_rows=2,
+            row_group_rows=2,
+        )
+
+        self.assertEqual((total, partitions), (6, 3))
+        self.assertEqual(
+            watermarks, {(1, "1m"): START + timedelta(minutes=4), (2, "1m"): START}
+        )
+        self.assertNotIn("WHERE", cursor.execute.call_args[0][0])
+
+        asset = self.root / "market_quotes/asset_id=1/interval=1m"
+        jan = asset / "month=2024-01/part-0.parquet"
+        feb = asset / "month=2024-02/part-0.parquet"
+        self.assertEqual(pq.ParquetFile(jan).metadata.num_rows, 2)
+        self.assertEqual(pq.ParquetFile(feb).metadata.num_row_groups, 2)
+        self.assertEqual(pq.ParquetFile(feb).schema_arrow.names[0], "time")
+
+        dataset = ds.dataset(self.root / "market_quotes", partitioning="hive")
+        table = dataset.to_table()
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(sorted(set(table.column("asset_id").to_pylist())), [1, 2])
+        files = [name for _, _, names in os.walk(self.root) for name in names]
+        self.assertFalse([name for name in files if name.startswith(".")])
+
+    def test_incremental_rewrites_from_watermark_partition(self):
+        """A second run replaces each key's watermark partition, not appending."""
+        session, _ = make_session(quote_rows(1, 5))
+        first = run_export(session, self.root, ["market_quotes"])
+        self.assertEqual(first, {"market_quotes": 5})
+        watermarks = ExportState(self.root).watermarks["market_quotes"]
+        self.assertEqual(watermarks, {(1, "1m"): START + timedelta(minutes=4)})
+
+        # February re-exported in full, plus one new candle; a newly added
+        # asset's history (older than asset 1's watermark) is exported whole.
+        feb = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        old = datetime(2023, 6, 1, tzinfo=timezone.utc)
+        session, cursor = make_session(
+            quote_rows(1, 4, start=feb) + quote_rows(2, 3, start=old)
+        )
+        run_export(session, self.root, ["market_quotes"])
+
+        sql, params = cursor.execute.call_args[0]
+        self.assertIn("LEFT JOIN unnest(", sql)
+        self.assertIn("WHERE w.since IS NULL OR time >= w.since", sql)
+        self.assertEqual((params["key0"], params["key1"]), ([1], ["1m"]))
+        self.assertEqual(params["since"], [feb])
+
+        table = ds.dataset(self.root / "market_quotes", partitioning="hive").to_table()
+        self.assertEqual(table.num_rows, 9)  # 2 Jan + 4 Feb (asset 1), 3 (asset 2)
+        watermarks = ExportState(self.root).watermarks["market_quotes"]
+        self.assertEqual(
+            watermarks,
+            {
+                (1, "1m"): feb + timedelta(minutes=3),
+                (2, "1m"): old + timedelta(minutes=2),
+            },
+        )
+
+    def test_sentiment_and_validation(self):
+        """Nullable list columns export; unknown tables are rejected."""
+        rows = [(3, START, "CryptoPanic", "ETF news", 0.8, 0.9, 0.7, ["ETF"], START)]
+        session, _ = make_session(rows)
+
+        total, _, _ = export_table(session, EXPORT_SPECS["market_sentiment"], self.root)
+
+        self.assertEqual(total, 1)
+        dataset = ds.dataset(self.root / "market_sentiment", partitioning="hive")
+        table = dataset.to_table()
+        self.assertEqual(table.column("topics").to_pylist(), [["ETF"]])
+        with self.assertRaises(ValueError):
+            run_export(session, self.root, ["assets"])
+
+
+if __name__ == "__main__":
+    unittest.main()
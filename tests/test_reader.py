@@ -0,0 +1,184 @@
+"""
+Unit Tests for the OHLCV Read API.
+"""
+
+import struct
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+
+from src.database.reader import (
+    choose_source,
+    decode_binary_copy,
+    load_ohlcv,
+    load_ohlcv_arrow,
+    read_ohlcv,
+)
+
+PG_EPOCH = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_binary_copy(rows):
+    """Encode (asset_id, time, o, h, l, c, v) tuples like COPY ... (FORMAT binary)."""
+    out = bytearray(b"PGCOPY\n\xff\r\n\x00" + struct.pack(">ii", 0, 0))
+    for asset_id, time, *values in rows:
+        micros = (time - PG_EPOCH) // timedelta(microseconds=1)
+        out += struct.pack(">hiiiq", 7, 4, asset_id, 8, micros)
+        for value in values:
+            out += struct.pack(">id", 8, value)
+    return bytes(out + struct.pack(">h", -1))
+
+
+class TestReader(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(2024, 1, 8, tzinfo=timezone.utc)
+
+    def test_choose_coarsest_source(self):
+        """Each interval is served by the coarsest aggregate that divides it."""
+        self.assertEqual(choose_source("1d"), ("market_quotes_1d", False))
+        self.assertEqual(choose_source("1w"), ("market_quotes_1d", True))
+        self.assertEqual(choose_source("1h"), ("market_quotes_1h", False))
+        self.assertEqual(choose_source("4h"), ("market_quotes_1h", True))
+        self.assertEqual(choose_source("36h"), ("market_quotes_1h", True))
+        self.assertEqual(choose_source("15m"), ("market_quotes", True))
+        self.assertEqual(choose_source("90m"), ("market_quotes", True))
+        with self.assertRaises(ValueError):
+            choose_source("1mo")
+
+    def test_choose_source_other_base_interval(self):
+        """Data ingested at other resolutions is read from the raw table only."""
+        self.assertEqual(choose_source("1d", base_interval="1d"), ("market_quotes", False))
+        self.assertEqual(choose_source("1w", base_interval="1d"), ("market_quotes", True))
+        self.assertEqual(choose_source("1m"), ("market_quotes", False))
+        with self.assertRaises(ValueError):
+            choose_source("1h", base_interval="1d")
+
+    def test_bucketed_read_single_query(self):
+        """Several assets are read in one query, re-bucketed from the hourly aggregate."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            (1, self.start, 1.0, 2.0, 0.5, 1.5, 10.0),
+            (2, self.start, 3.0, 4.0, 2.5, 3.5, 20.0),
+        ]
+
+        df = read_ohlcv(session, [1, 2], "4h", self.start, self.end)
+
+        session.execute.assert_called_once()
+        query, params = session.execute.call_args[0]
+        self.assertIn("FROM market_quotes_1h", str(query))
+        self.assertIn("time_bucket(:bucket, time)", str(query))
+        self.assertEqual(params["bucket"], timedelta(hours=4))
+        self.assertEqual(params["asset_ids"], [1, 2])
+        self.assertEqual(list(df["asset_id"]), [1, 2])
+        self.assertEqual(str(df["time"].dt.tz), "UTC")
+
+    def test_direct_read_and_validation(self):
+        """Exact aggregate matches are read without re-bucketing; bad input is rejected."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+
+        df = read_ohlcv(session, [1], "1d", self.start, self.end)
+
+        query, params = session.execute.call_args[0]
+        self.assertNotIn("time_bucket", str(query))
+        self.assertNotIn("bucket", params)
+        self.assertTrue(df.empty)
+
+        read_ohlcv(session, [1], "1d", self.start, self.end, base_interval="1d")
+        query, params = session.execute.call_args[0]
+        self.assertIn('"interval" = :base_interval', str(query))
+        self.assertEqual(params["base_interval"], "1d")
+
+        with self.assertRaises(ValueError):
+            read_ohlcv(session, [], "1d", self.start, self.end)
+        with self.assertRaises(ValueError):
+            read_ohlcv(session, [1], "1d", self.end, self.start)
+
+
+
+class TestBinaryCopyReader(unittest.TestCase):
+
+    def setUp(self):
+        self.start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.rows = [
+            (1, self.start, 1.0, 2.0, 0.5, 1.5, 10.0),
+            (1, self.start + timedelta(hours=1), 1.5, 2.5, 1.0, 2.0, 11.0),
+            (2, self.start, 3.0, 4.0, 2.5, 3.5, 20.0),
+        ]
+
+    def make_session(self, payload):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [
+            (1, "BTC/USDT"),
+            (2, "ETH/USDT"),
+        ]
+        raw_connection = session.connection.return_value.connection
+        cursor = raw_connection.cursor.return_value
+        cursor.mogrify.side_effect = lambda sql, params: sql.encode()
+        cursor.copy_expert.side_effect = lambda sql, buffer: buffer.write(payload)
+        return session, cursor
+
+    def test_decode_binary_copy(self):
+        """Binary COPY tuples decode into native NumPy columns."""
+        columns = decode_binary_copy(memoryview(encode_binary_copy(self.rows)))
+
+        self.assertEqual(columns["asset_id"].tolist(), [1, 1, 2])
+        self.assertEqual(columns["close"].tolist(), [1.5, 2.0, 3.5])
+        self.assertTrue(columns["close"].dtype.isnative)
+        self.assertEqual(str(columns["time"][1]), "2024-01-01T01:00:00.000000")
+
+        empty = decode_binary_copy(memoryview(encode_binary_copy([])))
+        self.assertEqual(len(empty["time"]), 0)
+        truncated = encode_binary_copy(self.rows)[:-5] + b"\xff\xff"
+        with self.assertRaises(RuntimeError):
+            decode_binary_copy(memoryview(truncated))
+
+    def test_load_ohlcv_single_copy(self):
+        """Symbols are resolved once and all assets stream through one COPY."""
+        session, cursor = self.make_session(encode_binary_copy(self.rows))
+
+        symbols = ["BTC/USDT", "ETH/USDT"]
+        df = load_ohlcv(symbols, self.start, self.end, "1h", session=session)
+
+        cursor.copy_expert.assert_called_once()
+        sql = cursor.copy_expert.call_args[0][0]
+        self.assertTrue(sql.startswith("COPY ("))
+        self.assertIn("FORMAT binary", sql)
+        self.assertIn("FROM market_quotes_1h", sql)
+        self.assertEqual(cursor.mogrify.call_args[0][1]["asset_ids"], [1, 2])
+        self.assertEqual(list(df["symbol"]), ["BTC/USDT", "BTC/USDT", "ETH/USDT"])
+        self.assertEqual(str(df["time"].dt.tz), "UTC")
+        self.assertEqual(df["time"].iloc[1], self.start + timedelta(hours=1))
+        session.close.assert_not_called()
+
+    def test_load_ohlcv_arrow(self):
+        """The Arrow variant returns a dictionary-encoded symbol and UTC timestamps."""
+        session, _ = self.make_session(encode_binary_copy(self.rows))
+
+        symbols = ["BTC/USDT", "ETH/USDT"]
+        table = load_ohlcv_arrow(symbols, self.start, self.end, "4h", session=session)
+
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.schema.field("time").type, pa.timestamp("us", tz="UTC"))
+        self.assertEqual(table.column("symbol").to_pylist()[-1], "ETH/USDT")
+
+    def test_symbol_resolution_errors(self):
+        """Unknown or ambiguous symbols are rejected before any COPY is issued."""
+        session, cursor = self.make_session(b"")
+        session.execute.return_value.all.return_value = []
+        with self.assertRaises(ValueError):
+            load_ohlcv(["XYZ"], self.start, self.end, "1h", session=session)
+
+        session.execute.return_value.all.return_value = [(1, "AAA"), (2, "AAA")]
+        with self.assertRaises(ValueError):
+            load_ohlcv(["AAA"], self.start, self.end, "1d", session=session)
+        cursor.copy_expert.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Unit Tests for the OHLCV Resampling Module.
+"""
+
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from src.core.resample import align_start, derive_intervals, resample_ohlcv
+
+
+def minute_candles(start: str, periods: int, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(periods).cumsum()
+    return pd.DataFrame(
+        {
+            "time": pd.date_range(start, periods=periods, freq="1min", tz="UTC"),
+            "open": close + rng.standard_normal(periods),
+            "high": close + 2,
+            "low": close - 2,
+            "close": close,
+            "volume": rng.random(periods),
+        }
+    )
+
+
+class TestResample(unittest.TestCase):
+
+    def test_matches_pandas_resample(self):
+        """first/max/min/last/sum per bucket, identical to pandas for aligned input."""
+        df = minute_candles("2024-01-01", 3 * 24 * 60)
+
+        for interval, rule in [("5m", "5min"), ("1h", "1h"), ("4h", "4h"), ("1d", "1D")]:
+            result = resample_ohlcv(df, interval, "1m")
+            expected = (
+                df.set_index("time")
+                .resample(rule)
+                .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+                .reset_index()
+            )
+            pd.testing.assert_frame_equal(result, expected, check_freq=False, check_dtype=False)
+
+    def test_partial_head_dropped_and_tail_kept(self):
+        """A bucket missing its opening candles is dropped; the forming last bucket is kept."""
+        df = minute_candles("2024-01-01 00:30", 100)  # 00:30 .. 02:09
+
+        result = resample_ohlcv(df, "1h", "1m")
+
+        self.assertEqual(
+            list(result["time"]),
+            list(pd.to_datetime(["2024-01-01 01:00", "2024-01-01 02:00"], utc=True)),
+        )
+        self.assertEqual(result["volume"].iloc[-1], df["volume"].iloc[-10:].sum())
+
+    def test_unsorted_input_and_weekly_alignment(self):
+        """Input order does not matter; weekly buckets open on Monday 00:00 UTC."""
+        df = minute_candles("2024-01-01", 8 * 24 * 60).sample(frac=1.0, random_state=1)
+
+        weekly = resample_ohlcv(df, "1w", "1m")
+
+        self.assertEqual(weekly["time"].iloc[0], pd.Timestamp("2024-01-01", tz="UTC"))
+        self.assertEqual(weekly["time"].iloc[0].day_name(), "Monday")
+        self.assertAlmostEqual(weekly["volume"].sum(), df["volume"].sum())
+
+    def test_invalid_intervals(self):
+        """Intervals that are not whole multiples, or have no fixed alignment, are rejected."""
+        df = minute_candles("2024-01-01", 10)
+        for interval, base in [("90s", "1m"), ("7m", "1m"), ("1mo", "1m"), ("1m", "1h")]:
+            with self.assertRaises(ValueError):
+                resample_ohlcv(df, interval, base)
+
+    def test_derive_intervals_and_align_start(self):
+        """Builds each interval once and aligns fetch starts to every bucket grid."""
+        df = minute_candles("2024-01-01", 120)
+
+        frames = derive_intervals(df, "1m", ["1m", "15m", "1h"])
+        self.assertEqual(sorted(frames), ["15m", "1h"])
+        self.assertEqual(len(frames["15m"]), 8)
+
+        start = datetime(2024, 1, 3, 13, 7, tzinfo=timezone.utc)
+        self.assertEqual(align_start(start, ["45m", "1h"]), datetime(2024, 1, 3, 12, 0, tzinfo=timezone.utc))
+        self.assertEqual(align_start(start, []), start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit Tests for the Sentiment Result Cache.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.ai_analysis.llm_client import OllamaClient
+from src.ai_analysis.sentiment_cache import SentimentCache, cache_key, normalize_text
+from src.ai_analysis.sentiment_engine import SentimentAnalyzer
+
+SCORES = {"sentiment_score": 0.6, "impact_score": 0.7, "confidence": 0.8}
+
+
+class TestSentimentCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sentiment.sqlite")
+        self.cache = SentimentCache(path=self.path, max_memory_entries=2)
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_key_normalization_and_invalidation(self):
+        """Case/whitespace variants share a key; model or prompt changes do not."""
+        self.assertEqual(normalize_text("  Fed  Cuts\tRATES "), "fed cuts rates")
+        key = cache_key("Fed cuts rates", "qwen2.5:3b", "v1")
+        self.assertEqual(key, cache_key("FED  cuts rates ", "qwen2.5:3b", "v1"))
+        self.assertNotEqual(key, cache_key("Fed cuts rates", "phi3.5", "v1"))
+        self.assertNotEqual(key, cache_key("Fed cuts rates", "qwen2.5:3b", "v2"))
+
+    def test_memory_lru_in_front_of_sqlite(self):
+        """Evicted memory entries are served from SQLite, also by new instances."""
+        for name in ("a", "b", "c"):
+            self.cache.put(name, (0.1, 0.2, 0.3))
+
+        self.assertEqual(self.cache.get("c"), (0.1, 0.2, 0.3))  # memory
+        self.assertEqual(self.cache.get("a"), (0.1, 0.2, 0.3))  # evicted -> disk
+        self.assertIsNone(self.cache.get("zzz"))
+        stats = self.cache.stats()
+        self.assertEqual((stats["memory_hits"], stats["disk_hits"]), (1, 1))
+        self.assertEqual(stats["misses"], 1)
+        self.assertAlmostEqual(self.cache.hit_rate, 2 / 3)
+
+        other = SentimentCache(path=self.path)
+        self.assertEqual(len(other.get_many(["a", "b", "c", "d"])), 3)
+        other.close()
+
+    def test_analyzer_skips_llm_on_hit(self):
+        """A cached headline (in any spelling) is not sent to the LLM again."""
+        client = MagicMock(spec=OllamaClient)
+        client.model = "qwen2.5:3b"
+        client.generate.return_value = SCORES
+        analyzer = SentimentAnalyzer(client=client, cache=self.cache)
+
+        first = analyzer.analyze("Bitcoin ETF approved")
+        second = analyzer.analyze("  bitcoin ETF  approved")
+
+        client.generate.assert_called_once()
+        self.assertEqual(second, first)
+
+    def test_batch_dedupes_and_uses_cache(self):
+        """Batches skip cached texts and score duplicate texts once."""
+        client = MagicMock(spec=OllamaClient)
+        client.model = "qwen2.5:3b"
+        analyzer = SentimentAnalyzer(client=client, cache=self.cache)
+        client.generate.return_value = SCORES
+        analyzer.analyze("Old news")
+
+        client.generate.reset_mock()
+        client.generate.return_value = {
+            "results": [dict(SCORES, id=1), dict(SCORES, id=2, sentiment_score=-0.4)]
+        }
+        results = analyzer.analyze_batch(
+            ["Old news", "Rates up", "RATES UP", "Exchange hacked"]
+        )
+
+        client.generate.assert_called_once()
+        prompt = client.generate.call_args.kwargs["prompt"]
+        self.assertNotIn("Old news", prompt)
+        self.assertEqual(results[1], results[2])
+        self.assertEqual(results[3].sentiment_score, -0.4)
+
+        client.generate.reset_mock()
+        analyzer.analyze_batch(["Rates up", "Exchange hacked"])
+        client.generate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -83,5 +83,82 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertEqual(result.impact_score, 0.0)
         self.assertEqual(result.confidence, 1.0)
 
+    def test_analyze_batch_single_request(self):
+        """Several headlines are scored in one request, matched back by id."""
+        self.mock_client.generate.return_value = {
+            "results": [
+                {
+                    "id": 2,
+                    "sentiment_score": -0.5,
+                    "impact_score": 0.4,
+                    "confidence": 1,
+                },
+                {"id": 1, "sentiment_score": 0.7, "impact_score": 1.5, "confidence": 1},
+            ]
+        }
+
+        results = self.analyzer.analyze_batch(["ETF approved", "", "Exchange hacked"])
+
+        self.mock_client.generate.assert_called_once()
+        prompt = self.mock_client.generate.call_args.kwargs["prompt"]
+        self.assertIn('1. "ETF approved"', prompt)
+        self.assertIn('2. "Exchange hacked"', prompt)
+        self.assertEqual(results[0].sentiment_score, 0.7)
+        self.assertEqual(results[0].impact_score, 1.0)  # clamped
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2].sentiment_score, -0.5)
+
+    def test_analyze_batch_fallback_for_dropped_items(self):
+        """Entries the model drops are re-scored with single-item calls."""
+        single = {"sentiment_score": 0.1, "impact_score": 0.2, "confidence": 0.3}
+        self.mock_client.generate.side_effect = [
+            [{"id": 1, "sentiment_score": 0.9, "impact_score": 0.9, "confidence": 0.9}],
+            single,
+        ]
+
+        results = self.analyzer.analyze_batch(["Rates cut", "Earnings beat"])
+
+        self.assertEqual(self.mock_client.generate.call_count, 2)
+        fallback_prompt = self.mock_client.generate.call_args.kwargs["prompt"]
+        self.assertIn('"Earnings beat"', fallback_prompt)
+        self.assertEqual(results[0].sentiment_score, 0.9)
+        self.assertEqual(results[1].sentiment_score, 0.1)
+
+    def test_analyze_batch_chunks_and_validation(self):
+        """Texts are split into batch_size chunks; an invalid size is rejected."""
+        self.mock_client.generate.return_value = None
+
+        results = self.analyzer.analyze_batch(["a", "b", "c"], batch_size=2)
+
+        # 1 failed batch (a, b; not retried singly) + 1 single call (c)
+        self.assertEqual(self.mock_client.generate.call_count, 2)
+        self.assertEqual(results, [None, None, None])
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze_batch(["a"], batch_size=0)
+
+    def test_analyze_batch_failed_request_not_retried_singly(self):
+        """A failed batch request yields None for the chunk, not N single calls."""
+        self.mock_client.generate.return_value = None
+
+        results = self.analyzer.analyze_batch([f"news {i}" for i in range(40)])
+
+        self.assertEqual(self.mock_client.generate.call_count, 2)
+        self.assertEqual(results, [None] * 40)
+
+    def test_entries_without_scores_are_rejected(self):
+        """Entries lacking score keys are dropped, never scored as neutral."""
+        single = {"sentiment_score": 0.1, "impact_score": 0.2, "confidence": 0.3}
+        self.mock_client.generate.side_effect = [
+            {"results": [{"id": 1}, dict(single, id=2)]},
+            {"results": [dict(single, id=1)]},  # wrapper answer to a single prompt
+        ]
+
+        results = self.analyzer.analyze_batch(["Rates cut", "Earnings beat"])
+
+        self.assertEqual(self.mock_client.generate.call_count, 2)
+        self.assertIsNone(results[0])
+        self.assertEqual(results[1].sentiment_score, 0.1)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
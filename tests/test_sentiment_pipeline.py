@@ -0,0 +1,161 @@
+"""
+Unit Tests for the News-to-Sentiment Pipeline.
+
+Fetchers, analyzer and writer are mocked; the stages and queues are real.
+"""
+
+import threading
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from src.ai_analysis.sentiment_engine import SentimentAnalyzer, SentimentResult
+from src.ai_analysis.sentiment_pipeline import NewsJob, SentimentPipeline
+from src.data_ingestion.news.base_news import BaseNewsFetcher, NewsArticle
+
+
+def article(title, minute=0, source="CryptoPanic-CoinDesk"):
+    return NewsArticle(
+        title=title,
+        url="https://example.com",
+        source=source,
+        published_at=datetime(2024, 1, 1, 12, minute),  # naive -> UTC
+    )
+
+
+def fake_fetcher(articles_by_query):
+    fetcher = MagicMock(spec=BaseNewsFetcher)
+    fetcher.fetch_news.side_effect = lambda query, limit: articles_by_query[query]
+    return fetcher
+
+
+def fake_analyzer():
+    analyzer = MagicMock(spec=SentimentAnalyzer)
+    analyzer.analyze_batch.side_effect = lambda texts: [
+        None if "unscorable" in text else SentimentResult(0.5, 0.6, 0.7)
+        for text in texts
+    ]
+    return analyzer
+
+
+class TestSentimentPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.written = []
+
+    def write(self, rows):
+        self.written.append(rows)
+        return len(rows)
+
+    def test_fetch_dedupe_score_write(self):
+        """Duplicates are dropped, batches are scored and written one call each."""
+        cryptopanic = fake_fetcher(
+            {
+                "BTC/USDT": [
+                    article("ETF approved", 0),
+                    article("Hashrate record", 1),
+                    article("unscorable text", 2),
+                ],
+                "ETH/USDT": [article("ETF approved", 0)],  # other asset: kept
+            }
+        )
+        google = fake_fetcher(
+            {
+                "Bitcoin": [
+                    article("  etf  APPROVED ", 5, "GoogleNews-Reuters"),  # syndicated
+                    article("Miners sell", 1, "CryptoPanic-CoinDesk"),  # same key
+                    article("Fed holds rates", 7, "GoogleNews-" + "X" * 60),
+                ]
+            }
+        )
+        pipeline = SentimentPipeline(
+            {"CRYPTOPANIC": cryptopanic, "google_news": google},
+            fake_analyzer(),
+            self.write,
+            batch_size=2,
+        )
+        jobs = [
+            NewsJob(1, "CRYPTOPANIC", "BTC/USDT"),
+            NewsJob(2, "CRYPTOPANIC", "ETH/USDT"),
+            NewsJob(1, "GOOGLE_NEWS", "Bitcoin"),
+        ]
+
+        stats = pipeline.run(jobs)
+
+        rows = [row for batch in self.written for row in batch]
+        self.assertEqual(stats.fetched, 7)
+        self.assertEqual(stats.duplicates, 2)
+        self.assertEqual((stats.scored, stats.unscored), (4, 1))
+        self.assertEqual((stats.written, stats.batches), (4, len(self.written)))
+        self.assertTrue(all(len(batch) <= 2 for batch in self.written))
+        self.assertEqual(
+            sorted((row["asset_id"], row["headline"]) for row in rows),
+            [
+                (1, "ETF approved"),
+                (1, "Fed holds rates"),
+                (1, "Hashrate record"),
+                (2, "ETF approved"),
+            ],
+        )
+        self.assertTrue(all(row["time"].tzinfo is timezone.utc for row in rows))
+        self.assertTrue(all(len(row["source"]) <= 50 for row in rows))
+
+    def test_fetching_continues_while_scoring(self):
+        """A slow scoring stage does not hold back the fetch stage."""
+        queries = [f"Q{i}" for i in range(6)]
+        fetched_all = threading.Event()
+        calls = []
+
+        def fetch(query, limit):
+            calls.append(query)
+            if len(calls) == len(queries):
+                fetched_all.set()
+            return [article(f"{query} headline", minute=len(calls))]
+
+        fetcher = MagicMock(spec=BaseNewsFetcher)
+        fetcher.fetch_news.side_effect = fetch
+        analyzer = fake_analyzer()
+        scoring = analyzer.analyze_batch.side_effect
+
+        def slow_score(texts):
+            # Blocks the first batch until every fetch job has run.
+            self.assertTrue(fetched_all.wait(5))
+            return scoring(texts)
+
+        analyzer.analyze_batch.side_effect = slow_score
+        pipeline = SentimentPipeline(
+            {"CRYPTOPANIC": fetcher}, analyzer, self.write, batch_size=1, queue_size=4
+        )
+
+        stats = pipeline.run(NewsJob(1, "CRYPTOPANIC", q) for q in queries)
+
+        self.assertEqual(stats.written, 6)
+
+    def test_failures(self):
+        """Fetch errors are counted; a write error stops the run with RuntimeError."""
+        fetcher = MagicMock(spec=BaseNewsFetcher)
+        fetcher.fetch_news.side_effect = [ConnectionError("down"), [article("a")]]
+
+        def broken_write(rows):
+            raise ValueError("constraint violated")
+
+        pipeline = SentimentPipeline(
+            {"CRYPTOPANIC": fetcher}, fake_analyzer(), broken_write, fetch_workers=1
+        )
+        jobs = [NewsJob(1, "CRYPTOPANIC", "A"), NewsJob(1, "CRYPTOPANIC", "B")]
+
+        with self.assertRaises(RuntimeError):
+            pipeline.run(jobs)
+        with self.assertRaises(ValueError):
+            pipeline.run([NewsJob(1, "NEWSAPI", "A")])
+        with self.assertRaises(ValueError):
+            SentimentPipeline({}, fake_analyzer(), self.write, batch_size=0)
+
+        fetcher.fetch_news.side_effect = [ConnectionError("down"), [article("a")]]
+        pipeline.write = self.write
+        stats = pipeline.run(jobs)
+        self.assertEqual((stats.failed_jobs, stats.written), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit Tests for the Watermarks Module.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from src.database.watermarks import (
+    get_watermarks,
+    incremental_start,
+    incremental_start_dates,
+)
+
+
+class TestWatermarks(unittest.TestCase):
+
+    def setUp(self):
+        self.default_start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        self.latest = datetime(2024, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+    def test_single_grouped_query(self):
+        """All watermarks come from one GROUP BY query."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(1, self.latest)]
+
+        result = get_watermarks(session, [2, 1, 1])
+
+        self.assertEqual(result, {1: self.latest})
+        session.execute.assert_called_once()
+        sql = str(
+            session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        self.assertIn("max(market_quotes.time)", sql)
+        self.assertIn("GROUP BY market_quotes.asset_id", sql)
+
+    def test_interval_filter(self):
+        """Watermarks can be restricted to one stored resolution."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = []
+
+        get_watermarks(session, [1], interval="1h")
+
+        sql = str(
+            session.execute.call_args[0][0].compile(dialect=postgresql.dialect())
+        )
+        self.assertIn('market_quotes."interval" =', sql)
+
+    def test_no_assets_skips_query(self):
+        """An empty ID list never hits the database."""
+        session = MagicMock()
+        self.assertEqual(get_watermarks(session, []), {})
+        session.execute.assert_not_called()
+
+    def test_incremental_start(self):
+        """Watermark minus overlap, or the default start for new assets."""
+        self.assertEqual(incremental_start(None, self.default_start), self.default_start)
+        self.assertEqual(
+            incremental_start(self.latest, self.default_start, timedelta(minutes=2)),
+            self.latest - timedelta(minutes=2),
+        )
+
+    def test_start_dates_per_symbol(self):
+        """Symbols map to their own watermark; new assets use the default start."""
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [(1, self.latest)]
+
+        starts = incremental_start_dates(
+            session, {"BTC/USDT": 1, "ETH/USDT": 2}, self.default_start
+        )
+
+        self.assertEqual(starts, {"BTC/USDT": self.latest, "ETH/USDT": self.default_start})
+
+
+if __name__ == "__main__":
+    unittest.main()
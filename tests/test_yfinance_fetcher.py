@@ -0,0 +1,145 @@
+"""
+Unit Tests for the Yahoo Finance Fetcher.
+
+Verifies normalization and window-based iteration without network access
+by patching `yf.download` with a deterministic fake.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import numpy as np
+import pandas as pd
+
+from src.data_ingestion.rate_limiter import RateLimiter
+from src.data_ingestion.yahoo.yfinance_fetcher import YahooFinanceFetcher
+
+
+def fake_download(tickers, start=None, end=None, interval="1h", **kwargs):
+    """Mimic yf.download: hourly candles in [start, end) with a 'Datetime' index."""
+    index = pd.date_range(start, end, freq="1h", inclusive="left", name="Datetime")
+    values = np.arange(len(index), dtype=float)
+    return pd.DataFrame(
+        {
+            "Open": values,
+            "High": values + 1,
+            "Low": values - 1,
+            "Close": values + 0.5,
+            "Volume": np.full(len(index), 100.0),
+        },
+        index=index,
+    )
+
+
+def fake_download_many(tickers, start=None, end=None, interval="1h", **kwargs):
+    """Mimic a grouped yf.download: (ticker, field) columns on a shared index.
+
+    'MSFT' only trades in the second half of the range; 'DELISTED' is absent.
+    """
+    frames = {t: fake_download(t, start, end, interval) for t in tickers if t != "DELISTED"}
+    if "MSFT" in frames:
+        frames["MSFT"].iloc[: len(frames["MSFT"]) // 2] = np.nan
+    return pd.concat(frames, axis=1, names=["Ticker", "Price"])
+
+
+class TestYahooFinanceFetcher(unittest.TestCase):
+
+    def setUp(self):
+        # Generous budget: these tests exercise windowing, not throttling.
+        self.fetcher = YahooFinanceFetcher(
+            rate_limiter=RateLimiter("TEST", capacity=10_000, refill_per_second=10_000)
+        )
+        # Anchored to the recent past: intraday data is only served for a limited history.
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.start = today - timedelta(days=3)
+        self.end = self.start + timedelta(days=2)
+
+    @patch("src.data_ingestion.yahoo.yfinance_fetcher.yf.download", side_effect=fake_download)
+    def test_fetch_ohlcv_normalizes_schema(self, _download):
+        """Columns are lower-cased, ordered, and time is UTC-aware."""
+        df = self.fetcher.fetch_ohlcv("AAPL", "1h", self.start, self.end)
+
+        self.assertEqual(list(df.columns), ["time", "open", "high", "low", "close", "volume"])
+        self.assertEqual(str(df["time"].dt.tz), "UTC")
+        self.assertEqual(len(df), 48)
+
+    @patch("src.data_ingestion.yahoo.yfinance_fetcher.yf.download", side_effect=fake_download)
+    def test_iter_ohlcv_windows_are_disjoint(self, download):
+        """Windows of ~limit candles cover the range once, in order, without overlap."""
+        pages = list(self.fetcher.iter_ohlcv("AAPL", "1h", self.start, self.end, limit=10))
+
+        self.assertEqual(download.call_count, 5)  # 48h / 10h windows
+        self.assertTrue(all(len(p) <= 10 for p in pages))
+
+        times = pd.concat(pages)["time"]
+        self.assertTrue(times.is_monotonic_increasing)
+        self.assertFalse(times.duplicated().any())
+        self.assertEqual(len(times), 48)
+
+    @patch("src.data_ingestion.yahoo.yfinance_fetcher.yf.download", side_effect=fake_download_many)
+    def test_fetch_ohlcv_many_splits_per_symbol(self, download):
+        """One grouped download is split into normalized per-symbol frames."""
+        frames = self.fetcher.fetch_ohlcv_many(
+            ["AAPL", "MSFT", "DELISTED"], "1h", self.start, self.end
+        )
+
+        download.assert_called_once()
+        self.assertEqual(download.call_args.kwargs["group_by"], "ticker")
+        self.assertEqual(len(frames["AAPL"]), 48)
+        self.assertEqual(len(frames["MSFT"]), 24)  # all-NaN rows dropped
+        self.assertTrue(frames["DELISTED"].empty)
+        self.assertEqual(
+            list(frames["AAPL"].columns), ["time", "open", "high", "low", "close", "volume"]
+        )
+
+    def test_plan_windows_respects_intraday_limits(self):
+        """1m ranges are clipped to 30 days of history and cut into <= 7-day windows."""
+        now = datetime(2024, 6, 30, tzinfo=timezone.utc)
+        windows = YahooFinanceFetcher._plan_windows(
+            "1m", now - timedelta(days=90), now, now=now
+        )
+
+        self.assertGreaterEqual(windows[0][0], now - timedelta(days=30))
+        self.assertEqual(windows[-1][1], now)
+        self.assertEqual(len(windows), 5)
+        for (_, prev_end), (next_start, next_end) in zip(windows, windows[1:]):
+            self.assertEqual(next_start, prev_end)
+            self.assertLessEqual(next_end - next_start, timedelta(days=7))
+
+        daily = YahooFinanceFetcher._plan_windows("1d", now - timedelta(days=900), now, now=now)
+        self.assertEqual(len(daily), 1)
+
+    @patch("src.data_ingestion.yahoo.yfinance_fetcher.yf.download", side_effect=fake_download)
+    def test_fetch_ohlcv_merges_concurrent_windows(self, download):
+        """A 1m range beyond one request span is fetched in windows and merged without duplicates."""
+        end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        start = end - timedelta(days=20)
+
+        df = self.fetcher.fetch_ohlcv("AAPL", "1m", start, end)
+
+        self.assertEqual(download.call_count, 3)
+        self.assertTrue(df["time"].is_monotonic_increasing)
+        self.assertFalse(df["time"].duplicated().any())
+        self.assertEqual(len(df), 20 * 24)  # hourly fake candles, end exclusive
+
+    def test_fetch_fundamental_acquires_rate_limit(self):
+        """The `.info` request draws a token from the shared limiter first."""
+        calls = []
+        limiter = MagicMock()
+        limiter.acquire.side_effect = lambda tokens: calls.append("acquire")
+        fetcher = YahooFinanceFetcher(rate_limiter=limiter)
+
+        with patch("src.data_ingestion.yahoo.yfinance_fetcher.yf.Ticker") as ticker:
+            type(ticker.return_value).info = PropertyMock(
+                side_effect=lambda: calls.append("info") or {"sector": "Technology"}
+            )
+            fundamentals = fetcher.fetch_fundamental("AAPL")
+
+        self.assertEqual(calls, ["acquire", "info"])
+        limiter.acquire.assert_called_once_with(1)
+        self.assertEqual(fundamentals["sector"], "Technology")
+
+
+if __name__ == "__main__":
+    unittest.main()